@@ -0,0 +1,54 @@
+"""Compares rendering figures serially and with 'lpl.map_threaded'.
+
+Run 'python scripts/benchmark_threads.py [n] [workers]' on a regular and on a
+free-threaded build of python, e.g. 'python3.13t', to see how much rendering in
+threads gains on each.
+"""
+
+import io
+import sys
+import time
+from collections.abc import Callable
+
+import matplotlib as mpl
+import numpy as np
+
+import latexplotlib as lpl
+
+
+def render(i: int) -> int:
+    rng = np.random.default_rng(i)
+    fig, axes = lpl.subplots(2, 2)
+    for ax in axes.flat:
+        ax.plot(rng.normal(size=(2_000, 4)).cumsum(axis=0))
+        ax.set_title(f"figure {i}")
+    with io.BytesIO() as fh:
+        fig.savefig(fh, format="png")
+        return len(fh.getvalue())
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(n: int = 32, workers: int = 8) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    sys.stdout.write(f"python {sys.version.split()[0]}, gil enabled: {gil}\n")
+
+    # The figures are rendered without latex, so only matplotlib is measured.
+    with mpl.rc_context({"text.usetex": False}):
+        render(0)
+        serial = timed(lambda: [render(i) for i in range(n)])
+        threaded = timed(
+            lambda: lpl.map_threaded(render, range(n), max_workers=workers)
+        )
+
+    sys.stdout.write(f"serial:   {serial:.2f}s for {n} figures\n")
+    sys.stdout.write(f"threaded: {threaded:.2f}s with {workers} threads\n")
+    sys.stdout.write(f"speedup:  {serial / threaded:.2f}x\n")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Writes 'latexplotlib/_pyplot.py' for the installed matplotlib.
+
+Run 'python scripts/generate_pyplot.py' after upgrading matplotlib.
+"""
+
+import ast
+import inspect
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+import latexplotlib as lpl
+
+PYPLOT = Path(__file__).parents[1] / "src" / "latexplotlib" / "_pyplot.py"
+
+
+def exported_names(body: list[ast.stmt]) -> Iterator[str]:
+    """Yields the names a module defines or explicitly re-exports at runtime."""
+    for node in body:
+        if isinstance(node, ast.FunctionDef | ast.ClassDef):
+            yield node.name
+        elif isinstance(node, ast.Assign | ast.AnnAssign):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            yield from (target.id for target in targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.Import | ast.ImportFrom):
+            yield from (
+                alias.asname
+                for alias in node.names
+                if alias.asname == alias.name.rpartition(".")[2]
+            )
+        elif isinstance(node, ast.If) and ast.unparse(node.test) != "TYPE_CHECKING":
+            yield from exported_names(node.body)
+            yield from exported_names(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from exported_names(node.body)
+
+
+def isort_key(name: str, *, case_sensitive: bool = False) -> tuple[int, str]:
+    # ruff sorts imports case-insensitively, but '__all__' case-sensitively.
+    group = 0 if name.isupper() else 1 if name[0].isupper() else 2
+    return (group, name if case_sensitive else name.lower())
+
+
+def pyplot_facade() -> str:
+    """Returns the source of 'latexplotlib._pyplot' for the installed matplotlib."""
+    names = []
+    for name in set(exported_names(ast.parse(inspect.getsource(plt)).body)):
+        value = getattr(plt, name, None)
+        module = (
+            value.__name__
+            if isinstance(value, types.ModuleType)
+            else getattr(value, "__module__", None)
+        )
+        if (
+            not name.startswith("_")
+            and (module or "").startswith("matplotlib")
+            and name not in lpl.__all__
+        ):
+            names.append(name)
+    imports = "".join(f"    {name},\n" for name in sorted(names, key=isort_key))
+    exports = "".join(
+        f'    "{name}",\n'
+        for name in sorted(names, key=lambda name: isort_key(name, case_sensitive=True))
+    )
+    return (
+        f'"""The pyplot names available as \'lpl.<name>\', for type checkers.\n\n'
+        f"Generated by 'python scripts/generate_pyplot.py'.\n"
+        f'"""\n\n'
+        f"from matplotlib.pyplot import (\n{imports})\n\n"
+        f"__all__ = [\n{exports}]\n"
+    )
+
+
+if __name__ == "__main__":
+    PYPLOT.write_text(pyplot_facade())
@@ -1,31 +1,103 @@
-from typing import Any
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # The names that '__getattr__' resolves, for type checkers and editors.
+    from ._async import Saver, asave, saver
+    from ._pyplot import *  # noqa: F403
 
 from ._cleanup import purge_old_styles
 from ._config import size
+from ._envelope import envelope, plot_envelope
+from ._figures import FigureMemory, autoclose, figure_memory, figures
+from ._frames import export_frames
 from ._latexplotlib import (
     convert_inches_to_pt,
+    convert_lengths,
     convert_pt_to_inches,
     figsize,
     subplots,
 )
-from ._styles import make_styles_available
+from ._layout import Layout, autofit
+from ._layoutcache import LayoutCache, layout_cache
+from ._lazy import LazyAxes
+from ._multiples import small_multiples
+from ._notebook import (
+    Preview,
+    load_ipython_extension,
+    preview,
+    unload_ipython_extension,
+)
+from ._panels import save_panels
+from ._reproducible import save_reproducible
+from ._state import Snapshot, restore, snapshot
+from ._styles import draft, make_styles_available
+from ._texbatch import TexBatch, tex_batch
+from ._texcache import CacheInfo, TexCache, tex_cache
+from ._texformat import TexFormats, tex_formats
+from ._threads import map_threaded
 from ._version import __version__
 
 __all__ = [
+    "CacheInfo",
+    "FigureMemory",
+    "Layout",
+    "LayoutCache",
+    "LazyAxes",
+    "Preview",
+    "Saver",
+    "Snapshot",
+    "TexBatch",
+    "TexCache",
+    "TexFormats",
     "__version__",
+    "asave",
+    "autoclose",
+    "autofit",
     "convert_inches_to_pt",
+    "convert_lengths",
     "convert_pt_to_inches",
+    "draft",
+    "envelope",
+    "export_frames",
     "figsize",
+    "figure_memory",
+    "figures",
+    "layout_cache",
+    "load_ipython_extension",
+    "map_threaded",
+    "plot_envelope",
+    "preview",
+    "restore",
+    "save_panels",
+    "save_reproducible",
+    "saver",
     "size",
+    "small_multiples",
+    "snapshot",
     "subplots",
+    "tex_batch",
+    "tex_cache",
+    "tex_formats",
+    "unload_ipython_extension",
 ]
 
 
+# Imported on first use, as asyncio is only needed by asyncio code.
+_LAZY = {"Saver": "._async", "asave": "._async", "saver": "._async"}
+
+
 def __getattr__(name: str) -> Any:  # noqa: ANN401
-    import matplotlib.pyplot as plt  # noqa: PLC0415
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    else:
+        import matplotlib.pyplot as plt  # noqa: PLC0415
 
-    return getattr(plt, name)
+        value = getattr(plt, name)
+    # Later lookups find the attribute in the module and skip '__getattr__'.
+    globals()[name] = value
+    return value
 
 
-purge_old_styles(__path__)
-make_styles_available(__path__)
+purge_old_styles(__path__)  # noqa: F405
+make_styles_available(__path__)  # noqa: F405
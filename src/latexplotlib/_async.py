@@ -0,0 +1,163 @@
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+else:
+    Figure = Any
+
+__all__ = [
+    "Saver",
+    "asave",
+    "saver",
+]
+
+_LATENCY_WINDOW = 100
+
+
+def _savefig_kwargs() -> dict[str, Any]:
+    # Figures are rendered in another thread at a later time, so the savefig
+    # defaults of the active style are resolved when the save is requested. Other
+    # rcParams are not captured, see 'Saver.save'.
+    bbox = mpl.rcParams["savefig.bbox"]
+    return {
+        "dpi": mpl.rcParams["savefig.dpi"],
+        "bbox_inches": None if bbox == "standard" else bbox,
+        "pad_inches": mpl.rcParams["savefig.pad_inches"],
+        "facecolor": mpl.rcParams["savefig.facecolor"],
+        "edgecolor": mpl.rcParams["savefig.edgecolor"],
+        "transparent": mpl.rcParams["savefig.transparent"],
+    }
+
+
+def _targets(
+    fname: str | os.PathLike[str], formats: Sequence[str] | None
+) -> list[tuple[Path, str]]:
+    path = Path(fname)
+
+    if formats is None:
+        fmt = path.suffix[1:] or mpl.rcParams["savefig.format"]
+        return [(path.with_suffix(f".{fmt}"), fmt)]
+
+    return [(path.with_suffix(f".{fmt}"), fmt) for fmt in formats]
+
+
+def _save(
+    fig: Figure, targets: list[tuple[Path, str]], kwargs: dict[str, Any]
+) -> list[Path]:
+    for path, fmt in targets:
+        fig.savefig(path, format=fmt, **kwargs)
+    return [path for path, _ in targets]
+
+
+class Saver:
+    """Saves figures in a thread pool without blocking the asyncio event loop.
+
+    Parameters
+    ----------
+    max_workers : int, default: 4
+        The maximum number of figures that are rendered at the same time. Further
+        requests wait in a queue.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="latexplotlib"
+        )
+        self._queue_depth = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requested saves that are waiting or running."""
+        return self._queue_depth
+
+    @property
+    def latency(self) -> float:
+        """The mean time in seconds of the last 100 saves, including waiting time."""
+        if not self._latencies:
+            return 0.0
+        return sum(self._latencies) / len(self._latencies)
+
+    def save(
+        self,
+        fig: Figure,
+        fname: str | os.PathLike[str],
+        *,
+        formats: Sequence[str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> "asyncio.Future[list[Path]]":
+        """Saves a figure without blocking the event loop.
+
+        Only the savefig defaults (dpi, bbox, padding, colors and format) are
+        taken from the style that is active when this method is called. All other
+        rcParams that matplotlib reads while rendering, e.g. 'text.latex.preamble',
+        'pdf.fonttype' or 'path.simplify', are read in the pool when the figure is
+        saved, so they must not change until the save is done. Cancelling a save
+        that has not started yet removes it from the queue; a running save always
+        completes.
+
+        Parameters
+        ----------
+        fig : `.Figure`
+            The figure to save.
+        fname : str or path-like
+            The file name. The suffix is replaced if 'formats' is given.
+        formats : sequence of str, optional
+            Save the figure once for every format, e.g. ('pdf', 'png').
+        **kwargs
+            All additional keyword arguments are passed to `.Figure.savefig`.
+
+        Returns
+        -------
+        asyncio.Future of list of Path
+            Resolves to the saved files.
+        """
+        job = partial(
+            _save, fig, _targets(fname, formats), {**_savefig_kwargs(), **kwargs}
+        )
+
+        self._queue_depth += 1
+        future = asyncio.get_running_loop().run_in_executor(self._executor, job)
+        future.add_done_callback(partial(self._done, time.perf_counter()))
+
+        return future
+
+    def _done(self, start: float, future: "asyncio.Future[list[Path]]") -> None:
+        self._queue_depth -= 1
+        if not future.cancelled():
+            self._latencies.append(time.perf_counter() - start)
+
+    def shutdown(self) -> None:
+        """Waits for all running saves and frees the threads of the pool."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+saver = Saver()
+
+
+def asave(
+    fig: Figure,
+    fname: str | os.PathLike[str],
+    *,
+    formats: Sequence[str] | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> "asyncio.Future[list[Path]]":
+    """Saves a figure in the background without blocking the event loop.
+
+    This is a shortcut for 'lpl.saver.save', see `.Saver.save`. Use 'lpl.saver' to
+    inspect the queue depth and latency.
+
+        paths = await lpl.asave(fig, "figure", formats=("pdf", "png"))
+    """
+    return saver.save(fig, fname, formats=formats, **kwargs)
@@ -0,0 +1,124 @@
+import json
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from ._runner import Result, run_script
+from ._state import restore, snapshot
+
+MANIFEST: str = ".latexplotlib.json"
+
+
+def discover(directory: Path) -> list[Path]:
+    """Returns all figure scripts in a directory, i.e. all public python files."""
+    return sorted(
+        path for path in directory.glob("*.py") if not path.name.startswith("_")
+    )
+
+
+def _load_manifest(directory: Path) -> dict[str, Any]:
+    try:
+        with (directory / MANIFEST).open(encoding="utf-8") as fh:
+            manifest: dict[str, Any] = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return manifest
+
+
+def _write_manifest(directory: Path, manifest: dict[str, Any]) -> None:
+    with (directory / MANIFEST).open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=4)
+
+
+def _is_up_to_date(
+    script: Path, entry: dict[str, Any] | None, profile: dict[str, Any]
+) -> bool:
+    if entry is None or entry["profile"] != profile:
+        return False
+
+    # Scripts that save no files, e.g. helper modules, are up to date until they
+    # change.
+    if not entry["outputs"]:
+        return bool(entry.get("mtime") == script.stat().st_mtime_ns)
+
+    outputs = [Path(output) for output in entry["outputs"]]
+    if not all(output.exists() for output in outputs):
+        return False
+
+    return min(o.stat().st_mtime for o in outputs) >= script.stat().st_mtime
+
+
+def _run(scripts: Sequence[Path], directory: Path, jobs: int) -> Iterator[Result]:
+    run = partial(run_script, cwd=directory)
+
+    if jobs == 1:
+        yield from map(run, scripts)
+        return
+
+    with ProcessPoolExecutor(jobs, initializer=restore, initargs=(snapshot(),)) as pool:
+        yield from pool.map(run, scripts)
+
+
+def render(
+    directory: Path, profile: dict[str, Any], *, jobs: int = 1, force: bool = False
+) -> list[tuple[Result, bool]]:
+    """Runs all figure scripts in a directory that are not up to date.
+
+    A script is up to date if all files it saved in its last run exist, are newer
+    than the script, and were created with the same profile. The outputs of every
+    run are stored in the file 'MANIFEST' in the directory. Scripts that save no
+    files, e.g. modules imported by the figure scripts, only run again when they
+    change and are left out of the results unless they fail.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory containing the figure scripts. Scripts run in this directory.
+    profile : dict
+        A description of the active style and size. Changing the profile rebuilds
+        all figures.
+    jobs : int, default: 1
+        The number of worker processes.
+    force : bool, default: False
+        Rebuild all figures, even if they are up to date.
+
+    Returns
+    -------
+    list of (Result, bool)
+        The result of every script and whether it was skipped.
+    """
+    # 'run_script' finds scripts relative to the directory they run in.
+    directory = directory.resolve()
+    manifest = _load_manifest(directory)
+    scripts = discover(directory)
+
+    outdated = [
+        script
+        for script in scripts
+        if force or not _is_up_to_date(script, manifest.get(script.name), profile)
+    ]
+    results = {Path(r.script).name: r for r in _run(outdated, directory, jobs)}
+
+    for name, result in results.items():
+        if result.error is None:
+            manifest[name] = {
+                "profile": profile,
+                "outputs": result.outputs,
+                "mtime": Path(result.script).stat().st_mtime_ns,
+            }
+        else:
+            manifest.pop(name, None)
+    _write_manifest(directory, manifest)
+
+    # Failed scripts are not in the manifest.
+    figures = [
+        s for s in scripts if s.name not in manifest or manifest[s.name]["outputs"]
+    ]
+    return [
+        (results[s.name], False)
+        if s.name in results
+        else (Result(str(s), manifest[s.name]["outputs"], 0.0), True)
+        for s in figures
+    ]
@@ -0,0 +1,115 @@
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+from latexplotlib_client import add_build_arguments, report
+
+from ._batch import render
+from ._config import size
+from ._runner import Result
+from ._server import build, serve, stop
+
+
+def _report(result: Result) -> int:
+    return report(result._asdict())
+
+
+def _table(results: list[tuple[Result, bool]]) -> int:
+    rows = [
+        (
+            Path(result.script).name,
+            "skipped" if skipped else "failed" if result.error else "built",
+            "-" if skipped else f"{1000 * result.seconds:.0f}ms",
+        )
+        for result, skipped in results
+    ]
+    rows.append(("total", "", f"{1000 * sum(r.seconds for r, _ in results):.0f}ms"))
+
+    width = max(len(name) for name, _, _ in rows)
+    for name, status, seconds in rows:
+        sys.stdout.write(f"{name:<{width}}  {status:<7}  {seconds:>8}\n")
+
+    failed = [result for result, _ in results if result.error is not None]
+    for result in failed:
+        sys.stderr.write(f"{result.script}:\n{result.error}")
+
+    return 1 if failed else 0
+
+
+def _render(args: argparse.Namespace) -> int:
+    if args.style:
+        plt.style.use(args.style)
+    if args.size:
+        size.set(*args.size, persist=False)
+
+    profile = {"style": args.style, "size": list(size.get())}
+
+    return _table(render(args.directory, profile, jobs=args.jobs, force=args.force))
+
+
+def _jobs(value: str) -> int:
+    jobs = int(value)
+    if jobs < 1:
+        msg = "must be at least 1"
+        raise argparse.ArgumentTypeError(msg)
+    return jobs
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="latexplotlib", description="Perfect matplotlib figures for latex"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser(
+        "serve", help="keep matplotlib loaded and run figure scripts on request"
+    )
+    serve_parser.add_argument("--port", type=int, default=0)
+
+    build_parser = commands.add_parser(
+        "build", help="run a figure script in the running server"
+    )
+    add_build_arguments(build_parser)
+
+    commands.add_parser("stop", help="stop the running server")
+
+    render_parser = commands.add_parser(
+        "render", help="run all outdated figure scripts in a directory"
+    )
+    render_parser.add_argument("directory", type=Path, nargs="?", default=Path())
+    render_parser.add_argument(
+        "-s", "--style", nargs="+", help="the styles used for all figures"
+    )
+    render_parser.add_argument(
+        "--size",
+        nargs=2,
+        type=float,
+        metavar=("WIDTH", "HEIGHT"),
+        help="the size of the latex page in pt",
+    )
+    render_parser.add_argument(
+        "-j", "--jobs", type=_jobs, default=1, help="number of parallel processes"
+    )
+    render_parser.add_argument(
+        "-f", "--force", action="store_true", help="rebuild up-to-date figures"
+    )
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.port)
+    elif args.command == "build":
+        return _report(build(args.script, args.args))
+    elif args.command == "render":
+        return _render(args)
+    else:
+        stop()
+
+    return 0
@@ -1,4 +1,8 @@
+import contextlib
 import json
+import threading
+import time
+import uuid
 from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from pathlib import Path
@@ -16,16 +20,29 @@ CONFIGFILE: str = "config.ini"
 CONFIGDIR: Path = Path(user_config_dir(NAME))
 CONFIGPATH: Path = CONFIGDIR / CONFIGFILE
 DEFAULT_CONFIG: dict[str, Number] = {"width": 630, "height": 412, _PURGED_OLD: False}
+POLL_INTERVAL: float = 0.5
 
 
 class Config:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, poll_interval: float = POLL_INTERVAL) -> None:
         self.path = path
+        self.poll_interval = poll_interval
+        self.generation = 0
+        self._lock = threading.RLock()
 
         if not self.path.exists():
             self.reset()
 
         self._config = self._open(path)
+        self._stat = self._get_stat()
+        self._checked = time.monotonic()
+
+    def _get_stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
 
     def _open(self, path: Path) -> dict[str, ConfigData]:
         with path.open(encoding="utf-8") as fh:
@@ -36,8 +53,17 @@ class Config:
         if not self.path.parent.exists():
             self.path.parent.mkdir(parents=True)
 
-        with self.path.open("w", encoding="utf-8") as fh:
-            json.dump(cfg, fh, indent=4)
+        # The file is replaced atomically, so other processes polling it never read
+        # a partially written config.
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as fh:
+                json.dump(cfg, fh, indent=4)
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._stat = self._get_stat()
 
     def reset(self) -> None:
         if self.path.exists():
@@ -46,41 +72,101 @@ class Config:
         self._write(DEFAULT_CONFIG)
 
     def reload(self) -> None:
-        self._config = self._open(self.path)
+        with self._lock:
+            self._config = self._open(self.path)
+            self._stat = self._get_stat()
+            self.generation += 1
+
+    def poll(self) -> None:
+        """Reloads the config file if it was changed by another process.
+
+        The file is checked at most once every 'poll_interval' seconds, and only read
+        if its modification time, inode or size changed. If the file is invalid, e.g.
+        while another program writes it, the previous config is kept and the file is
+        read again at the next check.
+        """
+        now = time.monotonic()
+        if now - self._checked < self.poll_interval:
+            return
+
+        with self._lock:
+            self._checked = now
+            stat = self._get_stat()
+            if stat is not None and stat != self._stat:
+                with contextlib.suppress(ValueError):
+                    self.reload()
 
     def __getitem__(self, name: str) -> ConfigData:
+        self.poll()
         return self._config.get(name, DEFAULT_CONFIG[name])
 
     def __setitem__(self, name: str, value: ConfigData) -> None:
-        self._config[name] = value
-        self._write(self._config)
+        with self._lock:
+            self._config[name] = value
+            self._write(self._config)
 
 
 config = Config(CONFIGPATH)
 
 
+class _Overrides(threading.local):
+    def __init__(self) -> None:
+        self.stack: list[tuple[Number, Number]] = []
+
+
 class Size:
     _width: Number
     _height: Number
 
     def __init__(self) -> None:
-        self._width, self._height = config["width"], config["height"]
+        # Sizes set with 'context' only apply to the thread that set them.
+        self._overrides = _Overrides()
+        self._lock = threading.RLock()
+        # A size set with 'persist=False' is not replaced by the config file.
+        self._pinned = False
+        self._sync()
+
+    def _sync(self) -> None:
+        with self._lock:
+            self._width, self._height = config["width"], config["height"]
+            self._generation = config.generation
+
+    def _push(self, width: Number, height: Number) -> None:
+        self._overrides.stack.append((width, height))
+
+    def _pop(self) -> None:
+        self._overrides.stack.pop()
 
     def reload(self) -> None:
         config.reload()
-        self._width, self._height = config["width"], config["height"]
+        with self._lock:
+            self._pinned = False
+            self._sync()
 
     def get(self) -> tuple[Number, Number]:
         """Returns the current size of the figure in pts.
 
+        Changes of the config file by other processes are picked up automatically,
+        except inside of 'lpl.size.context' and after 'set' with 'persist=False'.
+
         Returns
         -------
         int, int
             (width, height) of the page in pts.
         """
-        return self._width, self._height
+        stack = self._overrides.stack
+        if stack:
+            return stack[-1]
+
+        with self._lock:
+            if not self._pinned:
+                config.poll()
+                if config.generation != self._generation:
+                    self._sync()
 
-    def set(self, width: Number, height: Number) -> None:
+            return self._width, self._height
+
+    def set(self, width: Number, height: Number, *, persist: bool = True) -> None:
         """Sets the size of the latex page in pts.
 
         You can find the size of the latex page with the following commands:
@@ -88,20 +174,40 @@ class Size:
         \\the\\textwidth
         \\the\\textheight
 
+        Inside of 'lpl.size.context', the size is only changed until the context
+        ends.
+
         Parameters
         ----------
         width : int
             The width of the latex page in pts.
         height : int
             The height of the latex page in pts.
+        persist : bool, default: True
+            If True, the size is also stored in the config file and used by future
+            sessions. If False, the size is kept until it is set again or reloaded,
+            even if other processes change the config file.
         """
-        config["width"], config["height"] = width, height
-        self._width, self._height = width, height
+        if persist:
+            config["width"], config["height"] = width, height
+
+        stack = self._overrides.stack
+        if stack:
+            stack[-1] = (width, height)
+            return
+
+        with self._lock:
+            self._width, self._height = width, height
+            self._generation = config.generation
+            self._pinned = not persist
 
     @contextmanager
     def context(self, width: Number, height: Number) -> Iterator[None]:
         """This context manager temporarily sets the size of the figure in pts.
 
+        The size only changes in the current thread, so threads can render figures
+        of different sizes at the same time.
+
         Parameters
         ----------
         width : int
@@ -109,17 +215,19 @@ class Size:
         height : int
             The height of the latex page in pts.
         """
-        _width, _height = self._width, self._height
-        self._width, self._height = width, height
-        yield
-
-        self._width, self._height = _width, _height
+        self._push(width, height)
+        try:
+            yield
+        finally:
+            self._pop()
 
     def __repr__(self) -> str:
-        return repr(f"{self._width}pt, {self._height}pt")
+        width, height = self.get()
+        return repr(f"{width}pt, {height}pt")
 
     def __str__(self) -> str:
-        return str(f"{self._width}pt, {self._height}pt")
+        width, height = self.get()
+        return str(f"{width}pt, {height}pt")
 
 
 size = Size()
@@ -0,0 +1,138 @@
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+else:
+    Axes = Any
+    Line2D = Any
+
+__all__ = [
+    "envelope",
+    "plot_envelope",
+]
+
+CHUNKSIZE: int = 2**20
+
+
+def envelope(
+    y: npt.ArrayLike,
+    nbins: int,
+    x: npt.ArrayLike | None = None,
+    *,
+    chunksize: int = CHUNKSIZE,
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any], npt.NDArray[Any]]:
+    """Reduces a large 1d array to the minimum and maximum of 'nbins' bins.
+
+    The array is read in chunks of about 'chunksize' values, so memory-mapped arrays
+    (e.g. from 'np.load(..., mmap_mode="r")') are never loaded completely. NaNs are
+    ignored.
+
+    Parameters
+    ----------
+    y : array-like
+        The data.
+    nbins : int
+        The number of bins, e.g. the number of pixel columns of the axes.
+    x : array-like, optional
+        The x values of the data. Defaults to the index of each value.
+    chunksize : int, default: 2**20
+        The number of values read at once.
+
+    Returns
+    -------
+    x, ymin, ymax : np.ndarray
+        The x value of the first element of each bin and the minimum and maximum of
+        each bin.
+    """
+    if nbins < 1:
+        msg = "'nbins' must be at least 1"
+        raise ValueError(msg)
+
+    y = y if isinstance(y, np.ndarray) else np.asarray(y)
+    if y.ndim != 1:
+        msg = "'y' must be one-dimensional"
+        raise ValueError(msg)
+    if x is not None:
+        x = x if isinstance(x, np.ndarray) else np.asarray(x)
+        if x.shape != y.shape:
+            msg = "'x' and 'y' must have the same shape"
+            raise ValueError(msg)
+
+    if not len(y):
+        return np.empty(0), np.empty(0, dtype=y.dtype), np.empty(0, dtype=y.dtype)
+
+    binsize = -(-len(y) // nbins)
+    step = max(1, chunksize // binsize) * binsize
+
+    xs, ymin, ymax = [], [], []
+    for start in range(0, len(y), step):
+        chunk = np.asarray(y[start : start + step])
+        pad = -len(chunk) % binsize
+        if pad:
+            chunk = np.concatenate([chunk, np.full(pad, chunk[-1])])
+        chunk = chunk.reshape(-1, binsize)
+
+        ymin.append(np.fmin.reduce(chunk, axis=1))
+        ymax.append(np.fmax.reduce(chunk, axis=1))
+        xs.append(
+            np.arange(start, start + len(chunk) * binsize, binsize)
+            if x is None
+            else np.asarray(x[start : start + step : binsize])
+        )
+
+    return np.concatenate(xs), np.concatenate(ymin), np.concatenate(ymax)
+
+
+def _pixel_columns(ax: Axes, dpi: float | None) -> int:
+    fig_dpi = ax.figure.dpi
+    if dpi is None:
+        dpi = mpl.rcParams["savefig.dpi"]
+        if dpi == "figure":
+            dpi = fig_dpi
+
+    return max(1, int(np.ceil(ax.bbox.width / fig_dpi * dpi)))
+
+
+def plot_envelope(
+    ax: Axes,
+    y: npt.ArrayLike,
+    x: npt.ArrayLike | None = None,
+    *,
+    dpi: float | None = None,
+    chunksize: int = CHUNKSIZE,
+    **kwargs: Any,  # noqa: ANN401
+) -> list[Line2D]:
+    """Plots a large 1d array with bounded memory.
+
+    The data is reduced to its minimum and maximum per pixel column of the axes with
+    'lpl.envelope', which reads the data in chunks. The result looks the same as
+    'ax.plot(x, y)' at the given dpi, but only two points per pixel column are kept.
+
+    Parameters
+    ----------
+    ax : `~matplotlib.axes.Axes`
+        The axes to plot into.
+    y : array-like
+        The data, e.g. a memory-mapped array.
+    x : array-like, optional
+        The x values of the data. Must be sorted. Defaults to the index of each value.
+    dpi : float, optional
+        The resolution of the output. Defaults to 'savefig.dpi'.
+    chunksize : int, default: 2**20
+        The number of values read at once.
+    **kwargs
+        All additional keyword arguments are passed to `~matplotlib.axes.Axes.plot`.
+
+    Returns
+    -------
+    list of `~matplotlib.lines.Line2D`
+        The plotted line.
+    """
+    xs, ymin, ymax = envelope(y, _pixel_columns(ax, dpi), x, chunksize=chunksize)
+
+    return ax.plot(np.repeat(xs, 2), np.column_stack([ymin, ymax]).ravel(), **kwargs)
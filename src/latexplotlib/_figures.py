@@ -0,0 +1,179 @@
+import operator
+import threading
+import warnings
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import _pylab_helpers
+from matplotlib.collections import Collection
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+else:
+    Figure = Any
+
+__all__ = [
+    "FigureMemory",
+    "FigureTracker",
+    "autoclose",
+    "figure_memory",
+    "figures",
+]
+
+MAX_OPEN_FIGURES: int = 20
+
+
+class FigureMemory(NamedTuple):
+    """The approximate memory used by a figure.
+
+    Only large buffers are counted; the fixed overhead of each artist is not.
+    """
+
+    artists: int
+    data: int
+    images: int
+    paths: int
+    canvas: int
+
+    @property
+    def total(self) -> int:
+        """The total number of bytes of all buffers."""
+        return self.data + self.images + self.paths + self.canvas
+
+
+def _nbytes(*arrays: Any) -> int:  # noqa: ANN401
+    return sum(np.asarray(a).nbytes for a in arrays if a is not None)
+
+
+def figure_memory(fig: Figure) -> FigureMemory:
+    """Estimates the memory used by a figure.
+
+    Parameters
+    ----------
+    fig : `.Figure`
+        The figure.
+
+    Returns
+    -------
+    FigureMemory
+        The number of artists and the bytes used by line data, images, path vertices
+        and the canvas buffer.
+    """
+    artists = fig.findobj()
+    data = images = paths = 0
+
+    for artist in artists:
+        if isinstance(artist, Line2D):
+            data += _nbytes(
+                artist.get_xdata(orig=True),
+                artist.get_ydata(orig=True),
+                artist.get_xydata(),
+            )
+        elif isinstance(artist, Collection):
+            paths += sum(_nbytes(p.vertices, p.codes) for p in artist.get_paths())
+            data += _nbytes(artist.get_offsets(), artist.get_array())
+        elif isinstance(artist, AxesImage):
+            images += _nbytes(artist.get_array())
+        elif isinstance(artist, Patch):
+            path = artist.get_path()
+            paths += _nbytes(path.vertices, path.codes)
+
+    renderer = getattr(fig.canvas, "renderer", None)
+    canvas = memoryview(renderer.buffer_rgba()).nbytes if renderer is not None else 0
+
+    return FigureMemory(len(artists), data, images, paths, canvas)
+
+
+class _Scopes(threading.local):
+    def __init__(self) -> None:
+        self.stack: list[list[Figure]] = []
+
+
+class FigureTracker:
+    """Keeps track of the figures created with 'lpl.subplots'.
+
+    A warning is raised whenever more than 'max_open' tracked figures are open in
+    pyplot. Set 'max_open' to 0 to disable the warning.
+    """
+
+    def __init__(self, max_open: int = MAX_OPEN_FIGURES) -> None:
+        self.max_open = max_open
+        self._figures: weakref.WeakSet[Figure] = weakref.WeakSet()
+        self._scopes = _Scopes()
+        self._lock = threading.Lock()
+
+    def __contains__(self, fig: object) -> bool:
+        with self._lock:
+            return fig in self._figures
+
+    def track(self, fig: Figure) -> None:
+        with self._lock:
+            self._figures.add(fig)
+            for scope in self._scopes.stack:
+                scope.append(fig)
+
+        n_open = len(self.open())
+        if self.max_open and n_open > self.max_open:
+            warnings.warn(
+                f"{n_open} figures created with 'lpl.subplots' are still open. "
+                "Close them with 'lpl.close' or use 'lpl.autoclose' to free their "
+                "memory.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def open(self) -> list[Figure]:
+        """Returns all tracked figures that are still open in pyplot."""
+        managed = {
+            manager.canvas.figure
+            for manager in _pylab_helpers.Gcf.get_all_fig_managers()
+        }
+        with self._lock:
+            return [fig for fig in self._figures if fig in managed]
+
+    def memory(self) -> FigureMemory:
+        """Estimates the memory used by all open tracked figures."""
+        total = FigureMemory(0, 0, 0, 0, 0)
+        for fig in self.open():
+            total = FigureMemory(*map(operator.add, total, figure_memory(fig)))
+        return total
+
+    @contextmanager
+    def autoclose(self) -> Iterator[list[Figure]]:
+        """Closes all figures created with 'lpl.subplots' inside this context.
+
+        This context manager can also be used as a decorator:
+
+            @lpl.autoclose()
+            def plot():
+                fig, ax = lpl.subplots()
+                ...
+                fig.savefig("figure.pdf")
+
+        Yields
+        ------
+        list of Figure
+            The figures that were created so far.
+        """
+        created: list[Figure] = []
+        self._scopes.stack.append(created)
+        try:
+            yield created
+        finally:
+            # Nested scopes with the same figures compare equal, so the scope is
+            # found by identity and not with 'list.remove'.
+            stack = self._scopes.stack
+            del stack[max(i for i, scope in enumerate(stack) if scope is created)]
+            for fig in created:
+                plt.close(fig)
+
+
+figures = FigureTracker()
+autoclose = figures.autoclose
@@ -0,0 +1,149 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.image import imsave
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
+else:
+    Artist = Any
+    Figure = Any
+
+__all__ = [
+    "export_frames",
+]
+
+BLIT_FORMATS = ("png",)
+
+
+def _frame_paths(fname: Path, fmt: str, n: int) -> list[Path]:
+    return [fname.with_name(f"{fname.stem}{i}.{fmt}") for i in range(n)]
+
+
+def _dpi(fig: Figure, dpi: float | None) -> float:
+    if dpi is None:
+        dpi = mpl.rcParams["savefig.dpi"]
+    return fig.dpi if dpi == "figure" else float(dpi)
+
+
+def _export_blit(
+    fig: Figure,
+    update: Callable[[Any], Iterable[Artist]],
+    frames: Sequence[Any],
+    paths: list[Path],
+    jobs: int,
+) -> None:
+    original = fig.canvas
+    canvas: Any = (
+        original if isinstance(original, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    )
+
+    artists = list(update(frames[0]))
+    animated = {artist: artist.get_animated() for artist in artists}
+    for artist in animated:
+        artist.set_animated(True)
+
+    try:
+        # Draws everything except the changing artists once.
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+        with ThreadPoolExecutor(jobs, thread_name_prefix="latexplotlib") as pool:
+            pending: deque[Future[None]] = deque()
+            for i, (frame, path) in enumerate(zip(frames, paths, strict=True)):
+                if i:
+                    artists = list(update(frame))
+                canvas.restore_region(background)
+                for artist in artists:
+                    fig.draw_artist(artist)
+
+                image = np.array(canvas.buffer_rgba())
+                pending.append(pool.submit(imsave, path, image, dpi=fig.dpi))
+                # Limits the number of frames held in memory.
+                if len(pending) > 2 * jobs:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+    finally:
+        for artist, value in animated.items():
+            artist.set_animated(value)
+        fig.set_canvas(original)
+
+
+def export_frames(  # noqa: PLR0913
+    fig: Figure,
+    update: Callable[[Any], Iterable[Artist]],
+    frames: Iterable[Any],
+    fname: str | os.PathLike[str],
+    *,
+    dpi: float | None = None,
+    jobs: int = 4,
+) -> list[Path]:
+    """Saves one file per frame of an animation, e.g. for the latex 'animate' package.
+
+    For every frame, 'update' is called with the frame and changes the figure. It
+    returns the artists it changed, like the function of
+    `~matplotlib.animation.FuncAnimation` with 'blit=True'. The artists must be the
+    same for every frame.
+
+    For png files, everything except these artists is drawn only once, and only the
+    changed artists are drawn for every frame, on top of all other artists. The
+    files are written in 'jobs' threads. Other formats, like pdf, draw and save the
+    whole figure for every frame.
+
+    The files are named '<stem><i>.<suffix>', e.g. 'frame-0.png', 'frame-1.png', ...
+    for 'fname="frame-.png"', which matches
+
+        \\animategraphics{12}{frame-}{0}{99}
+
+    Parameters
+    ----------
+    fig : `.Figure`
+        The figure, e.g. from 'lpl.subplots'. Its size is kept.
+    update : callable
+        Changes the figure for a frame and returns the changed artists.
+    frames : iterable
+        The frames passed to 'update'.
+    fname : str or path-like
+        The file name. The frame number is appended to the stem.
+    dpi : float, optional
+        The resolution of png files. Defaults to 'savefig.dpi'.
+    jobs : int, default: 4
+        The number of threads that write png files.
+
+    Returns
+    -------
+    list of Path
+        The saved files.
+    """
+    frames = list(frames)
+    fname = Path(fname)
+    fmt = fname.suffix[1:].lower() or mpl.rcParams["savefig.format"]
+    paths = _frame_paths(fname, fmt, len(frames))
+
+    if not frames:
+        return paths
+
+    if fmt not in BLIT_FORMATS:
+        for frame, path in zip(frames, paths, strict=True):
+            update(frame)
+            fig.savefig(path, format=fmt, dpi=dpi, bbox_inches=None)
+        return paths
+
+    original_dpi = fig.dpi
+    fig.set_dpi(_dpi(fig, dpi))
+    try:
+        _export_blit(fig, update, frames, paths, jobs)
+    finally:
+        fig.set_dpi(original_dpi)
+
+    return paths
@@ -1,22 +1,42 @@
+import re
 import warnings
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Literal
+from typing import Any, Literal
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np
+import numpy.typing as npt
+from matplotlib.figure import Figure
 
 from ._config import size
+from ._figures import figures
+from ._lazy import lazy_subplots
+from ._threads import uses_pyplot
 
-if TYPE_CHECKING:
-    from matplotlib.figure import Figure
-else:
-    Figure = Any
+GOLDEN_RATIO: float = (5**0.5 + 1) / 2
 
+# The x-height of Computer Modern Roman in em.
+EX_PER_EM: float = 0.430554
 
-GOLDEN_RATIO: float = (5**0.5 + 1) / 2
+# Units defined in pt, in inches and relative to the font size.
+_PT_UNITS = {
+    "pt": 1.0,
+    "pc": 12.0,
+    "dd": 1238 / 1157,
+    "cc": 12 * 1238 / 1157,
+    "sp": 1 / 65536,
+}
+_INCH_UNITS = {"in": 1.0, "bp": 1 / 72, "cm": 1 / 2.54, "mm": 1 / 25.4}
+_FONT_UNITS = {"em": 1.0, "ex": EX_PER_EM}
+UNITS = (*_PT_UNITS, *_INCH_UNITS, *_FONT_UNITS)
+
+_LENGTH = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)\s*([a-z]{2})?\s*")
 
 
 __all__ = [
     "convert_inches_to_pt",
+    "convert_lengths",
     "convert_pt_to_inches",
     "figsize",
     "subplots",
@@ -67,6 +87,95 @@ def convert_inches_to_pt(inches: float) -> float:
     return inches * 864.0 * 250.0 / 249.0 / 12.0
 
 
+def _parse_lengths(
+    lengths: npt.ArrayLike, unit: str
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.str_]]:
+    """Splits lengths like '345.0pt' into their values and units."""
+    array = np.asarray(lengths)
+    if array.dtype.kind not in "US":
+        return array.astype(float), np.full(array.shape, unit)
+
+    values = np.empty(array.shape)
+    units = np.empty(array.shape, dtype="U2")
+    for idx, length in np.ndenumerate(array.astype(str)):
+        match = _LENGTH.fullmatch(length)
+        if match is None:
+            msg = f"invalid length {length!r}"
+            raise ValueError(msg)
+        values[idx] = float(match[1])
+        units[idx] = match[2] or unit
+    return values, units
+
+
+def _factors(units: npt.NDArray[np.str_], table: dict[str, float]) -> Any:  # noqa: ANN401
+    keys, inverse = np.unique(units, return_inverse=True)
+    factors = np.array([table.get(str(key), np.nan) for key in keys])
+    return factors[inverse].reshape(units.shape)
+
+
+def convert_lengths(
+    lengths: npt.ArrayLike,
+    unit: str = "pt",
+    to: str = "in",
+    *,
+    fontsize: float | None = None,
+) -> npt.NDArray[np.float64]:
+    """Converts an array of lengths between latex units.
+
+    Lengths can be numbers in 'unit' or strings with their own unit, like '345.0pt'
+    from '\\the\\textwidth'. All latex units are supported: pt, pc, dd, cc, sp,
+    in, bp, cm, mm, em and ex. The units em and ex are relative to the font size,
+    which defaults to 'font.size' of the current style. Conversions between pt and
+    inches give the same results as 'convert_pt_to_inches' and
+    'convert_inches_to_pt'.
+
+        lpl.convert_lengths(["345.0pt", "5in"], to="cm")
+
+    Parameters
+    ----------
+    lengths : array-like of float or str
+        The lengths.
+    unit : str, default: 'pt'
+        The unit of lengths given as numbers or as strings without unit.
+    to : str, default: 'in'
+        The unit of the result.
+    fontsize : float, optional
+        The size of the font in pt for em and ex. Defaults to 'font.size'.
+
+    Returns
+    -------
+    np.ndarray
+        The lengths in 'to', with the shape of 'lengths'.
+    """
+    for name in (unit, to):
+        if name not in UNITS:
+            msg = f"unknown unit {name!r}, must be one of {', '.join(UNITS)}"
+            raise ValueError(msg)
+
+    values, units = _parse_lengths(lengths, unit)
+    if not np.isin(units, UNITS).all():
+        msg = f"unknown unit in {lengths!r}, must be one of {', '.join(UNITS)}"
+        raise ValueError(msg)
+
+    if fontsize is None:
+        fontsize = mpl.rcParams["font.size"]
+
+    pts = np.select(
+        [np.isin(units, list(_PT_UNITS)), np.isin(units, list(_INCH_UNITS))],
+        [
+            values * _factors(units, _PT_UNITS),
+            convert_inches_to_pt(values * _factors(units, _INCH_UNITS)),
+        ],
+        values * fontsize * _factors(units, _FONT_UNITS),
+    )
+
+    if to in _PT_UNITS:
+        return pts / _PT_UNITS[to]  # type: ignore[no-any-return]
+    if to in _INCH_UNITS:
+        return convert_pt_to_inches(pts) / _INCH_UNITS[to]  # type: ignore[return-value]
+    return pts / (fontsize * _FONT_UNITS[to])  # type: ignore[no-any-return]
+
+
 def figsize(  # noqa: PLR0913
     nrows: int = 1,
     ncols: int = 1,
@@ -136,6 +245,20 @@ def figsize(  # noqa: PLR0913
     )
 
 
+def _figure(figsize: tuple[float, float], fig_kw: dict[str, Any]) -> Figure:
+    """Creates a figure, outside of pyplot if it is not thread-safe to use."""
+    if uses_pyplot():
+        return plt.figure(figsize=figsize, **fig_kw)
+
+    # pyplot is not thread-safe, see 'lpl.map_threaded'. Without pyplot, there is
+    # no existing figure to reuse or clear.
+    fig_kw = dict(fig_kw)
+    fig_kw.pop("num", None)
+    fig_kw.pop("clear", None)
+    figure_class: type[Figure] = fig_kw.pop("FigureClass", Figure)
+    return figure_class(figsize=figsize, **fig_kw)
+
+
 def subplots(  # noqa: PLR0913
     nrows: int = 1,
     ncols: int = 1,
@@ -149,6 +272,7 @@ def subplots(  # noqa: PLR0913
     height_ratios: Sequence[float] | None = None,
     subplot_kw: dict[str, Any] | None = None,
     gridspec_kw: dict[str, Any] | None = None,
+    lazy: bool = False,
     **fig_kw: Any,  # noqa: ANN401
 ) -> tuple[Figure, Any]:
     """
@@ -230,9 +354,16 @@ def subplots(  # noqa: PLR0913
         Dict with keywords passed to the `~matplotlib.gridspec.GridSpec`
         constructor used to create the grid the subplots are placed on.
 
+    lazy : bool, default: False
+        If True, every axes is created when it is first accessed, see 'LazyAxes'.
+        Cells that are never accessed have no axes and are left out of the layout,
+        which makes large, sparsely used grids much faster. The size of the figure
+        is the same.
+
     **fig_kw
         All additional keyword arguments are passed to the
-        `.pyplot.figure` call.
+        `.pyplot.figure` call. In the threads of 'lpl.map_threaded', the figure is
+        created with 'FigureClass' and 'num' and 'clear' are ignored.
 
     Returns
     -------
@@ -242,6 +373,7 @@ def subplots(  # noqa: PLR0913
         *ax* can be either a single `~.axes.Axes` object, or an array of Axes
         objects if more than one subplot was created.  The dimensions of the
         resulting array can be controlled with the squeeze keyword, see above.
+        If 'lazy' is True, the array is a 'LazyAxes'.
 
         Typical idioms for handling the return value are::
 
@@ -300,14 +432,41 @@ def subplots(  # noqa: PLR0913
         height_ratios=gridspec_kw.get("height_ratios"),
     )
 
-    return plt.subplots(  # type: ignore[no-any-return]
-        nrows=nrows,
-        ncols=ncols,
-        sharex=sharex,
-        sharey=sharey,
-        squeeze=squeeze,
-        subplot_kw=subplot_kw,
-        gridspec_kw=gridspec_kw,
-        figsize=_figsize,
-        **fig_kw,
-    )
+    if lazy:
+        fig = _figure(_figsize, fig_kw)
+        axes = lazy_subplots(
+            fig,
+            nrows,
+            ncols,
+            sharex=sharex,
+            sharey=sharey,
+            squeeze=squeeze,
+            subplot_kw=subplot_kw,
+            gridspec_kw=gridspec_kw,
+        )
+    elif uses_pyplot():
+        fig, axes = plt.subplots(
+            nrows=nrows,
+            ncols=ncols,
+            sharex=sharex,
+            sharey=sharey,
+            squeeze=squeeze,
+            subplot_kw=subplot_kw,
+            gridspec_kw=gridspec_kw,
+            figsize=_figsize,
+            **fig_kw,
+        )
+    else:
+        fig = _figure(_figsize, fig_kw)
+        axes = fig.subplots(
+            nrows=nrows,
+            ncols=ncols,
+            sharex=sharex,
+            sharey=sharey,
+            squeeze=squeeze,
+            subplot_kw=subplot_kw,
+            gridspec_kw=gridspec_kw,
+        )
+    figures.track(fig)
+
+    return fig, axes
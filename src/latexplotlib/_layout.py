@@ -0,0 +1,112 @@
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ._config import size
+from ._latexplotlib import GOLDEN_RATIO, convert_pt_to_inches
+
+__all__ = [
+    "Layout",
+    "autofit",
+]
+
+
+class Layout(NamedTuple):
+    """A subplot layout as returned by 'autofit'.
+
+    The fields can be passed to 'lpl.subplots' and 'lpl.figsize':
+
+        layout = lpl.autofit(7)
+        fig, axes = lpl.subplots(
+            layout.nrows, layout.ncols, aspect=layout.aspect, scale=layout.scale
+        )
+    """
+
+    nrows: int
+    ncols: int
+    aspect: float
+    scale: float
+
+
+def _round(val: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    return np.floor(10 * val) / 10
+
+
+def _figsize(
+    nrows: npt.NDArray[np.int_],
+    ncols: npt.NDArray[np.int_],
+    scale: float,
+    aspect: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    # vectorized version of 'lpl.figsize' for equal width and height ratios
+    max_width_pt, max_height_pt = size.get()
+
+    width_pt = np.full(aspect.shape, max_width_pt * scale)
+    height_pt = width_pt / aspect * (nrows / ncols)
+
+    too_high = height_pt > max_height_pt
+    width_pt[too_high] *= max_height_pt / height_pt[too_high]
+    height_pt[too_high] = max_height_pt
+
+    return (
+        _round(convert_pt_to_inches(width_pt)),  # type: ignore[arg-type]
+        _round(convert_pt_to_inches(height_pt)),  # type: ignore[arg-type]
+    )
+
+
+def autofit(
+    n: int,
+    *,
+    scale: float = 1.0,
+    min_aspect: float = 1.0,
+    max_aspect: float = GOLDEN_RATIO,
+    max_ncols: int | None = None,
+) -> Layout:
+    """Finds the subplot layout for 'n' axes that maximizes the area of each axes.
+
+    All grids with enough cells for 'n' axes are evaluated at once using the same
+    geometry as 'lpl.figsize' and the current 'lpl.size'. For each grid the best
+    aspect in [min_aspect, max_aspect] is computed in closed form. If several layouts
+    have the same axes area, the one with the fewest empty cells is returned.
+
+    Parameters
+    ----------
+    n : int
+        Number of axes that need to fit on the page.
+    scale : float, default: 1.0
+        The largest scale of the figure relative to the available space.
+    min_aspect, max_aspect : float, default: 1.0, golden ratio
+        The range of allowed aspect ratios of each individual axes.
+    max_ncols : int, optional
+        The maximum number of columns of the grid.
+
+    Returns
+    -------
+    Layout
+        nrows, ncols, aspect and scale of the optimal layout.
+    """
+    if n < 1:
+        msg = "'n' must be at least 1"
+        raise ValueError(msg)
+    if scale < 0:
+        msg = "'scale' must be positive"
+        raise ValueError(msg)
+    if not 0 < min_aspect <= max_aspect:
+        msg = "'min_aspect' must be positive and not larger than 'max_aspect'"
+        raise ValueError(msg)
+
+    ncols = np.arange(1, min(n, max_ncols or n) + 1)
+    nrows = -(-n // ncols)
+
+    max_width_pt, max_height_pt = size.get()
+    best_aspect = max_width_pt * scale * nrows / (ncols * max_height_pt)
+    aspect = np.clip(best_aspect, min_aspect, max_aspect)
+
+    width, height = _figsize(nrows, ncols, scale, aspect)
+    area = width * height / (nrows * ncols)
+    empty = nrows * ncols - n
+
+    idx = np.lexsort((empty, -area))[0]
+
+    return Layout(int(nrows[idx]), int(ncols[idx]), float(aspect[idx]), scale)
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import matplotlib as mpl
+from appdirs import user_cache_dir
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+from matplotlib.layout_engine import ConstrainedLayoutEngine
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+
+from ._config import NAME, size
+from ._figures import figures
+from ._reproducible import _write
+from ._texcache import CacheInfo
+
+__all__ = [
+    "LayoutCache",
+    "layout_cache",
+]
+
+LAYOUTPATH: Path = Path(user_cache_dir(NAME)) / "layouts.json"
+MAXSIZE: int = 1024
+
+Layout = dict[str, list[Any]]
+
+_SUPTEXTS = ("_suptitle", "_supxlabel", "_supylabel")
+
+
+def _visible(artist: Artist, hidden: set[Artist]) -> Iterator[Artist]:
+    if artist.get_visible() and artist not in hidden:
+        yield artist
+        for child in artist.get_children():
+            yield from _visible(child, hidden)
+
+
+def _texts(fig: Figure) -> list[Text]:
+    """Returns the visible texts of a figure, including the tick labels to draw."""
+    hidden: set[Artist] = set()
+    for ax in fig.axes:
+        for axis in ax._axis_map.values():  # type: ignore[attr-defined]  # noqa: SLF001
+            ticks = [*axis.majorTicks, *axis.minorTicks]
+            drawn = set(axis._update_ticks())  # noqa: SLF001
+            hidden.update(tick for tick in ticks if tick not in drawn)
+
+    return [
+        artist
+        for artist in _visible(fig, hidden)
+        if isinstance(artist, Text) and artist.get_text()
+    ]
+
+
+def _fingerprint(fig: Figure, engine: ConstrainedLayoutEngine) -> str | None:
+    """Returns a key for everything the constrained layout of a figure depends on.
+
+    Figures with subfigures or colorbars are not cached.
+    """
+    if fig.subfigs or any(hasattr(ax, "_colorbar_info") for ax in fig.axes):
+        return None
+
+    axes = []
+    for ax in fig.axes:
+        spec = ax.get_subplotspec()
+        if spec is None:
+            axes.append([type(ax).__name__, ax.get_visible()])
+            continue
+        gridspec = spec.get_gridspec()
+        axes.append(
+            [
+                type(ax).__name__,
+                ax.get_visible(),
+                ax.get_in_layout(),
+                gridspec.get_geometry(),
+                gridspec.get_width_ratios(),
+                gridspec.get_height_ratios(),
+                [spec.rowspan.start, spec.rowspan.stop],
+                [spec.colspan.start, spec.colspan.stop],
+            ]
+        )
+
+    structure = {
+        "figsize": fig.get_size_inches().tolist(),
+        "size": size.get(),
+        "engine": engine.get(),
+        "style": sorted((key, repr(value)) for key, value in mpl.rcParams.items()),
+        "axes": axes,
+        "texts": [
+            [len(text.get_text()), text.get_fontsize(), text.get_rotation()]
+            for text in _texts(fig)
+        ],
+    }
+    data = json.dumps(structure, default=repr).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _get_layout(fig: Figure) -> Layout:
+    return {
+        "axes": [list(ax.get_position(original=True).bounds) for ax in fig.axes],
+        "texts": [
+            list(text.get_position()) if text is not None else None
+            for text in (getattr(fig, name, None) for name in _SUPTEXTS)
+        ],
+    }
+
+
+def _set_layout(fig: Figure, layout: Layout) -> None:
+    for ax, bounds in zip(fig.axes, layout["axes"], strict=True):
+        ax._set_position(Bbox.from_bounds(*bounds))  # noqa: SLF001
+    for name, position in zip(_SUPTEXTS, layout["texts"], strict=True):
+        text = getattr(fig, name, None)
+        if text is not None and position is not None:
+            text.set_position(position)
+
+
+class LayoutCache:
+    """Stores the constrained layouts of figures on disk and reuses them.
+
+    Constrained layout solves the positions of all axes whenever a figure is drawn.
+    When enabled, the positions of the axes of figures from 'lpl.subplots' are
+    stored in the user cache directory, keyed on everything the layout depends on:
+    the grid, the figure size, 'lpl.size', the style, and the number of characters,
+    size and rotation of every visible text. A later figure with the same structure,
+    e.g. in the next build, skips the solve and reuses the stored positions.
+
+    Texts with the same number of characters are assumed to have the same size, so
+    the reused layout can differ slightly from a solved one. Figures with colorbars
+    or subfigures are always solved.
+
+    Parameters
+    ----------
+    path : Path, optional
+        The file the layouts are stored in. Defaults to 'layouts.json' in the user
+        cache directory.
+    maxsize : int, default: 1024
+        The maximum number of stored layouts. The least recently used layouts are
+        removed first.
+    """
+
+    def __init__(self, path: Path = LAYOUTPATH, maxsize: int = MAXSIZE) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self._layouts: OrderedDict[str, Layout] | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._original: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the layouts of figures from 'lpl.subplots' are cached."""
+        return self._original is not None
+
+    def enable(self) -> None:
+        """Caches the layouts of figures. Does nothing if already enabled."""
+        if self.enabled:
+            return
+
+        original = self._original = ConstrainedLayoutEngine.execute
+
+        def execute(engine: ConstrainedLayoutEngine, fig: Figure) -> Any:  # noqa: ANN401
+            key = _fingerprint(fig, engine) if fig in figures else None
+            if key is None:
+                return original(engine, fig)
+
+            layout = self.get(key)
+            if layout is not None:
+                _set_layout(fig, layout)
+                return None
+
+            result = original(engine, fig)
+            self.put(key, _get_layout(fig))
+            return result
+
+        ConstrainedLayoutEngine.execute = execute  # type: ignore[method-assign]
+
+    def disable(self) -> None:
+        """Solves every layout again."""
+        if not self.enabled:
+            return
+
+        ConstrainedLayoutEngine.execute = self._original  # type: ignore[method-assign]
+        self._original = None
+
+    def _load(self) -> OrderedDict[str, Layout]:
+        if self._layouts is None:
+            try:
+                self._layouts = OrderedDict(json.loads(self.path.read_text("utf-8")))
+            except (OSError, ValueError):
+                self._layouts = OrderedDict()
+        return self._layouts
+
+    def get(self, key: str) -> Layout | None:
+        """Returns the stored layout of a fingerprint, or None."""
+        with self._lock:
+            layouts = self._load()
+            if key not in layouts:
+                self._misses += 1
+                return None
+            self._hits += 1
+            layouts.move_to_end(key)
+            return layouts[key]
+
+    def put(self, key: str, layout: Layout) -> None:
+        """Stores the layout of a fingerprint on disk."""
+        with self._lock:
+            layouts = self._load()
+            layouts[key] = layout
+            while len(layouts) > self.maxsize:
+                layouts.popitem(last=False)
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                _write(self.path, json.dumps(layouts).encode())
+            except OSError:
+                # The layout is still cached for this process.
+                pass
+
+    def clear(self) -> None:
+        """Removes all stored layouts and resets the statistics."""
+        with self._lock:
+            self._layouts = OrderedDict()
+            self._hits = self._misses = 0
+            self.path.unlink(missing_ok=True)
+
+    def info(self) -> CacheInfo:
+        """Returns the number of hits and misses and the number of stored layouts."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._load()))
+
+
+layout_cache = LayoutCache()
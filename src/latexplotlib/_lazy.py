@@ -0,0 +1,181 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.gridspec import GridSpec
+else:
+    Axes = Any
+    Figure = Any
+    GridSpec = Any
+
+__all__ = [
+    "LazyAxes",
+    "lazy_subplots",
+]
+
+Share = bool | Literal["none", "all", "row", "col"]
+
+_SHARE: dict[Share, str] = {
+    True: "all",
+    False: "none",
+    "none": "none",
+    "all": "all",
+    "row": "row",
+    "col": "col",
+}
+
+
+def _share(name: str, value: Share) -> str:
+    if value not in _SHARE:
+        msg = f"'{name}' must be a bool or one of 'none', 'all', 'row', 'col'"
+        raise ValueError(msg)
+    return _SHARE[value]
+
+
+class _Grid:
+    """The axes of a grid, created when they are first used."""
+
+    def __init__(
+        self,
+        fig: Figure,
+        gridspec: GridSpec,
+        sharex: str,
+        sharey: str,
+        subplot_kw: dict[str, Any],
+    ) -> None:
+        self.fig = fig
+        self.gridspec = gridspec
+        self.sharex = sharex
+        self.sharey = sharey
+        self.subplot_kw = subplot_kw
+        nrows, ncols = gridspec.get_geometry()
+        self.cells: npt.NDArray[Any] = np.full((nrows, ncols), None, dtype=object)
+
+    def _shared(self, share: str, row: int, col: int) -> Axes | None:
+        if share == "none":
+            return None
+        cells = {"all": self.cells, "row": self.cells[row], "col": self.cells[:, col]}
+        return next((ax for ax in cells[share].flat if ax is not None), None)
+
+    def get(self, index: int) -> Axes:
+        row, col = divmod(index, self.cells.shape[1])
+        ax: Axes | None = self.cells[row, col]
+        if ax is None:
+            ax = self.cells[row, col] = self.fig.add_subplot(
+                self.gridspec[row, col],
+                sharex=self._shared(self.sharex, row, col),
+                sharey=self._shared(self.sharey, row, col),
+                **self.subplot_kw,
+            )
+        return ax
+
+
+class LazyAxes:
+    """An array of axes that creates every axes when it is first accessed.
+
+    Indexing works like for the array returned by 'plt.subplots': an integer index
+    for every dimension returns the `~matplotlib.axes.Axes`, which is created on
+    first access, while slices return another 'LazyAxes'. Cells that are never
+    accessed have no axes, so they cost nothing and are left out of the layout, but
+    the grid and the figure size stay the same.
+
+    Shared axes are shared with the first created axes of the same row, column or
+    grid. Unlike 'plt.subplots', the inner tick labels of shared axes are not
+    hidden; call `~matplotlib.axes.Axes.label_outer` to hide them.
+    """
+
+    def __init__(self, grid: _Grid, index: npt.NDArray[np.intp]) -> None:
+        self._grid = grid
+        self._index = index
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape of the array."""
+        return self._index.shape
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the array."""
+        return self._index.ndim
+
+    @property
+    def size(self) -> int:
+        """The number of cells of the array."""
+        return self._index.size
+
+    @property
+    def created(self) -> list[Axes]:
+        """The axes of the array that were already created, in grid order."""
+        cells = self._grid.cells.flat
+        return [cells[i] for i in self._index.flat if cells[i] is not None]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, key: Any) -> Any:  # noqa: ANN401
+        index = self._index[key]
+        if np.ndim(index) == 0:
+            return self._grid.get(int(index))
+        return LazyAxes(self._grid, index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def flat(self) -> Iterator[Axes]:
+        """Iterates over all cells, creating their axes."""
+        for i in self._index.flat:
+            yield self._grid.get(int(i))
+
+    def ravel(self) -> "LazyAxes":
+        """Returns the cells as a one-dimensional 'LazyAxes'."""
+        return LazyAxes(self._grid, self._index.ravel())
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:  # noqa: ANN401, FBT001
+        """Creates all axes and returns them as an array, like 'plt.subplots'."""
+        return np.array(list(self.flat), dtype=object).reshape(self.shape)
+
+    def __repr__(self) -> str:
+        return f"LazyAxes(shape={self.shape}, created={len(self.created)})"
+
+
+def lazy_subplots(  # noqa: PLR0913
+    fig: Figure,
+    nrows: int = 1,
+    ncols: int = 1,
+    *,
+    sharex: Share = False,
+    sharey: Share = False,
+    squeeze: bool = True,
+    subplot_kw: dict[str, Any] | None = None,
+    gridspec_kw: dict[str, Any] | None = None,
+) -> Any:  # noqa: ANN401
+    """Adds a grid of lazily created axes to a figure, see 'LazyAxes'.
+
+    The parameters are the same as for `.Figure.subplots`.
+
+    Returns
+    -------
+    `~matplotlib.axes.Axes` or LazyAxes
+        The axes if the grid has only one cell and 'squeeze' is True, else the
+        lazy array of axes.
+    """
+    grid = _Grid(
+        fig,
+        fig.add_gridspec(nrows, ncols, **(gridspec_kw or {})),
+        _share("sharex", sharex),
+        _share("sharey", sharey),
+        dict(subplot_kw or {}),
+    )
+    axes = LazyAxes(grid, np.arange(nrows * ncols).reshape(nrows, ncols))
+    if not squeeze:
+        return axes
+    if nrows == ncols == 1:
+        return axes[0, 0]
+    return axes.ravel() if 1 in (nrows, ncols) else axes
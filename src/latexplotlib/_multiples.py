@@ -0,0 +1,143 @@
+from typing import TYPE_CHECKING, Any, Literal
+
+import matplotlib as mpl
+import numpy as np
+import numpy.typing as npt
+from matplotlib.collections import LineCollection
+
+from ._latexplotlib import subplots
+from ._layout import autofit
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+else:
+    Figure = Any
+
+__all__ = [
+    "small_multiples",
+]
+
+
+def _segments(y: npt.ArrayLike, x: npt.ArrayLike | None) -> npt.NDArray[np.float64]:
+    """Stacks x and y of all series into an array of shape (nseries, npoints, 2)."""
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 1:
+        y = y[np.newaxis]
+    if y.ndim != 2:  # noqa: PLR2004
+        msg = "'data' must be one- or two-dimensional"
+        raise ValueError(msg)
+
+    x = np.arange(y.shape[1], dtype=float) if x is None else np.asarray(x, dtype=float)
+    if x.shape not in (y.shape, y.shape[1:]):
+        msg = "'x' must have the shape of 'data' or of a single series"
+        raise ValueError(msg)
+
+    return np.stack(np.broadcast_arrays(x, y), axis=-1)
+
+
+def _groups(
+    n: int, by: npt.ArrayLike | None
+) -> tuple[npt.NDArray[Any] | None, list[npt.NDArray[np.intp]]]:
+    """Returns the sorted labels and the indices of the series of each panel."""
+    if by is None:
+        return None, list(np.arange(n)[:, np.newaxis])
+
+    by = np.asarray(by)
+    if by.shape != (n,):
+        msg = "'by' must have one label per series"
+        raise ValueError(msg)
+
+    labels, inverse = np.unique(by, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse))[:-1]
+    return labels, np.split(order, bounds)
+
+
+def small_multiples(  # noqa: PLR0913
+    data: npt.ArrayLike,
+    *,
+    by: npt.ArrayLike | None = None,
+    x: npt.ArrayLike | None = None,
+    ncols: int | None = None,
+    scale: float = 1.0,
+    sharex: bool | Literal["none", "all", "row", "col"] = True,
+    sharey: bool | Literal["none", "all", "row", "col"] = True,
+    **kwargs: Any,  # noqa: ANN401
+) -> tuple[Figure, npt.NDArray[Any]]:
+    """Plots many series on a grid of axes, one panel per group.
+
+    The grid is chosen with 'lpl.autofit' for the current 'lpl.size' and created with
+    'lpl.subplots'. Each panel draws all its series as a single
+    `~matplotlib.collections.LineCollection` instead of one
+    `~matplotlib.lines.Line2D` per series, so drawing and saving scale with the
+    number of points and not with the number of series. Within a panel, the series
+    are colored like 'ax.plot' colors them.
+
+        data = rng.normal(size=(500, 100)).cumsum(axis=1)
+        fig, axes = lpl.small_multiples(data, by=np.arange(500) % 20, linewidth=0.5)
+
+    Parameters
+    ----------
+    data : array-like of shape (nseries, npoints)
+        The series, one per row.
+    by : array-like of shape (nseries,), optional
+        The panel of each series. Series with the same label share a panel, the
+        panels are sorted by label and titled with it. Defaults to one panel per
+        series.
+    x : array-like of shape (npoints,) or (nseries, npoints), optional
+        The x values, shared by all series or one row per series. Defaults to the
+        index of each value.
+    ncols : int, optional
+        The maximum number of columns of the grid.
+    scale : float, default: 1.0
+        The largest scale of the figure relative to the available space.
+    sharex, sharey : bool or {'none', 'all', 'row', 'col'}, default: True
+        Controls sharing of the x- and y-axis among the panels, see 'lpl.subplots'.
+    **kwargs
+        All additional keyword arguments are passed to
+        `~matplotlib.collections.LineCollection`, e.g. 'linewidth' or 'alpha'.
+
+    Returns
+    -------
+    fig : `.Figure`
+    axes : array of Axes
+        One axes per panel. The unused cells of the grid are removed.
+    """
+    segments = _segments(data, x)
+    labels, groups = _groups(len(segments), by)
+
+    layout = autofit(len(groups), scale=scale, max_ncols=ncols)
+    fig, grid = subplots(
+        layout.nrows,
+        layout.ncols,
+        scale=layout.scale,
+        aspect=layout.aspect,
+        sharex=sharex,
+        sharey=sharey,
+        squeeze=False,
+    )
+    axes = grid.ravel()
+    for ax in axes[len(groups) :]:
+        ax.remove()
+    axes = axes[: len(groups)]
+
+    # The lowest panel of each column shows the x tick labels, even if the cell
+    # below it is empty.
+    for ax in axes[-layout.ncols :]:
+        ax.xaxis.set_tick_params(which="both", labelbottom=True)
+
+    if "color" not in kwargs and "colors" not in kwargs:
+        cycle = mpl.rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+    else:
+        cycle = None
+
+    for i, (ax, group) in enumerate(zip(axes, groups, strict=True)):
+        colors: dict[str, Any] = (
+            {} if cycle is None else {"colors": np.resize(cycle, len(group))}
+        )
+        ax.add_collection(LineCollection(list(segments[group]), **colors, **kwargs))
+        ax.autoscale_view()
+        if labels is not None:
+            ax.set_title(str(labels[i]))
+
+    return fig, axes
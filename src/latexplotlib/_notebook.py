@@ -0,0 +1,144 @@
+import io
+from typing import Any
+
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+__all__ = [
+    "Preview",
+    "load_ipython_extension",
+    "preview",
+    "unload_ipython_extension",
+]
+
+PREVIEW_DPI: float = 96
+
+# The formats the inline backend of IPython can render figures to.
+_FORMATS = ("image/png", "image/jpeg", "image/svg+xml", "application/pdf")
+
+
+def _get_ipython() -> Any:  # noqa: ANN401
+    try:
+        from IPython.core.getipython import get_ipython  # noqa: PLC0415
+    except ImportError:
+        ip = None
+    else:
+        ip = get_ipython()  # type: ignore[no-untyped-call]
+
+    if ip is None:
+        msg = "previews require IPython or a Jupyter notebook"
+        raise RuntimeError(msg)
+    return ip
+
+
+class Preview:
+    """Shows figures in IPython and Jupyter notebooks at low resolution without latex.
+
+    The bundled styles render figures at a high dpi with latex, which makes every
+    inline figure slow. When enabled, figures are shown as png images at
+    'dpi' without latex, at the size they have in the document. Saving figures with
+    `.Figure.savefig` is not affected and still uses the dpi and latex of the style.
+
+    Texts that cannot be rendered without latex are rendered with latex.
+
+    Parameters
+    ----------
+    dpi : float, default: 96
+        The resolution of the previews. At 96 dpi, figures are shown at their
+        physical size in most browsers.
+    """
+
+    def __init__(self, dpi: float = PREVIEW_DPI) -> None:
+        self.dpi = dpi
+        self._previous: dict[str, Any] | None = None
+        self._ip: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether figures are shown as previews."""
+        return self._previous is not None
+
+    def render(self, fig: Figure) -> bytes:
+        """Renders a preview of a figure as png.
+
+        Parameters
+        ----------
+        fig : `.Figure`
+            The figure.
+
+        Returns
+        -------
+        bytes
+            The png image.
+        """
+        # Every text stores whether it uses latex when it is created, and tick
+        # labels created while drawing copy this setting from the existing ones.
+        usetex = {text: text.get_usetex() for text in fig.findobj(Text)}
+        try:
+            for text in usetex:
+                text.set_usetex(False)
+            return self._print(fig)
+        except ValueError:
+            # mathtext cannot parse a text that only latex understands.
+            for text, value in usetex.items():
+                text.set_usetex(value)
+            return self._print(fig)
+        finally:
+            for text in fig.findobj(Text):
+                text.set_usetex(usetex.get(text))
+
+    def _print(self, fig: Figure) -> bytes:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=self.dpi, bbox_inches=None)
+        return buffer.getvalue()
+
+    def enable(self, ip: Any = None) -> None:  # noqa: ANN401
+        """Shows all figures as previews in the running IPython shell.
+
+        Call this after '%matplotlib inline', which resets how figures are shown.
+
+        Parameters
+        ----------
+        ip : IPython.InteractiveShell, optional
+            The shell. Defaults to the running shell.
+
+        Raises
+        ------
+        RuntimeError
+            If IPython is not running.
+        """
+        if self.enabled:
+            return
+
+        ip = ip if ip is not None else _get_ipython()
+        formatters = ip.display_formatter.formatters
+
+        self._previous = {mime: formatters[mime].pop(Figure, None) for mime in _FORMATS}
+        formatters["image/png"].for_type(Figure, self.render)
+        self._ip = ip
+
+    def disable(self) -> None:
+        """Shows figures as configured by the inline backend again."""
+        if self._previous is None:
+            return
+
+        formatters = self._ip.display_formatter.formatters
+        formatters["image/png"].pop(Figure, None)
+        for mime, formatter in self._previous.items():
+            if formatter is not None:
+                formatters[mime].for_type(Figure, formatter)
+
+        self._previous = self._ip = None
+
+
+preview = Preview()
+
+
+def load_ipython_extension(ip: Any) -> None:  # noqa: ANN401
+    """Enables previews with '%load_ext latexplotlib'."""
+    preview.enable(ip)
+
+
+def unload_ipython_extension(ip: Any) -> None:  # noqa: ANN401, ARG001
+    """Disables previews with '%unload_ext latexplotlib'."""
+    preview.disable()
@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+from matplotlib.transforms import Bbox
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+else:
+    Axes = Any
+    Figure = Any
+
+__all__ = [
+    "save_panels",
+]
+
+
+def _panels(fig: Figure) -> list[list[Axes]]:
+    """Returns the axes of a figure, each together with its colorbars."""
+    panels: dict[Axes, list[Axes]] = {}
+    for ax in fig.axes:
+        colorbar = getattr(ax, "_colorbar", None)
+        parent = getattr(colorbar.mappable, "axes", None) if colorbar else None
+        if parent in panels:
+            panels[parent].append(ax)
+        else:
+            panels[ax] = [ax]
+    return list(panels.values())
+
+
+def _tightbbox(panel: list[Axes], renderer: Any) -> Bbox:  # noqa: ANN401
+    bboxes = [bbox for ax in panel if (bbox := ax.get_tightbbox(renderer)) is not None]
+    # Hidden axes have no tight bbox.
+    return Bbox.union(bboxes) if bboxes else panel[0].bbox
+
+
+def _panel_paths(fname: Path, n: int) -> list[Path]:
+    suffix = fname.suffix or f".{mpl.rcParams['savefig.format']}"
+    return [fname.with_name(f"{fname.stem}-{i}{suffix}") for i in range(n)]
+
+
+def save_panels(
+    fig: Figure,
+    fname: str | os.PathLike[str],
+    *,
+    pad_inches: float | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> list[Path]:
+    """Saves every axes of a figure, including its labels, to its own file.
+
+    The layout and the latex texts of the figure are computed only once. Every file
+    is cropped tightly around one axes, its labels and its colorbars, so the panels
+    keep the size they have in the figure, e.g. from 'lpl.subplots(nrows, ncols)'.
+    Artists of the figure that do not belong to an axes, like a suptitle, are not
+    saved.
+
+    The files are named '<stem>-<i><suffix>', e.g. 'fig-0.pdf', 'fig-1.pdf', ... for
+    'fname="fig.pdf"', in the order of 'fig.axes'.
+
+    Parameters
+    ----------
+    fig : `.Figure`
+        The figure.
+    fname : str or path-like
+        The file name. The number of the panel is appended to the stem.
+    pad_inches : float, optional
+        The padding around every panel. Defaults to 'savefig.pad_inches'.
+    **kwargs
+        All additional keyword arguments are passed to `.Figure.savefig`.
+
+    Returns
+    -------
+    list of Path
+        The saved files.
+    """
+    if pad_inches is None:
+        pad_inches = mpl.rcParams["savefig.pad_inches"]
+
+    panels = _panels(fig)
+    paths = _panel_paths(Path(fname), len(panels))
+
+    fig.draw_without_rendering()
+    renderer = fig._get_renderer()  # type: ignore[attr-defined]  # noqa: SLF001
+    to_inches = fig.dpi_scale_trans.inverted()
+    bboxes = [
+        _tightbbox(panel, renderer).transformed(to_inches).padded(pad_inches)
+        for panel in panels
+    ]
+
+    # Keeps the positions of the first layout while the panels are saved.
+    engine = fig.get_layout_engine()
+    if engine is not None:
+        fig.set_layout_engine("none")
+
+    visible = {
+        artist: artist.get_visible()
+        for artist in fig.get_children()
+        if artist is not fig.patch
+    }
+    try:
+        for artist in visible:
+            artist.set_visible(False)
+
+        for panel, bbox, path in zip(panels, bboxes, paths, strict=True):
+            for ax in panel:
+                ax.set_visible(visible[ax])
+            fig.savefig(path, bbox_inches=bbox, **kwargs)
+            for ax in panel:
+                ax.set_visible(False)
+    finally:
+        for artist, value in visible.items():
+            artist.set_visible(value)
+        if engine is not None:
+            fig.set_layout_engine(engine)
+
+    return paths
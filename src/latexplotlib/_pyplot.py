@@ -0,0 +1,350 @@
+"""The pyplot names available as 'lpl.<name>', for type checkers.
+
+Generated by 'python scripts/generate_pyplot.py'.
+"""
+
+from matplotlib.pyplot import (
+    acorr,
+    angle_spectrum,
+    annotate,
+    arrow,
+    autoscale,
+    autumn,
+    axes,
+    axhline,
+    axhspan,
+    axis,
+    axline,
+    axvline,
+    axvspan,
+    bar,
+    bar_label,
+    barbs,
+    barh,
+    bone,
+    box,
+    boxplot,
+    broken_barh,
+    cla,
+    clabel,
+    clf,
+    clim,
+    close,
+    cm,
+    cohere,
+    color_sequences,
+    colorbar,
+    colormaps,
+    connect,
+    contour,
+    contourf,
+    cool,
+    copper,
+    csd,
+    delaxes,
+    disconnect,
+    draw,
+    draw_all,
+    draw_if_interactive,
+    ecdf,
+    errorbar,
+    eventplot,
+    figimage,
+    figlegend,
+    fignum_exists,
+    figtext,
+    figure,
+    fill,
+    fill_between,
+    fill_betweenx,
+    findobj,
+    flag,
+    gca,
+    gcf,
+    gci,
+    get,
+    get_backend,
+    get_cmap,
+    get_current_fig_manager,
+    get_figlabels,
+    get_fignums,
+    get_plot_commands,
+    getp,
+    ginput,
+    gray,
+    grid,
+    hexbin,
+    hist,
+    hist2d,
+    hlines,
+    hot,
+    hsv,
+    imread,
+    imsave,
+    imshow,
+    inferno,
+    install_repl_displayhook,
+    ioff,
+    ion,
+    isinteractive,
+    jet,
+    legend,
+    locator_params,
+    loglog,
+    magma,
+    magnitude_spectrum,
+    margins,
+    matshow,
+    minorticks_off,
+    minorticks_on,
+    new_figure_manager,
+    nipy_spectral,
+    pause,
+    pcolor,
+    pcolormesh,
+    phase_spectrum,
+    pie,
+    pink,
+    plasma,
+    plot,
+    plot_date,
+    polar,
+    prism,
+    psd,
+    quiver,
+    quiverkey,
+    rc,
+    rc_context,
+    rcdefaults,
+    rcParams,
+    rgrids,
+    savefig,
+    sca,
+    scatter,
+    sci,
+    semilogx,
+    semilogy,
+    set_cmap,
+    set_loglevel,
+    setp,
+    show,
+    specgram,
+    spring,
+    spy,
+    stackplot,
+    stairs,
+    stem,
+    step,
+    streamplot,
+    style,
+    subplot,
+    subplot2grid,
+    subplot_mosaic,
+    subplot_tool,
+    subplots_adjust,
+    summer,
+    suptitle,
+    switch_backend,
+    table,
+    text,
+    thetagrids,
+    tick_params,
+    ticklabel_format,
+    tight_layout,
+    title,
+    tricontour,
+    tricontourf,
+    tripcolor,
+    triplot,
+    twinx,
+    twiny,
+    uninstall_repl_displayhook,
+    violinplot,
+    viridis,
+    vlines,
+    waitforbuttonpress,
+    winter,
+    xcorr,
+    xkcd,
+    xlabel,
+    xlim,
+    xscale,
+    xticks,
+    ylabel,
+    ylim,
+    yscale,
+    yticks,
+)
+
+__all__ = [
+    "acorr",
+    "angle_spectrum",
+    "annotate",
+    "arrow",
+    "autoscale",
+    "autumn",
+    "axes",
+    "axhline",
+    "axhspan",
+    "axis",
+    "axline",
+    "axvline",
+    "axvspan",
+    "bar",
+    "bar_label",
+    "barbs",
+    "barh",
+    "bone",
+    "box",
+    "boxplot",
+    "broken_barh",
+    "cla",
+    "clabel",
+    "clf",
+    "clim",
+    "close",
+    "cm",
+    "cohere",
+    "color_sequences",
+    "colorbar",
+    "colormaps",
+    "connect",
+    "contour",
+    "contourf",
+    "cool",
+    "copper",
+    "csd",
+    "delaxes",
+    "disconnect",
+    "draw",
+    "draw_all",
+    "draw_if_interactive",
+    "ecdf",
+    "errorbar",
+    "eventplot",
+    "figimage",
+    "figlegend",
+    "fignum_exists",
+    "figtext",
+    "figure",
+    "fill",
+    "fill_between",
+    "fill_betweenx",
+    "findobj",
+    "flag",
+    "gca",
+    "gcf",
+    "gci",
+    "get",
+    "get_backend",
+    "get_cmap",
+    "get_current_fig_manager",
+    "get_figlabels",
+    "get_fignums",
+    "get_plot_commands",
+    "getp",
+    "ginput",
+    "gray",
+    "grid",
+    "hexbin",
+    "hist",
+    "hist2d",
+    "hlines",
+    "hot",
+    "hsv",
+    "imread",
+    "imsave",
+    "imshow",
+    "inferno",
+    "install_repl_displayhook",
+    "ioff",
+    "ion",
+    "isinteractive",
+    "jet",
+    "legend",
+    "locator_params",
+    "loglog",
+    "magma",
+    "magnitude_spectrum",
+    "margins",
+    "matshow",
+    "minorticks_off",
+    "minorticks_on",
+    "new_figure_manager",
+    "nipy_spectral",
+    "pause",
+    "pcolor",
+    "pcolormesh",
+    "phase_spectrum",
+    "pie",
+    "pink",
+    "plasma",
+    "plot",
+    "plot_date",
+    "polar",
+    "prism",
+    "psd",
+    "quiver",
+    "quiverkey",
+    "rc",
+    "rcParams",
+    "rc_context",
+    "rcdefaults",
+    "rgrids",
+    "savefig",
+    "sca",
+    "scatter",
+    "sci",
+    "semilogx",
+    "semilogy",
+    "set_cmap",
+    "set_loglevel",
+    "setp",
+    "show",
+    "specgram",
+    "spring",
+    "spy",
+    "stackplot",
+    "stairs",
+    "stem",
+    "step",
+    "streamplot",
+    "style",
+    "subplot",
+    "subplot2grid",
+    "subplot_mosaic",
+    "subplot_tool",
+    "subplots_adjust",
+    "summer",
+    "suptitle",
+    "switch_backend",
+    "table",
+    "text",
+    "thetagrids",
+    "tick_params",
+    "ticklabel_format",
+    "tight_layout",
+    "title",
+    "tricontour",
+    "tricontourf",
+    "tripcolor",
+    "triplot",
+    "twinx",
+    "twiny",
+    "uninstall_repl_displayhook",
+    "violinplot",
+    "viridis",
+    "vlines",
+    "waitforbuttonpress",
+    "winter",
+    "xcorr",
+    "xkcd",
+    "xlabel",
+    "xlim",
+    "xscale",
+    "xticks",
+    "ylabel",
+    "ylim",
+    "yscale",
+    "yticks",
+]
@@ -0,0 +1,112 @@
+import io
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+else:
+    Figure = Any
+
+__all__ = [
+    "save_reproducible",
+]
+
+HASHSALT: str = "latexplotlib"
+
+# The metadata entries that contain the current time, per format. matplotlib
+# omits an entry whose value is None.
+_DATE_METADATA: dict[str, str] = {
+    "pdf": "CreationDate",
+    "svg": "Date",
+}
+# The postscript backends always write the current time, so it is removed after
+# rendering.
+_PS_CREATIONDATE = re.compile(rb"^%%CreationDate: [^\n]*\n", re.MULTILINE)
+
+
+def _format(fname: Path, fmt: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    return fname.suffix[1:].lower() or mpl.rcParams["savefig.format"]
+
+
+def _render(fig: Figure, fmt: str, **kwargs: Any) -> bytes:  # noqa: ANN401
+    has_epoch = bool(os.getenv("SOURCE_DATE_EPOCH"))
+
+    if fmt in _DATE_METADATA and not has_epoch:
+        kwargs["metadata"] = {_DATE_METADATA[fmt]: None, **kwargs.get("metadata", {})}
+
+    salt = mpl.rcParams["svg.hashsalt"] or HASHSALT
+    with mpl.rc_context({"svg.hashsalt": salt}):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, **kwargs)
+
+    content = buffer.getvalue()
+    if fmt in {"ps", "eps"} and not has_epoch:
+        content = _PS_CREATIONDATE.sub(b"", content, count=1)
+    return content
+
+
+def _is_unchanged(path: Path, content: bytes) -> bool:
+    try:
+        return path.stat().st_size == len(content) and path.read_bytes() == content
+    except FileNotFoundError:
+        return False
+
+
+def _write(path: Path, content: bytes) -> None:
+    # The file is replaced atomically, so a running latex build never reads a
+    # partially written figure.
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        tmp.write_bytes(content)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def save_reproducible(
+    fig: Figure,
+    fname: str | os.PathLike[str],
+    *,
+    format: str | None = None,  # noqa: A002
+    **kwargs: Any,  # noqa: ANN401
+) -> bool:
+    """Saves a figure with byte-identical output for identical inputs.
+
+    Creation dates are removed from the metadata unless the environment variable
+    'SOURCE_DATE_EPOCH' is set, in which case its time is used. The ids of svg
+    elements are derived from a fixed salt. If the file already exists and has the
+    same content, it is not rewritten and keeps its modification time, so build
+    tools like latexmk do not rebuild the document.
+
+    Parameters
+    ----------
+    fig : `.Figure`
+        The figure to save.
+    fname : str or path-like
+        The file name.
+    format : str, optional
+        The file format. Defaults to the suffix of 'fname' or 'savefig.format'.
+    **kwargs
+        All additional keyword arguments are passed to `.Figure.savefig`.
+
+    Returns
+    -------
+    bool
+        True if the file was written, False if it was already up to date.
+    """
+    path = Path(fname)
+    content = _render(fig, _format(path, format), **kwargs)
+
+    if _is_unchanged(path, content):
+        return False
+
+    _write(path, content)
+    return True
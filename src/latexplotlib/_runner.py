@@ -0,0 +1,118 @@
+import os
+import runpy
+import sys
+import time
+import traceback
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+from ._config import size
+
+
+class Result(NamedTuple):
+    script: str
+    outputs: list[str]
+    seconds: float
+    error: str | None = None
+
+
+def _output_path(fname: Any, kwargs: dict[str, Any]) -> Path | None:  # noqa: ANN401
+    if not isinstance(fname, str | os.PathLike):
+        return None
+
+    path = Path(fname)
+    if not path.suffix:
+        path = path.with_suffix(
+            "." + (kwargs.get("format") or mpl.rcParams["savefig.format"])
+        )
+
+    return path.resolve()
+
+
+@contextmanager
+def _record_savefig(outputs: list[Path]) -> Iterator[None]:
+    savefig = Figure.savefig
+
+    def _savefig(self: Figure, fname: Any, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        path = _output_path(fname, kwargs)
+        if path is not None:
+            outputs.append(path)
+        savefig(self, fname, *args, **kwargs)
+
+    Figure.savefig = _savefig  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        Figure.savefig = savefig  # type: ignore[method-assign]
+
+
+def _imported_from(directory: Path, names: set[str]) -> list[str]:
+    """Returns the modules, except 'names', that were loaded from a directory."""
+    imported = []
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if (
+            name not in names
+            and file
+            and Path(file).resolve().is_relative_to(directory)
+        ):
+            imported.append(name)
+    return imported
+
+
+@contextmanager
+def _script_env(script: Path, argv: Sequence[str], cwd: Path) -> Iterator[None]:
+    old_cwd, old_argv, old_path = Path.cwd(), sys.argv, sys.path[:]
+    modules = set(sys.modules)
+    os.chdir(cwd)
+    sys.argv = [str(script), *argv]
+    # Like 'python script.py', modules next to the script can be imported. They are
+    # removed afterwards, so the next run sees changes to them.
+    sys.path.insert(0, str(script.parent))
+    try:
+        yield
+    finally:
+        os.chdir(old_cwd)
+        sys.argv = old_argv
+        sys.path[:] = old_path
+        for name in _imported_from(script.parent, modules):
+            del sys.modules[name]
+
+
+def run_script(
+    script: Path, argv: Sequence[str] = (), *, cwd: Path | None = None
+) -> Result:
+    """Runs a figure script and records the files it saves.
+
+    The script runs as '__main__' with its own rcParams and 'lpl.size', and all
+    figures are closed afterwards. Errors are returned instead of raised. A relative
+    script is found relative to 'cwd'.
+    """
+    cwd = cwd or Path.cwd()
+    script = (cwd / script).resolve()
+    outputs: list[Path] = []
+    error = None
+
+    start = time.perf_counter()
+    with (
+        _record_savefig(outputs),
+        _script_env(script, argv, cwd),
+        plt.rc_context(),
+        size.context(*size.get()),
+    ):
+        try:
+            runpy.run_path(str(script), run_name="__main__")
+        except (Exception, SystemExit):  # noqa: BLE001
+            error = traceback.format_exc()
+        finally:
+            plt.close("all")
+
+    return Result(
+        str(script), [str(p) for p in outputs], time.perf_counter() - start, error
+    )
@@ -0,0 +1,120 @@
+import json
+import os
+import secrets
+import socketserver
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from latexplotlib_client import HOST, send
+from latexplotlib_client import build as client_build
+from latexplotlib_client import stop as client_stop
+
+from ._config import CONFIGDIR
+from ._runner import Result, run_script
+
+SERVERFILE: Path = CONFIGDIR / "server.json"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_Server"
+
+    def _respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        if not secrets.compare_digest(str(request.get("token")), self.server.token):
+            return {"error": "invalid token"}
+
+        if request.get("command") == "stop":
+            threading.Thread(target=self.server.shutdown).start()
+            return {}
+
+        result = run_script(
+            Path(request["script"]),
+            request.get("args", []),
+            cwd=Path(request["cwd"]) if "cwd" in request else None,
+        )
+        return result._asdict()
+
+    def handle(self) -> None:
+        try:
+            response = self._respond(json.loads(self.rfile.readline()))
+        except (ValueError, KeyError, TypeError, OSError) as err:
+            response = {"error": f"invalid request: {err!r}"}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.TCPServer):
+    allow_reuse_address = True
+
+    def __init__(self, token: str, port: int = 0) -> None:
+        super().__init__((HOST, port), _Handler)
+        self.token = token
+
+
+def _write_serverfile(port: int, token: str) -> None:
+    if not SERVERFILE.parent.exists():
+        SERVERFILE.parent.mkdir(parents=True)
+
+    fd = os.open(SERVERFILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump({"port": port, "token": token}, fh)
+
+
+def serve(port: int = 0) -> None:
+    """Runs a server that executes figure scripts in this process.
+
+    matplotlib, the latexplotlib styles and the config are loaded once, so every
+    script only pays for its own plotting. Requests are handled one at a time.
+
+    The port and an access token are written to 'SERVERFILE', which is only readable
+    by the current user. A request is a single line of json
+
+        {"token": ..., "script": "fig.py", "args": [], "cwd": "/path/to/paper"}
+
+    and the response is a single line of json with the keys 'script', 'outputs',
+    'seconds' and 'error'. The request {"token": ..., "command": "stop"} stops the
+    server.
+
+    Parameters
+    ----------
+    port : int, default: 0
+        The port to listen on. By default, a free port is chosen.
+    """
+    token = secrets.token_hex(16)
+    with _Server(token, port) as server:
+        _write_serverfile(server.server_address[1], token)
+        try:
+            server.serve_forever()
+        finally:
+            SERVERFILE.unlink(missing_ok=True)
+
+
+def _send(request: dict[str, Any]) -> dict[str, Any]:
+    return send(request, SERVERFILE)
+
+
+def build(script: Path, argv: Sequence[str] = ()) -> Result:
+    """Runs a figure script in the running latexplotlib server.
+
+    The 'latexplotlib build' command uses `latexplotlib_client.build`, which does
+    not import matplotlib.
+
+    Parameters
+    ----------
+    script : Path
+        The figure script.
+    argv : sequence of str, optional
+        Command line arguments passed to the script.
+
+    Returns
+    -------
+    Result
+        The script, the files it saved, the time it took and an optional error.
+    """
+    return Result(**client_build(script, argv, SERVERFILE))
+
+
+def stop() -> None:
+    """Stops the running latexplotlib server."""
+    client_stop(SERVERFILE)
@@ -0,0 +1,66 @@
+from typing import Any, NamedTuple
+
+import matplotlib as mpl
+
+from ._config import Number, size
+
+__all__ = [
+    "Snapshot",
+    "restore",
+    "snapshot",
+]
+
+# rcParams that belong to the process and not to the figure style
+_PROCESS_RCPARAMS = {"backend", "backend_fallback", "interactive", "webagg.port"}
+
+
+class Snapshot(NamedTuple):
+    """The latexplotlib and matplotlib state of a process.
+
+    A snapshot is picklable and can be used to initialize worker processes with
+    'lpl.restore'.
+    """
+
+    width: Number
+    height: Number
+    rcparams: dict[str, Any]
+
+
+def snapshot() -> Snapshot:
+    """Captures the current 'lpl.size' and the active style.
+
+    The style is stored as the rcParams that differ from the rcParams at startup, so
+    restoring it does not need to read or parse any style file.
+
+    Returns
+    -------
+    Snapshot
+        The current state of this process.
+    """
+    width, height = size.get()
+    rcparams = {
+        key: value
+        for key, value in mpl.rcParams.items()
+        if key not in _PROCESS_RCPARAMS and value != mpl.rcParamsOrig[key]
+    }
+
+    return Snapshot(width, height, rcparams)
+
+
+def restore(state: Snapshot) -> None:
+    """Applies a snapshot created with 'lpl.snapshot' to the current process.
+
+    This function is meant to be used as initializer of a process pool:
+
+        with ProcessPoolExecutor(initializer=lpl.restore, initargs=(lpl.snapshot(),)):
+            ...
+
+    The size is not written to the config file.
+
+    Parameters
+    ----------
+    state : Snapshot
+        The state to apply.
+    """
+    size.set(state.width, state.height, persist=False)
+    mpl.rcParams.update(state.rcparams)
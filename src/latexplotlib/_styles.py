@@ -1,11 +1,26 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 
 from matplotlib.pyplot import style
 
+DRAFT_STYLE = "latex-draft"
+
 
 def make_styles_available(path: Sequence[str]) -> None:
     lpl_styles = style.core.read_style_directory(Path(path[0]) / "styles")
 
     style.core.update_nested_dict(style.library, lpl_styles)
     style.core.available[:] = sorted(style.library.keys())
+
+
+@contextmanager
+def draft() -> Iterator[None]:
+    """This context manager temporarily applies the 'latex-draft' style.
+
+    The draft style disables latex, constrained layout and antialiasing and lowers the
+    dpi, so figures render almost instantly. It is applied on top of the active style
+    and does not change the size of figures created with 'lpl.subplots'.
+    """
+    with style.context(DRAFT_STYLE):
+        yield
@@ -0,0 +1,223 @@
+import functools
+from collections.abc import Iterable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from matplotlib.texmanager import TexManager
+from matplotlib.text import Text
+
+from ._figures import figures
+
+if TYPE_CHECKING:
+    from matplotlib.backend_bases import RendererBase
+else:
+    RendererBase = Any
+
+__all__ = [
+    "TexBatch",
+    "tex_batch",
+]
+
+_BEGIN_DOCUMENT = r"\begin{document}"
+_END_DOCUMENT = r"\end{document}"
+
+# dvi opcodes, see the dvitype documentation
+_POST = 248
+_POST_POST = 249
+_PADDING = 223
+_POST_LENGTH = 29
+
+
+def _split_dvi(data: bytes) -> list[bytes]:
+    """Splits a dvi file into one dvi file per page.
+
+    Every file contains all font definitions of the postamble before its page, as
+    fonts are only defined on the first page that uses them.
+    """
+    end = len(data.rstrip(bytes([_PADDING])))
+    post_post = end - 6
+    if post_post < 0 or data[post_post] != _POST_POST:
+        msg = "invalid dvi file"
+        raise ValueError(msg)
+
+    post = int.from_bytes(data[post_post + 1 : post_post + 5], "big")
+    if data[post] != _POST:
+        msg = "invalid dvi file"
+        raise ValueError(msg)
+
+    preamble = data[: 15 + data[14]]
+    fontdefs = data[post + _POST_LENGTH : post_post]
+    header = preamble + fontdefs
+
+    bops = []
+    bop = int.from_bytes(data[post + 1 : post + 5], "big", signed=True)
+    while bop >= 0:
+        bops.append(bop)
+        # The last four bytes of bop point to the previous page.
+        bop = int.from_bytes(data[bop + 41 : bop + 45], "big", signed=True)
+    bops.reverse()
+
+    pages = []
+    for start, stop in zip(bops, [*bops[1:], post], strict=True):
+        page = bytearray(data[start:stop])
+        page[41:45] = (-1).to_bytes(4, "big", signed=True)
+
+        postamble = (
+            bytes([_POST])
+            + len(header).to_bytes(4, "big")
+            + data[post + 5 : post + 27]  # num, den, mag, l, u, s
+            + (1).to_bytes(2, "big")  # t, the number of pages
+            + fontdefs
+        )
+        content = header + page + postamble
+        content += (
+            bytes([_POST_POST])
+            + (len(header) + len(page)).to_bytes(4, "big")
+            + data[post_post + 5 : post_post + 6]  # the dvi version
+        )
+        pages.append(content + bytes([_PADDING]) * (4 + -len(content) % 4))
+
+    return pages
+
+
+def _texts(fig: Figure) -> set[tuple[str, float]]:
+    """Returns the tex strings and font sizes matplotlib measures to draw a figure."""
+    for ax in fig.axes:
+        for axis in ax._axis_map.values():  # type: ignore[attr-defined]  # noqa: SLF001
+            # Sets the text of the tick labels, which otherwise happens during draw.
+            axis._update_ticks()  # noqa: SLF001
+
+    texts = set()
+    for text in fig.findobj(Text):
+        if not (text.get_visible() and text.get_usetex() and text.get_text()):
+            continue
+
+        fontsize = text.get_fontproperties().get_size_in_points()
+        texts.add(("lp", fontsize))
+        for line in text.get_text().split("\n"):
+            if line:
+                texts.add((r"\ " if line == " " else line, fontsize))
+
+    return texts
+
+
+class TexBatch:
+    """Typesets all usetex texts of a figure in a single latex run.
+
+    matplotlib runs latex once for every text that is not cached yet. When enabled
+    with 'lpl.tex_batch.enable()', all usetex texts of a figure created with
+    'lpl.subplots' are collected before the figure is drawn and typeset as pages of
+    a single latex document. The dvi file is split into one file per page and stored
+    in the tex cache of matplotlib, where matplotlib finds them when it measures and
+    draws the texts.
+
+    Only figures drawn with 'text.usetex' enabled are batched. If the batch fails,
+    e.g. because one text is invalid, matplotlib typesets every text on its own and
+    reports the error as usual.
+    """
+
+    def __init__(self) -> None:
+        self._original: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether figures from 'lpl.subplots' are typeset in a single latex run."""
+        return self._original is not None
+
+    def enable(self) -> None:
+        """Typesets figures in a single latex run. Does nothing if already enabled."""
+        if self.enabled:
+            return
+
+        original = self._original = Figure.draw
+
+        # Keeps the attributes matplotlib reads from 'draw', e.g.
+        # '_supports_rasterization'.
+        @functools.wraps(original)
+        def draw(fig: Figure, renderer: RendererBase) -> None:
+            if fig in figures and mpl.rcParams["text.usetex"]:
+                self.typeset(_texts(fig))
+            original(fig, renderer)
+
+        Figure.draw = draw  # type: ignore[assignment, method-assign]
+
+    def disable(self) -> None:
+        """Runs latex once for every text again."""
+        if not self.enabled:
+            return
+
+        Figure.draw = self._original  # type: ignore[method-assign]
+        self._original = None
+
+    @staticmethod
+    def typeset(texts: Iterable[tuple[str, float]]) -> int:
+        """Typesets texts in a single latex run, skipping texts that are cached.
+
+        Parameters
+        ----------
+        texts : iterable of (str, float)
+            The tex strings and their font sizes.
+
+        Returns
+        -------
+        int
+            The number of texts that were typeset.
+        """
+        missing = {}
+        for tex, fontsize in texts:
+            dvifile = Path(TexManager.get_basefile(tex, fontsize)).with_suffix(".dvi")
+            if not dvifile.exists():
+                missing[dvifile] = (tex, fontsize)
+
+        # A single text is typeset by matplotlib as usual.
+        if len(missing) < 2:  # noqa: PLR2004
+            return 0
+
+        sources = [
+            TexManager._get_tex_source(tex, fontsize)  # type: ignore[attr-defined]  # noqa: SLF001
+            for tex, fontsize in missing.values()
+        ]
+        preamble = sources[0][: sources[0].index(_BEGIN_DOCUMENT)]
+        bodies = [
+            source[source.index(_BEGIN_DOCUMENT) + len(_BEGIN_DOCUMENT) :]
+            .rsplit(_END_DOCUMENT, 1)[0]
+            .strip()
+            for source in sources
+        ]
+        document = "\n".join(
+            [preamble + _BEGIN_DOCUMENT, "\n\\clearpage\n".join(bodies), _END_DOCUMENT]
+        )
+
+        with TemporaryDirectory(dir=TexManager._texcache) as tmp:  # type: ignore[attr-defined]  # noqa: SLF001
+            Path(tmp, "file.tex").write_text(document, encoding="utf-8")
+            try:
+                TexManager._run_checked_subprocess(  # type: ignore[attr-defined]  # noqa: SLF001
+                    [
+                        "latex",
+                        "-interaction=nonstopmode",
+                        "-halt-on-error",
+                        "-no-shell-escape",
+                        "file.tex",
+                    ],
+                    document,
+                    cwd=tmp,
+                )
+                pages = _split_dvi(Path(tmp, "file.dvi").read_bytes())
+            except (RuntimeError, ValueError, OSError):
+                return 0
+
+            if len(pages) != len(missing):
+                return 0
+
+            for i, (dvifile, page) in enumerate(zip(missing, pages, strict=True)):
+                tmpfile = Path(tmp, f"{i}.dvi")
+                tmpfile.write_bytes(page)
+                tmpfile.replace(dvifile)
+
+        return len(missing)
+
+
+tex_batch = TexBatch()
@@ -0,0 +1,137 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from matplotlib.texmanager import TexManager
+
+__all__ = [
+    "CacheInfo",
+    "TexCache",
+    "tex_cache",
+]
+
+MAXSIZE: int = 4096
+
+_METHOD = "get_text_width_height_descent"
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a cache, like `.TexCache` or `.LayoutCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TexCache:
+    """Caches the width, height and descent of usetex text in memory.
+
+    matplotlib measures every text with usetex by parsing the dvi file of the text,
+    which is repeated for every figure and renderer. When enabled with
+    'lpl.tex_cache.enable()', the measurements are cached across all figures. The
+    key is a hash of the latex document matplotlib creates for the text, which
+    contains the text, the font size, the font and the custom preamble, together
+    with the resolution of the renderer, so changing the style never returns stale
+    results.
+
+    Parameters
+    ----------
+    maxsize : int, default: 4096
+        The maximum number of cached measurements. The least recently used
+        measurements are removed first.
+    """
+
+    def __init__(self, maxsize: int = MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, float], tuple[float, float, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._original: Any = None
+        self._measure: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is installed in `~matplotlib.texmanager.TexManager`."""
+        return self._original is not None
+
+    def enable(self) -> None:
+        """Installs the cache. Does nothing if it is already installed."""
+        if self.enabled:
+            return
+
+        self._original = TexManager.__dict__[_METHOD]
+        self._measure = getattr(TexManager, _METHOD)
+
+        def get_text_width_height_descent(
+            cls: type[TexManager],  # noqa: ARG001
+            tex: str,
+            fontsize: float,
+            renderer: Any = None,  # noqa: ANN401
+        ) -> tuple[float, float, float]:
+            return self.get(tex, fontsize, renderer)
+
+        setattr(TexManager, _METHOD, classmethod(get_text_width_height_descent))
+
+    def disable(self) -> None:
+        """Removes the cache and restores the original measurement."""
+        if not self.enabled:
+            return
+
+        setattr(TexManager, _METHOD, self._original)
+        self._original = self._measure = None
+
+    def get(
+        self,
+        tex: str,
+        fontsize: float,
+        renderer: Any = None,  # noqa: ANN401
+    ) -> tuple[float, float, float]:
+        """Returns the width, height and descent of usetex text."""
+        if not tex.strip():
+            return self._measure(tex, fontsize, renderer)
+
+        dpi_fraction = renderer.points_to_pixels(1.0) if renderer else 1.0
+        # 'TexManager.get_basefile' would create the directory of the dvi file.
+        source = TexManager._get_tex_source(tex, fontsize)  # type: ignore[attr-defined]  # noqa: SLF001
+        key = (hashlib.sha256(source.encode()).hexdigest(), dpi_fraction)
+
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._measure(tex, fontsize, renderer)
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = result
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Removes all measurements and resets the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the number of hits and misses and the size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+
+tex_cache = TexCache()
@@ -0,0 +1,193 @@
+import functools
+import hashlib
+import shutil
+import subprocess
+import threading
+import warnings
+from collections.abc import Sequence
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib.texmanager import TexManager
+
+__all__ = [
+    "TexFormats",
+    "tex_formats",
+]
+
+FORMATDIR: Path = Path(mpl.get_cachedir(), "tex.cache", "latexplotlib")
+
+_METHOD = "_run_checked_subprocess"
+_BEGIN_DOCUMENT = r"\begin{document}"
+
+
+def _tex_source() -> str:
+    """Returns the latex document matplotlib creates for an empty text."""
+    source: str = TexManager._get_tex_source("", 10)  # type: ignore[attr-defined]  # noqa: SLF001
+    return source
+
+
+def _preamble() -> str:
+    source = _tex_source()
+    return source[: source.index(_BEGIN_DOCUMENT)]
+
+
+@functools.cache
+def _installation() -> str:
+    """Returns a description of the latex installation, or '' if there is none."""
+    latex = shutil.which("latex")
+    if latex is None:
+        return ""
+
+    version = subprocess.run(  # noqa: S603
+        [latex, "--version"], capture_output=True, check=False
+    ).stdout.decode("utf-8", "replace")
+    return f"{latex}\n{Path(latex).stat().st_mtime_ns}\n{version}"
+
+
+class TexFormats:
+    """Precompiles the usetex preamble into latex format files.
+
+    matplotlib runs latex once for every new text, and every run loads the packages
+    of the preamble from scratch. When enabled with 'lpl.tex_formats.enable()', the
+    preamble of the active style is dumped into a format file with the
+    'mylatexformat' package on first use, and every latex run of matplotlib loads
+    this format instead. A format is built for every preamble and latex
+    installation, so changing either builds a new format.
+
+    If no format can be built, e.g. because 'mylatexformat' is not installed, a
+    warning is shown once and matplotlib runs latex as usual.
+
+    Parameters
+    ----------
+    directory : Path, optional
+        The directory of the format files. Defaults to a subdirectory of the tex
+        cache of matplotlib.
+    """
+
+    def __init__(self, directory: Path = FORMATDIR) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._failed: set[str] = set()
+        self._original: Any = None
+        self._run: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether matplotlib uses the format files."""
+        return self._original is not None
+
+    def enable(self) -> None:
+        """Makes matplotlib use the format files. Does nothing if already enabled."""
+        if self.enabled:
+            return
+
+        self._original = TexManager.__dict__[_METHOD]
+        self._run = getattr(TexManager, _METHOD)
+
+        def _run_checked_subprocess(
+            cls: type[TexManager],  # noqa: ARG001
+            command: Sequence[str],
+            tex: str,
+            *,
+            cwd: str | None = None,
+        ) -> bytes:
+            return self.run(command, tex, cwd=cwd)
+
+        setattr(TexManager, _METHOD, classmethod(_run_checked_subprocess))
+
+    def disable(self) -> None:
+        """Makes matplotlib load the preamble in every latex run again."""
+        if not self.enabled:
+            return
+
+        setattr(TexManager, _METHOD, self._original)
+        self._original = self._run = None
+
+    def _build(self, fmt: Path) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with TemporaryDirectory(dir=self.directory) as tmpdir:
+            Path(tmpdir, "file.tex").write_text(_tex_source(), encoding="utf-8")
+            self._run(
+                [
+                    "latex",
+                    "-ini",
+                    "-interaction=nonstopmode",
+                    "-halt-on-error",
+                    "-no-shell-escape",
+                    f"-jobname={fmt.stem}",
+                    "&latex",
+                    "mylatexformat.ltx",
+                    "file.tex",
+                ],
+                _preamble(),
+                cwd=tmpdir,
+            )
+            Path(tmpdir, fmt.name).replace(fmt)
+
+    def get(self) -> Path | None:
+        """Returns the format file of the active preamble and builds it if needed.
+
+        Returns
+        -------
+        Path or None
+            The format file, or None if latex is not installed or the format cannot
+            be built.
+        """
+        installation = _installation()
+        if not installation:
+            return None
+
+        key = hashlib.sha256(f"{_preamble()}\n{installation}".encode()).hexdigest()
+        fmt = self.directory / f"latexplotlib-{key[:16]}.fmt"
+        if fmt.stem in self._failed:
+            return None
+
+        with self._lock:
+            if not fmt.exists():
+                try:
+                    self._build(fmt)
+                except RuntimeError as err:
+                    self._failed.add(fmt.stem)
+                    warnings.warn(
+                        f"The latex preamble cannot be precompiled, latex loads the "
+                        f"preamble in every run: {err}",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+                    return None
+
+        return fmt
+
+    def run(self, command: Sequence[str], tex: str, *, cwd: str | None = None) -> bytes:
+        """Runs a command of matplotlib, loading the format file for latex runs."""
+        if command[0] != "latex" or "-ini" in command:
+            return self._run(command, tex, cwd=cwd)  # type: ignore[no-any-return]
+
+        fmt = self.get()
+        if fmt is None:
+            return self._run(command, tex, cwd=cwd)  # type: ignore[no-any-return]
+
+        try:
+            return self._run(  # type: ignore[no-any-return]
+                [command[0], f"-fmt={fmt.with_suffix('')}", *command[1:]],
+                tex,
+                cwd=cwd,
+            )
+        except RuntimeError:
+            # Raises the actual error if the text itself is invalid.
+            report = self._run(command, tex, cwd=cwd)
+            self._failed.add(fmt.stem)
+            return report  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """Removes all format files."""
+        with self._lock:
+            for fmt in self.directory.glob("*.fmt"):
+                fmt.unlink(missing_ok=True)
+            self._failed.clear()
+
+
+tex_formats = TexFormats()
@@ -0,0 +1,80 @@
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
+
+from ._config import Number, size
+
+__all__ = [
+    "map_threaded",
+]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Mode(threading.local):
+    def __init__(self) -> None:
+        self.pyplot = True
+
+
+_mode = _Mode()
+
+
+def uses_pyplot() -> bool:
+    """Returns whether 'lpl.subplots' registers figures in pyplot in this thread."""
+    return _mode.pyplot
+
+
+def _init_worker() -> None:
+    _mode.pyplot = False
+
+
+def _run(func: Callable[[T], R], width: Number, height: Number, item: T) -> R:
+    # Every task starts with the size of the caller, even if an earlier task on the
+    # same thread called 'lpl.size.set'.
+    with size.context(width, height):
+        return func(item)
+
+
+def map_threaded(
+    func: Callable[[T], R], iterable: Iterable[T], *, max_workers: int | None = None
+) -> list[R]:
+    """Calls a function for every item in a thread pool and returns the results.
+
+    pyplot is not thread-safe, so in the threads of the pool 'lpl.subplots' creates
+    figures that are not registered in pyplot. They need not be closed and are
+    freed as soon as they are no longer used; 'plt.gcf()', 'plt.show()' and similar
+    functions do not know them. Every call starts with the current 'lpl.size', and
+    'lpl.size.set' and 'lpl.size.context' only affect the call that uses them.
+
+    The rcParams are shared by all threads, so the style must be set before and not
+    changed while the pool runs.
+
+        def plot(data):
+            fig, ax = lpl.subplots(1, 1)
+            ax.plot(data)
+            fig.savefig(f"{data.name}.pdf")
+
+        lpl.map_threaded(plot, datasets)
+
+    Parameters
+    ----------
+    func : callable
+        The function, called with one item at a time.
+    iterable : iterable
+        The items.
+    max_workers : int, optional
+        The number of threads. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    list
+        The results, in the order of the items.
+    """
+    with ThreadPoolExecutor(
+        max_workers, thread_name_prefix="latexplotlib", initializer=_init_worker
+    ) as pool:
+        return list(pool.map(partial(_run, func, *size.get()), iterable))
@@ -0,0 +1,113 @@
+"""The client of the latexplotlib server, see 'latexplotlib._server'.
+
+Sending a script to the server only takes a line of json, so this module does not
+import matplotlib or latexplotlib. The 'latexplotlib' command handles 'build' and
+'stop' here and passes all other commands to 'latexplotlib._cli'.
+"""
+
+import argparse
+import json
+import socket
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from appdirs import user_config_dir
+
+__all__ = [
+    "HOST",
+    "SERVERFILE",
+    "add_build_arguments",
+    "build",
+    "main",
+    "report",
+    "send",
+    "stop",
+]
+
+HOST: str = "127.0.0.1"
+# The same file as 'latexplotlib._server.SERVERFILE'.
+SERVERFILE: Path = Path(user_config_dir("latexplotlib")) / "server.json"
+
+
+def send(request: dict[str, Any], serverfile: Path | None = None) -> dict[str, Any]:
+    """Sends a request to the running server and returns its response."""
+    serverfile = serverfile or SERVERFILE
+    if not serverfile.exists():
+        msg = "no latexplotlib server is running, start one with 'latexplotlib serve'"
+        raise RuntimeError(msg)
+
+    with serverfile.open(encoding="utf-8") as fh:
+        info = json.load(fh)
+
+    with (
+        socket.create_connection((HOST, info["port"])) as sock,
+        sock.makefile("rwb") as fh,
+    ):
+        fh.write(json.dumps({**request, "token": info["token"]}).encode() + b"\n")
+        fh.flush()
+        response: dict[str, Any] = json.loads(fh.readline())
+
+    return response
+
+
+def build(
+    script: Path, argv: Sequence[str] = (), serverfile: Path | None = None
+) -> dict[str, Any]:
+    """Runs a figure script in the running server.
+
+    Returns
+    -------
+    dict
+        The script, the files it saved, the time it took and an optional error,
+        like `latexplotlib._runner.Result`.
+    """
+    response = send(
+        {"script": str(script.resolve()), "args": list(argv), "cwd": str(Path.cwd())},
+        serverfile,
+    )
+    if set(response) == {"error"}:
+        raise RuntimeError(response["error"])
+
+    return response
+
+
+def stop(serverfile: Path | None = None) -> None:
+    """Stops the running server."""
+    send({"command": "stop"}, serverfile)
+
+
+def report(result: dict[str, Any]) -> int:
+    """Prints the saved files and the time of a build and returns the exit code."""
+    for output in result["outputs"]:
+        sys.stdout.write(f"{output}\n")
+    sys.stdout.write(f"{result['script']}: {1000 * result['seconds']:.0f}ms\n")
+
+    if result["error"] is not None:
+        sys.stderr.write(result["error"])
+        return 1
+    return 0
+
+
+def add_build_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("script", type=Path)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """The 'latexplotlib' command."""
+    args = list(sys.argv[1:] if argv is None else argv)
+
+    if args[:1] == ["build"]:
+        parser = argparse.ArgumentParser(prog="latexplotlib build")
+        add_build_arguments(parser)
+        parsed = parser.parse_args(args[1:])
+        return report(build(parsed.script, parsed.args))
+    if args == ["stop"]:
+        stop()
+        return 0
+
+    from latexplotlib._cli import main as cli_main  # noqa: PLC0415
+
+    return cli_main(args)
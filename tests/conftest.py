@@ -1,3 +1,4 @@
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import pytest
 
@@ -12,6 +13,12 @@ def _close_plots():
     plt.close("all")
 
 
+@pytest.fixture
+def _no_tex():
+    with mpl.rc_context({"text.usetex": False}):
+        yield
+
+
 @pytest.fixture
 def _show(pytestconfig):
     yield
@@ -1,4 +1,5 @@
 import json
+import threading
 
 import pytest
 
@@ -136,6 +137,89 @@ class TestConfig:
         config["skyscraper"] = "apple"
         assert config["skyscraper"] == "apple"
 
+    def test_reload_increments_generation(self, config):
+        generation = config.generation
+        config.reload()
+        assert config.generation == generation + 1
+
+
+class TestConfigPoll:
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "config.ini"
+        path.write_text(json.dumps({"width": 1}), encoding="utf-8")
+        return path
+
+    @pytest.fixture
+    def config(self, path):
+        return cfg.Config(path, poll_interval=0)
+
+    def change(self, path, value):
+        path.write_text(json.dumps({"width": value, "height": 2}), encoding="utf-8")
+
+    def test_detects_change(self, config, path):
+        self.change(path, 100)
+
+        assert config["width"] == 100  # noqa: PLR2004
+        assert config.generation == 1
+
+    def test_no_change_no_read(self, config, mocker):
+        open_ = mocker.spy(config, "_open")
+
+        config.poll()
+        config.poll()
+
+        open_.assert_not_called()
+        assert config.generation == 0
+
+    def test_interval(self, config, path):
+        config.poll_interval = 3600
+        config._checked = cfg.time.monotonic()
+        self.change(path, 100)
+
+        assert config["width"] == 1
+        assert config.generation == 0
+
+    def test_own_write_not_reloaded(self, config, mocker):
+        config["width"] = 5
+        open_ = mocker.spy(config, "_open")
+
+        config.poll()
+
+        open_.assert_not_called()
+
+    def test_invalid_file_keeps_config(self, config, path):
+        path.write_text('{"width": 1', encoding="utf-8")
+
+        assert config["width"] == 1
+        assert config.generation == 0
+
+        self.change(path, 100)
+        assert config["width"] == 100  # noqa: PLR2004
+
+    def test_write_is_atomic(self, config, path, mocker):
+        replace = mocker.spy(cfg.Path, "replace")
+
+        config["width"] = 5
+
+        replace.assert_called_once()
+        assert json.loads(path.read_text(encoding="utf-8"))["width"] == 5  # noqa: PLR2004
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def test_write_error_removes_tmp(self, config, path, mocker):
+        mocker.patch.object(cfg.json, "dump", side_effect=TypeError("not json"))
+
+        with pytest.raises(TypeError, match="not json"):
+            config["width"] = 5
+
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def test_deleted(self, config, path):
+        path.unlink()
+
+        assert config["width"] == 1
+        assert config.generation == 0
+
 
 def test_config_path():
     assert cfg.config.path == cfg.CONFIGPATH
@@ -154,9 +238,13 @@ class TestSize:
     def _patch_config(self, height, width, monkeypatch, mocker):
         d = {"width": width, "height": height}
         config = mocker.MagicMock(
-            __getitem__=lambda _, v: d.__getitem__(v), reload=mocker.MagicMock()
+            __getitem__=lambda _, v: d.__getitem__(v),
+            reload=mocker.MagicMock(),
+            generation=0,
         )
         monkeypatch.setattr(cfg, "config", config)
+        self.d = d
+        return config
 
     @pytest.fixture
     def size(self):
@@ -175,6 +263,16 @@ class TestSize:
         size.set(43, 44)
         assert size.get() == (43, 44)
 
+    def test_set_persists(self, size):
+        size.set(43, 44)
+        cfg.config.__setitem__.assert_any_call("width", 43)
+        cfg.config.__setitem__.assert_any_call("height", 44)
+
+    def test_set_no_persist(self, size):
+        size.set(43, 44, persist=False)
+        assert size.get() == (43, 44)
+        cfg.config.__setitem__.assert_not_called()
+
     def test_reload(self, size):
         cur = size.get()
 
@@ -193,6 +291,80 @@ class TestSize:
 
         assert size.get() == (10, 20)
 
+    def test_context_restores_on_error(self, size):
+        def fail():
+            with size.context(44, 43):
+                msg = "inside"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="inside"):
+            fail()
+
+        assert size.get() == (10, 20)
+
+    def test_get_polls(self, size):
+        size.get()
+        cfg.config.poll.assert_called_once()
+
+    def test_get_picks_up_change(self, size):
+        self.d["width"] = 11
+        cfg.config.generation = 1
+
+        assert size.get() == (11, 20)
+
+    def test_get_ignores_change_in_context(self, size):
+        with size.context(44, 43):
+            self.d["width"] = 11
+            cfg.config.generation = 1
+
+            assert size.get() == (44, 43)
+            cfg.config.poll.assert_not_called()
+
+        assert size.get() == (11, 20)
+
+    def test_set_in_context(self, size):
+        with size.context(44, 43):
+            size.set(1, 2, persist=False)
+            assert size.get() == (1, 2)
+
+        assert size.get() == (10, 20)
+
+    def test_context_is_thread_local(self, size):
+        results = []
+
+        with size.context(44, 43):
+            thread = threading.Thread(target=lambda: results.append(size.get()))
+            thread.start()
+            thread.join()
+
+        assert results == [(10, 20)]
+
+    def test_set_no_persist_ignores_change(self, size):
+        size.set(43, 44, persist=False)
+        self.d["width"] = 11
+        cfg.config.generation = 1
+
+        assert size.get() == (43, 44)
+
+    def test_set_persist_unpins(self, size):
+        size.set(43, 44, persist=False)
+        size.set(45, 46)
+        self.d["width"] = 11
+        cfg.config.generation = 1
+
+        assert size.get() == (11, 20)
+
+    def test_reload_unpins(self, size):
+        size.set(43, 44, persist=False)
+
+        size.reload()
+
+        assert size.get() == (10, 20)
+
+    def test_set_then_no_change(self, size):
+        size.set(43, 44, persist=False)
+        assert size.get() == (43, 44)
+
     def test_str(self, size):
         str(size)
 
@@ -1,4 +1,5 @@
 import matplotlib as mpl
+import numpy as np
 import pytest
 
 from latexplotlib import _latexplotlib as lpl
@@ -26,6 +27,83 @@ def test_inches_to_pt_and_back(val):
     assert val == lpl.convert_inches_to_pt(lpl.convert_pt_to_inches(val))
 
 
+class TestConvertLengths:
+    @pytest.fixture
+    def values(self):
+        return np.random.default_rng(0).uniform(-100, 1000, size=(20, 50))
+
+    def test_pt_to_inches(self, values):
+        result = lpl.convert_lengths(values)
+
+        assert result.shape == values.shape
+        assert result.tolist() == [
+            [lpl.convert_pt_to_inches(val) for val in row] for row in values.tolist()
+        ]
+
+    def test_inches_to_pt(self, values):
+        result = lpl.convert_lengths(values, "in", "pt")
+
+        assert result.tolist() == [
+            [lpl.convert_inches_to_pt(val) for val in row] for row in values.tolist()
+        ]
+
+    @pytest.mark.parametrize(
+        ("length", "expected"),
+        [
+            ("345.0pt", 345.0),
+            (" 1pc ", 12.0),
+            ("1157dd", 1238.0),
+            ("1cc", 12 * 1238 / 1157),
+            ("65536sp", 1.0),
+            ("-.5em", -5.0),
+            ("1ex", 4.30554),
+            ("1e1pt", 10.0),
+            ("72bp", lpl.convert_inches_to_pt(1.0)),
+            ("2.54cm", lpl.convert_inches_to_pt(1.0)),
+            ("25.4mm", lpl.convert_inches_to_pt(1.0)),
+            ("7", 7.0),
+        ],
+    )
+    def test_to_pt(self, length, expected):
+        result = lpl.convert_lengths(length, to="pt", fontsize=10)
+
+        assert result.shape == ()
+        assert result == pytest.approx(expected)
+
+    @pytest.mark.parametrize("unit", lpl.UNITS)
+    def test_round_trip(self, values, unit):
+        converted = lpl.convert_lengths(values, "pt", unit)
+
+        np.testing.assert_allclose(lpl.convert_lengths(converted, unit, "pt"), values)
+
+    def test_strings(self):
+        result = lpl.convert_lengths([["345.0pt", "1in"], ["12", "2.54cm"]], "bp", "in")
+
+        np.testing.assert_allclose(
+            result, [[lpl.convert_pt_to_inches(345.0), 1], [12 / 72, 1]]
+        )
+
+    def test_fontsize(self):
+        with mpl.rc_context({"font.size": 11}):
+            assert lpl.convert_lengths([2], "em", "pt") == [22]
+
+        assert lpl.convert_lengths([22], "pt", "em", fontsize=11) == [2]
+
+    @pytest.mark.parametrize(("unit", "to"), [("px", "in"), ("pt", "m")])
+    def test_unknown_unit(self, unit, to):
+        with pytest.raises(ValueError, match="unknown unit"):
+            lpl.convert_lengths([1], unit, to)
+
+    def test_unknown_unit_in_string(self):
+        with pytest.raises(ValueError, match="unknown unit in"):
+            lpl.convert_lengths(["1pt", "1px"])
+
+    @pytest.mark.parametrize("length", ["pt", "1 2pt", "1.2.3pt", "1ptx"])
+    def test_invalid_length(self, length):
+        with pytest.raises(ValueError, match="invalid length"):
+            lpl.convert_lengths(length)
+
+
 class TestFigsize:
     @pytest.fixture(autouse=True)
     def _set_size(self, monkeypatch, mocker, width, height):
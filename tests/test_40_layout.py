@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from latexplotlib import _latexplotlib as lpl
+from latexplotlib import _layout as layout
+
+GOLDEN_RATIO = (5**0.5 + 1) / 2
+
+
+@pytest.fixture(autouse=True)
+def _set_size(monkeypatch, mocker):
+    size = mocker.MagicMock()
+    size.get = mocker.MagicMock(return_value=(400, 300))
+    monkeypatch.setattr(layout, "size", size)
+    monkeypatch.setattr(lpl, "size", size)
+
+
+def axes_area(nrows, ncols, scale, aspect):
+    width, height = lpl.figsize(nrows, ncols, scale=scale, aspect=aspect)
+    return width * height / (nrows * ncols)
+
+
+@pytest.mark.parametrize("nrows", [1, 2, 5])
+@pytest.mark.parametrize("ncols", [1, 3, 4])
+@pytest.mark.parametrize("aspect", [0.5, 1.0, GOLDEN_RATIO, 3.0])
+@pytest.mark.parametrize("scale", [0.5, 1.0, 1.5])
+def test__figsize_matches_figsize(nrows, ncols, aspect, scale):
+    width, height = layout._figsize(
+        np.array([nrows]), np.array([ncols]), scale, np.array([aspect])
+    )
+
+    assert (width[0], height[0]) == pytest.approx(
+        lpl.figsize(nrows, ncols, scale=scale, aspect=aspect)
+    )
+
+
+class TestAutofit:
+    @pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 12, 30])
+    @pytest.mark.parametrize(
+        ("min_aspect", "max_aspect"), [(1.0, GOLDEN_RATIO), (0.5, 3.0)]
+    )
+    def test_optimal(self, n, min_aspect, max_aspect):
+        result = layout.autofit(n, min_aspect=min_aspect, max_aspect=max_aspect)
+
+        assert result.nrows * result.ncols >= n
+        assert min_aspect <= result.aspect <= max_aspect
+
+        best = axes_area(result.nrows, result.ncols, result.scale, result.aspect)
+        for ncols in range(1, n + 1):
+            nrows = -(-n // ncols)
+            for aspect in np.linspace(min_aspect, max_aspect, 25):
+                assert axes_area(nrows, ncols, 1.0, aspect) <= best + 1e-9
+
+    def test_single(self):
+        assert layout.autofit(1, min_aspect=GOLDEN_RATIO) == (1, 1, GOLDEN_RATIO, 1.0)
+
+    @pytest.mark.parametrize("max_ncols", [1, 2, 3])
+    def test_max_ncols(self, max_ncols):
+        assert layout.autofit(20, max_ncols=max_ncols).ncols <= max_ncols
+
+    @pytest.mark.parametrize("scale", [0.5, 1.0, 2.0])
+    def test_scale(self, scale):
+        assert layout.autofit(4, scale=scale).scale == scale
+
+    @pytest.mark.parametrize("n", [100, 500])
+    def test_many(self, n):
+        result = layout.autofit(n)
+        assert result.nrows * result.ncols >= n
+
+    @pytest.mark.parametrize("n", [0, -1])
+    def test_invalid_n(self, n):
+        with pytest.raises(ValueError, match="'n' must be at least 1"):
+            layout.autofit(n)
+
+    def test_negative_scale(self):
+        with pytest.raises(ValueError, match="'scale' must be positive"):
+            layout.autofit(1, scale=-1)
+
+    @pytest.mark.parametrize(("min_aspect", "max_aspect"), [(0, 1), (2, 1)])
+    def test_invalid_aspect(self, min_aspect, max_aspect):
+        with pytest.raises(ValueError, match="'min_aspect' must be positive"):
+            layout.autofit(1, min_aspect=min_aspect, max_aspect=max_aspect)
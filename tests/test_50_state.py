@@ -0,0 +1,80 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+
+import latexplotlib as lpl
+from latexplotlib import _state as state
+
+
+def get_state():
+    return lpl.size.get(), mpl.rcParams["font.size"], mpl.rcParams["text.usetex"]
+
+
+@pytest.fixture
+def size(monkeypatch, mocker):
+    size = mocker.MagicMock()
+    size.get = mocker.MagicMock(return_value=(400, 300))
+    monkeypatch.setattr(state, "size", size)
+    return size
+
+
+@pytest.fixture
+def _style():
+    with plt.style.context("latex10pt"):
+        yield
+
+
+@pytest.mark.usefixtures("size", "_style")
+class TestSnapshot:
+    def test_size(self):
+        snapshot = state.snapshot()
+
+        assert (snapshot.width, snapshot.height) == (400, 300)
+
+    def test_rcparams(self):
+        snapshot = state.snapshot()
+
+        assert snapshot.rcparams["text.usetex"] is True
+        assert snapshot.rcparams["font.size"] == mpl.rcParams["font.size"]
+
+    def test_ignores_unchanged(self):
+        snapshot = state.snapshot()
+
+        assert "image.cmap" not in snapshot.rcparams
+
+    def test_ignores_backend(self):
+        with mpl.rc_context({"backend": "pdf"}):
+            snapshot = state.snapshot()
+
+        assert "backend" not in snapshot.rcparams
+
+    def test_picklable(self):
+        snapshot = state.snapshot()
+
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot  # noqa: S301
+
+
+def test_restore(size):
+    snapshot = state.Snapshot(200, 100, {"font.size": 3.0})
+
+    with mpl.rc_context():
+        state.restore(snapshot)
+        assert mpl.rcParams["font.size"] == snapshot.rcparams["font.size"]
+
+    size.set.assert_called_once_with(200, 100, persist=False)
+
+
+@pytest.mark.usefixtures("_style")
+def test_process_pool():
+    with lpl.size.context(123, 456):
+        snapshot = lpl.snapshot()
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        1, mp_context=context, initializer=lpl.restore, initargs=(snapshot,)
+    ) as pool:
+        assert pool.submit(get_state).result() == ((123, 456), 8.0, True)
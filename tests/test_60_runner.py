@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+
+from latexplotlib import _runner as runner
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture
+def script(tmp_path):
+    script = tmp_path / "figure.py"
+    script.write_text(
+        "import sys\n"
+        "import matplotlib as mpl\n"
+        "import latexplotlib as lpl\n"
+        "mpl.rcParams['font.size'] = 3\n"
+        "lpl.size.set(100, 100, persist=False)\n"
+        "fig, ax = lpl.subplots()\n"
+        "fig.savefig(sys.argv[1])\n"
+        "fig.savefig(sys.argv[1] + '.png')\n",
+        encoding="utf-8",
+    )
+    return script
+
+
+@pytest.mark.parametrize(
+    ("fname", "kwargs", "expected"),
+    [
+        ("a.png", {}, "a.png"),
+        ("a", {}, "a.pdf"),
+        ("a", {"format": "svg"}, "a.svg"),
+        (Path("a.pdf"), {"format": "png"}, "a.pdf"),
+    ],
+)
+def test__output_path(fname, kwargs, expected):
+    with mpl.rc_context({"savefig.format": "pdf"}):
+        assert runner._output_path(fname, kwargs) == Path(expected).resolve()
+
+
+def test__output_path_file_object():
+    assert runner._output_path(object(), {}) is None
+
+
+class TestRunScript:
+    def test_outputs(self, script, tmp_path):
+        with mpl.rc_context({"savefig.format": "pdf"}):
+            result = runner.run_script(script, ["out"], cwd=tmp_path)
+
+        assert result.error is None
+        assert result.script == str(script)
+        assert result.outputs == [str(tmp_path / "out.pdf"), str(tmp_path / "out.png")]
+        assert (tmp_path / "out.pdf").exists()
+        assert result.seconds > 0
+
+    def test_relative_to_cwd(self, script, tmp_path):
+        result = runner.run_script(Path(script.name), ["out"], cwd=tmp_path)
+
+        assert result.error is None
+        assert result.script == str(script)
+
+    def test_imports_sibling_modules(self, tmp_path):
+        script = tmp_path / "sibling.py"
+        script.write_text("import helpers\nhelpers.check()\n", encoding="utf-8")
+        helpers = tmp_path / "helpers.py"
+        helpers.write_text("def check():\n    pass\n", encoding="utf-8")
+
+        assert runner.run_script(script, cwd=tmp_path).error is None
+        assert "helpers" not in sys.modules
+        assert str(tmp_path) not in sys.path
+
+        helpers.write_text("def check():\n    raise KeyError\n", encoding="utf-8")
+
+        assert "KeyError" in runner.run_script(script, cwd=tmp_path).error
+
+    def test_restores_state(self, script, tmp_path):
+        size, font_size = runner.size.get(), mpl.rcParams["font.size"]
+        cwd = Path.cwd()
+
+        runner.run_script(script, ["out"], cwd=tmp_path)
+
+        assert runner.size.get() == size
+        assert mpl.rcParams["font.size"] == font_size
+        assert Path.cwd() == cwd
+        assert not plt.get_fignums()
+
+    def test_records_error(self, script, tmp_path):
+        result = runner.run_script(script, cwd=tmp_path)
+
+        assert "IndexError" in result.error
+
+    def test_records_exit(self, tmp_path):
+        script = tmp_path / "exit.py"
+        script.write_text("raise SystemExit(3)\n", encoding="utf-8")
+
+        result = runner.run_script(script, cwd=tmp_path)
+
+        assert "SystemExit" in result.error
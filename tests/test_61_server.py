@@ -0,0 +1,196 @@
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import latexplotlib_client as client
+from latexplotlib import _server as server
+from latexplotlib._config import CONFIGDIR
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def serverfile(tmp_path, monkeypatch):
+    serverfile = tmp_path / "config" / "server.json"
+    monkeypatch.setattr(server, "SERVERFILE", serverfile)
+    return serverfile
+
+
+@pytest.fixture
+def token():
+    return "0123456789abcdef"
+
+
+@pytest.fixture
+def running(mocker, serverfile, token):
+    mocker.patch("latexplotlib._server.secrets.token_hex", return_value=token)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+
+    while not serverfile.exists():
+        thread.join(0.01)
+
+    yield thread
+
+    if thread.is_alive():
+        server.stop()
+    thread.join()
+
+
+@pytest.fixture
+def script(tmp_path):
+    script = tmp_path / "figure.py"
+    script.write_text(
+        "import latexplotlib as lpl\n"
+        "fig, ax = lpl.subplots()\n"
+        "fig.savefig('out.png')\n",
+        encoding="utf-8",
+    )
+    return script
+
+
+@pytest.mark.usefixtures("running")
+class TestServer:
+    def test_serverfile(self, serverfile, token):
+        assert json.loads(serverfile.read_text())["token"] == token
+        assert stat.S_IMODE(serverfile.stat().st_mode) == 0o600  # noqa: PLR2004
+
+    def test_build(self, script, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        result = server.build(script)
+
+        assert result.error is None
+        assert result.outputs == [str(tmp_path / "out.png")]
+        assert (tmp_path / "out.png").exists()
+
+    def test_build_twice(self, script, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        first, second = server.build(script), server.build(script)
+
+        assert first.outputs == second.outputs
+        assert second.error is None
+
+    def test_invalid_token(self, serverfile):
+        port = json.loads(serverfile.read_text())["port"]
+
+        with (
+            socket.create_connection((server.HOST, port)) as sock,
+            sock.makefile("rwb") as fh,
+        ):
+            fh.write(b'{"token": "wrong", "command": "stop"}\n')
+            fh.flush()
+            assert json.loads(fh.readline()) == {"error": "invalid token"}
+
+    def test_malformed_request(self):
+        response = server._send({"nothing": None})
+
+        assert response["error"].startswith("invalid request")
+
+    def test_invalid_cwd(self, script, tmp_path):
+        response = server._send({"script": str(script), "cwd": str(tmp_path / "no")})
+
+        assert response["error"].startswith("invalid request")
+
+    def test_handles_requests_after_invalid_cwd(self, script, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        server._send({"script": str(script), "cwd": str(tmp_path / "no")})
+
+        assert server.build(script).error is None
+
+    def test_stop(self, running, serverfile):
+        server.stop()
+        running.join()
+
+        assert not serverfile.exists()
+
+
+def test_build_error_response(mocker):
+    mocker.patch.object(client, "send", return_value={"error": "invalid"})
+
+    with pytest.raises(RuntimeError, match="invalid"):
+        server.build(mocker.MagicMock())
+
+
+def test_client_serverfile():
+    assert client.SERVERFILE == CONFIGDIR / "server.json"
+
+
+class TestClientMain:
+    @pytest.fixture
+    def response(self):
+        return {"script": "figure.py", "outputs": ["out.pdf"], "seconds": 0.1234}
+
+    def test_build(self, mocker, response, capsys):
+        build = mocker.patch.object(client, "build", return_value=response)
+        response["error"] = None
+
+        assert client.main(["build", "figure.py", "a", "--b"]) == 0
+
+        assert build.call_args.args == (Path("figure.py"), ["a", "--b"])
+        assert capsys.readouterr().out == "out.pdf\nfigure.py: 123ms\n"
+
+    def test_build_error(self, mocker, response, capsys):
+        mocker.patch.object(client, "build", return_value={**response, "error": "X"})
+
+        assert client.main(["build", "figure.py"]) == 1
+        assert capsys.readouterr().err == "X"
+
+    def test_stop(self, mocker):
+        stop = mocker.patch.object(client, "stop")
+
+        assert client.main(["stop"]) == 0
+        stop.assert_called_once_with()
+
+    def test_other_commands(self, mocker):
+        main = mocker.patch("latexplotlib._cli.main", return_value=3)
+        mocker.patch.object(client.sys, "argv", ["latexplotlib", "render", "-f"])
+
+        assert client.main() == 3  # noqa: PLR2004
+        main.assert_called_once_with(["render", "-f"])
+
+
+@pytest.mark.usefixtures("running")
+def test_client_does_not_import_matplotlib(serverfile, script, tmp_path):
+    # The client finds the server file in XDG_CONFIG_HOME.
+    config = tmp_path / "xdg" / "latexplotlib"
+    config.mkdir(parents=True)
+    (config / "server.json").write_bytes(serverfile.read_bytes())
+    code = (
+        "import sys, latexplotlib_client\n"
+        "code = latexplotlib_client.main(['build', sys.argv[1]])\n"
+        "assert 'matplotlib' not in sys.modules, 'matplotlib'\n"
+        "assert 'latexplotlib' not in sys.modules, 'latexplotlib'\n"
+        "raise SystemExit(code)\n"
+    )
+
+    def run(*args):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, *args],
+            check=True,
+            cwd=tmp_path,
+            env={**os.environ, "XDG_CONFIG_HOME": str(tmp_path / "xdg")},
+            capture_output=True,
+        )
+        return time.perf_counter() - start
+
+    client_seconds = run("-c", code, str(script))
+    import_seconds = run("-c", "import matplotlib.pyplot")
+
+    assert (tmp_path / "out.png").exists()
+    assert client_seconds < import_seconds
+
+
+def test_no_server():
+    with pytest.raises(RuntimeError, match="no latexplotlib server is running"):
+        server.stop()
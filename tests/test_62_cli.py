@@ -0,0 +1,110 @@
+import runpy
+from pathlib import Path
+
+import matplotlib as mpl
+import pytest
+
+from latexplotlib import _cli as cli
+from latexplotlib._runner import Result
+
+
+@pytest.fixture
+def result():
+    return Result("figure.py", ["out.pdf"], 0.1234)
+
+
+def test_serve(mocker):
+    serve = mocker.patch("latexplotlib._cli.serve")
+
+    assert cli.main(["serve", "--port", "1234"]) == 0
+    serve.assert_called_once_with(1234)
+
+
+def test_build(mocker, result, capsys):
+    build = mocker.patch("latexplotlib._cli.build", return_value=result)
+
+    assert cli.main(["build", "figure.py", "a", "--b"]) == 0
+
+    build.assert_called_once()
+    assert build.call_args.args[1] == ["a", "--b"]
+    assert capsys.readouterr().out == "out.pdf\nfigure.py: 123ms\n"
+
+
+def test_build_error(mocker, result, capsys):
+    mocker.patch("latexplotlib._cli.build", return_value=result._replace(error="X"))
+
+    assert cli.main(["build", "figure.py"]) == 1
+    assert capsys.readouterr().err == "X"
+
+
+def test_stop(mocker):
+    stop = mocker.patch("latexplotlib._cli.stop")
+
+    assert cli.main(["stop"]) == 0
+    stop.assert_called_once_with()
+
+
+def test_requires_command():
+    with pytest.raises(SystemExit):
+        cli.main([])
+
+
+def test_module(mocker):
+    main = mocker.patch("latexplotlib._cli.main", return_value=0)
+
+    with pytest.raises(SystemExit):
+        runpy.run_module("latexplotlib", run_name="__main__")
+
+    main.assert_called_once_with()
+
+
+class TestRender:
+    @pytest.fixture
+    def render(self, mocker, result):
+        return mocker.patch(
+            "latexplotlib._cli.render",
+            return_value=[(result, False), (result._replace(seconds=0.0), True)],
+        )
+
+    @pytest.fixture(autouse=True)
+    def _restore(self):
+        with mpl.rc_context(), cli.size.context(*cli.size.get()):
+            yield
+
+    def test_defaults(self, render, capsys):
+        assert cli.main(["render"]) == 0
+
+        directory, profile = render.call_args.args
+        assert directory == Path()
+        assert profile == {"style": None, "size": list(cli.size.get())}
+        assert render.call_args.kwargs == {"jobs": 1, "force": False}
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split() == ["figure.py", "built", "123ms"]
+        assert lines[1].split() == ["figure.py", "skipped", "-"]
+        assert lines[2].split() == ["total", "123ms"]
+
+    def test_options(self, render):
+        cli.main(
+            ["render", "figs", "-s", "latex10pt", "--size", "100", "200", "-j3", "-f"]
+        )
+
+        directory, profile = render.call_args.args
+        assert directory == Path("figs")
+        assert profile == {"style": ["latex10pt"], "size": [100, 200]}
+        assert mpl.rcParams["text.usetex"]
+        assert render.call_args.kwargs == {"jobs": 3, "force": True}
+
+    @pytest.mark.parametrize("jobs", ["0", "-2", "x"])
+    def test_invalid_jobs(self, render, jobs, capsys):
+        with pytest.raises(SystemExit):
+            cli.main(["render", "-j", jobs])
+
+        render.assert_not_called()
+        assert "--jobs" in capsys.readouterr().err
+
+    def test_failed(self, render, result, capsys):
+        render.return_value = [(result._replace(error="X"), False)]
+
+        assert cli.main(["render"]) == 1
+        assert capsys.readouterr().err == "figure.py:\nX"
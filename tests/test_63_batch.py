@@ -0,0 +1,185 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from latexplotlib import _batch as batch
+from latexplotlib._runner import Result
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture
+def profile():
+    return {"style": None, "size": [400, 300]}
+
+
+@pytest.fixture
+def directory(tmp_path):
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.py").write_text(
+            "import latexplotlib as lpl\n"
+            "fig, ax = lpl.subplots()\n"
+            f"fig.savefig('{name}.png')\n",
+            encoding="utf-8",
+        )
+    (tmp_path / "_helper.py").write_text("", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    return tmp_path
+
+
+def make_old(path):
+    os.utime(path, (0, 0))
+
+
+def test_discover(directory):
+    assert batch.discover(directory) == [directory / "a.py", directory / "b.py"]
+
+
+class TestManifest:
+    def test_missing(self, tmp_path):
+        assert batch._load_manifest(tmp_path) == {}
+
+    def test_invalid(self, tmp_path):
+        (tmp_path / batch.MANIFEST).write_text("{", encoding="utf-8")
+        assert batch._load_manifest(tmp_path) == {}
+
+    def test_roundtrip(self, tmp_path):
+        manifest = {"a.py": {"profile": {}, "outputs": []}}
+        batch._write_manifest(tmp_path, manifest)
+        assert batch._load_manifest(tmp_path) == manifest
+
+
+class TestIsUpToDate:
+    @pytest.fixture
+    def script(self, tmp_path):
+        script = tmp_path / "a.py"
+        script.touch()
+        make_old(script)
+        return script
+
+    @pytest.fixture
+    def output(self, tmp_path):
+        output = tmp_path / "a.pdf"
+        output.touch()
+        return output
+
+    @pytest.fixture
+    def entry(self, profile, output):
+        return {"profile": profile, "outputs": [str(output)]}
+
+    def test_up_to_date(self, script, entry, profile):
+        assert batch._is_up_to_date(script, entry, profile)
+
+    def test_no_entry(self, script, profile):
+        assert not batch._is_up_to_date(script, None, profile)
+
+    def test_no_outputs(self, script, entry, profile):
+        assert not batch._is_up_to_date(script, {**entry, "outputs": []}, profile)
+
+    def test_no_outputs_unchanged(self, script, entry, profile):
+        entry = {**entry, "outputs": [], "mtime": script.stat().st_mtime_ns}
+        assert batch._is_up_to_date(script, entry, profile)
+
+        script.touch()
+        assert not batch._is_up_to_date(script, entry, profile)
+
+    def test_other_profile(self, script, entry, profile):
+        assert not batch._is_up_to_date(script, entry, {**profile, "style": "a"})
+
+    def test_output_missing(self, script, entry, profile, output):
+        output.unlink()
+        assert not batch._is_up_to_date(script, entry, profile)
+
+    def test_output_older(self, script, entry, profile, output):
+        script.touch()
+        make_old(output)
+        assert not batch._is_up_to_date(script, entry, profile)
+
+
+class TestRender:
+    def test_builds(self, directory, profile):
+        results = batch.render(directory, profile)
+
+        assert [skipped for _, skipped in results] == [False, False]
+        assert all(result.error is None for result, _ in results)
+        assert (directory / "a.png").exists()
+        assert (directory / "b.png").exists()
+
+    def test_skips_up_to_date(self, directory, profile):
+        batch.render(directory, profile)
+        make_old(directory / "a.py")
+        make_old(directory / "b.png")
+
+        results = batch.render(directory, profile)
+
+        assert [skipped for _, skipped in results] == [True, False]
+        assert results[0][0].outputs == [str(directory / "a.png")]
+
+    def test_relative_directory(self, directory, profile, monkeypatch):
+        monkeypatch.chdir(directory.parent)
+
+        results = batch.render(Path(directory.name), profile)
+
+        assert all(result.error is None for result, _ in results)
+        assert results[0][0].script == str(directory / "a.py")
+        assert (directory / "a.png").exists()
+
+    def test_helper_modules(self, directory, profile):
+        (directory / "helpers.py").write_text("X = 1\n", encoding="utf-8")
+        batch.render(directory, profile)
+        make_old(directory / "a.py")
+        make_old(directory / "b.py")
+
+        results = batch.render(directory, profile)
+
+        assert [Path(result.script).name for result, _ in results] == ["a.py", "b.py"]
+        assert all(skipped for _, skipped in results)
+
+    def test_failed_helper_module(self, directory, profile):
+        (directory / "helpers.py").write_text("raise KeyError\n", encoding="utf-8")
+
+        results = batch.render(directory, profile)
+
+        assert "KeyError" in results[2][0].error
+
+    def test_force(self, directory, profile):
+        batch.render(directory, profile)
+        make_old(directory / "a.py")
+
+        results = batch.render(directory, profile, force=True)
+
+        assert [skipped for _, skipped in results] == [False, False]
+
+    def test_failed_not_in_manifest(self, directory, profile):
+        (directory / "a.py").write_text("raise ValueError\n", encoding="utf-8")
+
+        results = batch.render(directory, profile)
+
+        assert "ValueError" in results[0][0].error
+        manifest = json.loads((directory / batch.MANIFEST).read_text())
+        assert "a.py" not in manifest
+        assert "b.py" in manifest
+
+    def test_parallel(self, directory, profile, mocker):
+        pool = mocker.patch("latexplotlib._batch.ProcessPoolExecutor")
+        pool.return_value.__enter__.return_value.map = map
+
+        results = batch.render(directory, profile, jobs=2)
+
+        pool.assert_called_once()
+        assert pool.call_args.args == (2,)
+        assert pool.call_args.kwargs["initializer"] is batch.restore
+        assert all(result.error is None for result, _ in results)
+
+
+def test_skipped_result(directory, profile):
+    batch.render(directory, profile)
+    make_old(directory / "a.py")
+    make_old(directory / "b.py")
+
+    assert batch.render(directory, profile) == [
+        (Result(str(directory / "a.py"), [str(directory / "a.png")], 0.0), True),
+        (Result(str(directory / "b.py"), [str(directory / "b.png")], 0.0), True),
+    ]
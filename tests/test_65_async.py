@@ -0,0 +1,147 @@
+import asyncio
+import subprocess
+import sys
+import threading
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+
+import latexplotlib as lpl
+from latexplotlib import _async as lpl_async
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _png():
+    with mpl.rc_context({"savefig.format": "png"}):
+        yield
+
+
+def run(save, *args, **kwargs):
+    async def main():
+        return await save(*args, **kwargs)
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def fig():
+    fig, _ = plt.subplots(figsize=(2, 1))
+    return fig
+
+
+@pytest.fixture
+def saver():
+    saver = lpl_async.Saver(1)
+    yield saver
+    saver.shutdown()
+
+
+def test_imported_on_first_use():
+    code = (
+        "import sys, latexplotlib as lpl\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert lpl.saver is sys.modules['latexplotlib._async'].saver\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_exported():
+    assert lpl.asave is lpl_async.asave
+    assert lpl.Saver is lpl_async.Saver
+    assert lpl.saver is lpl_async.saver
+
+
+@pytest.mark.parametrize(
+    ("fname", "formats", "expected"),
+    [
+        ("a.png", None, [("a.png", "png")]),
+        ("a", None, [("a.png", "png")]),
+        ("a.png", ["pdf", "svg"], [("a.pdf", "pdf"), ("a.svg", "svg")]),
+    ],
+)
+def test__targets(fname, formats, expected):
+    assert [
+        (str(path), fmt) for path, fmt in lpl_async._targets(fname, formats)
+    ] == expected
+
+
+@pytest.mark.parametrize(("bbox", "expected"), [("standard", None), ("tight", "tight")])
+def test__savefig_kwargs(bbox, expected):
+    with mpl.rc_context({"savefig.bbox": bbox, "savefig.dpi": 123}):
+        kwargs = lpl_async._savefig_kwargs()
+
+    assert kwargs["bbox_inches"] == expected
+    assert kwargs["dpi"] == 123  # noqa: PLR2004
+
+
+class TestSaver:
+    def test_save(self, saver, fig, tmp_path):
+        paths = run(saver.save, fig, tmp_path / "fig", formats=("png", "svg"))
+
+        assert paths == [tmp_path / "fig.png", tmp_path / "fig.svg"]
+        assert all(path.exists() for path in paths)
+
+    def test_uses_savefig_params_at_call_time(self, saver, fig, tmp_path):
+        async def save():
+            with mpl.rc_context({"savefig.dpi": 50}):
+                future = saver.save(fig, tmp_path / "fig.png")
+            return await future
+
+        (path,) = asyncio.run(save())
+
+        assert plt.imread(path).shape[:2] == (50, 100)
+
+    def test_kwargs(self, saver, fig, tmp_path):
+        (path,) = run(saver.save, fig, tmp_path / "fig.png", dpi=10)
+
+        assert plt.imread(path).shape[:2] == (10, 20)
+
+    def test_stats(self, saver, fig, tmp_path, mocker):
+        release = threading.Event()
+        mocker.patch.object(fig, "savefig", side_effect=lambda *_, **__: release.wait())
+
+        async def save():
+            futures = [saver.save(fig, tmp_path / f"{i}.png") for i in range(3)]
+            await asyncio.sleep(0.01)
+            depth = saver.queue_depth
+            release.set()
+            await asyncio.gather(*futures)
+            return depth
+
+        assert saver.latency == 0.0
+        assert asyncio.run(save()) == 3  # noqa: PLR2004
+        assert saver.queue_depth == 0
+        assert saver.latency > 0
+
+    def test_cancel_queued(self, saver, fig, tmp_path, mocker):
+        release = threading.Event()
+        savefig = mocker.patch.object(
+            fig, "savefig", side_effect=lambda *_, **__: release.wait()
+        )
+
+        async def save():
+            running = saver.save(fig, tmp_path / "a.png")
+            queued = saver.save(fig, tmp_path / "b.png")
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            await running
+            return queued.cancelled()
+
+        assert asyncio.run(save())
+        saver.shutdown()
+        savefig.assert_called_once()
+        assert saver.queue_depth == 0
+
+
+def test_asave(fig, tmp_path, mocker):
+    save = mocker.spy(lpl_async.saver, "save")
+
+    paths = run(lpl_async.asave, fig, tmp_path / "fig.png", dpi=10)
+
+    assert paths == [tmp_path / "fig.png"]
+    save.assert_called_once_with(fig, tmp_path / "fig.png", formats=None, dpi=10)
@@ -0,0 +1,164 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from latexplotlib import _figures as figures
+from latexplotlib import _latexplotlib as lpl
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = figures.FigureTracker(max_open=3)
+    monkeypatch.setattr(lpl, "figures", tracker)
+    return tracker
+
+
+class TestFigureMemory:
+    def test_empty(self):
+        fig = plt.figure()
+        memory = figures.figure_memory(fig)
+
+        assert memory.artists == 2  # noqa: PLR2004
+        assert memory.data == memory.images == memory.canvas == 0
+
+    def test_line(self):
+        fig, ax = plt.subplots()
+        empty = figures.figure_memory(fig)
+        ax.plot(np.arange(1000.0), np.arange(1000.0))
+
+        memory = figures.figure_memory(fig)
+
+        assert memory.artists > empty.artists
+        assert memory.data - empty.data >= 2 * 8000
+
+    def test_image(self):
+        fig, ax = plt.subplots()
+        ax.imshow(np.zeros((100, 100)))
+
+        assert figures.figure_memory(fig).images == 8 * 100 * 100
+
+    def test_collection(self):
+        fig, ax = plt.subplots()
+        empty = figures.figure_memory(fig)
+        ax.scatter(np.arange(100.0), np.arange(100.0))
+
+        memory = figures.figure_memory(fig)
+
+        assert memory.data - empty.data >= 2 * 8 * 100
+        assert memory.paths > empty.paths
+
+    def test_canvas(self):
+        fig = plt.figure(figsize=(1, 1), dpi=100)
+        fig.canvas.draw()
+
+        assert figures.figure_memory(fig).canvas == 4 * 100 * 100
+
+    def test_total(self):
+        memory = figures.FigureMemory(1, 2, 3, 4, 5)
+        assert memory.total == 2 + 3 + 4 + 5
+
+
+class TestFigureTracker:
+    def test_tracks_subplots(self, tracker):
+        fig, _ = lpl.subplots()
+        plt.figure()
+
+        assert tracker.open() == [fig]
+
+    def test_closed(self, tracker):
+        fig, _ = lpl.subplots()
+        plt.close(fig)
+
+        assert tracker.open() == []
+
+    def test_warns(self, tracker):
+        for _ in range(tracker.max_open):
+            lpl.subplots()
+
+        with pytest.warns(RuntimeWarning, match="4 figures created"):
+            lpl.subplots()
+
+    def test_no_warning_if_disabled(self, tracker):
+        tracker.max_open = 0
+        for _ in range(5):
+            lpl.subplots()
+
+    def test_memory(self, tracker):
+        fig1, _ = lpl.subplots()
+        fig2, _ = lpl.subplots()
+
+        total = tracker.memory()
+        single = [figures.figure_memory(fig) for fig in (fig1, fig2)]
+
+        assert total.artists == sum(m.artists for m in single)
+        assert total.paths == sum(m.paths for m in single)
+
+    def test_memory_empty(self, tracker):
+        assert tracker.memory().total == 0
+
+
+class TestAutoclose:
+    def test_context(self, tracker):
+        outside, _ = lpl.subplots()
+
+        with tracker.autoclose() as created:
+            fig, _ = lpl.subplots()
+            assert created == [fig]
+            assert set(tracker.open()) == {outside, fig}
+
+        assert tracker.open() == [outside]
+
+    def test_decorator(self, tracker):
+        @tracker.autoclose()
+        def plot():
+            fig, _ = lpl.subplots()
+            return fig
+
+        plot()
+        plot()
+
+        assert tracker.open() == []
+
+    def test_nested(self, tracker):
+        with tracker.autoclose() as outer:
+            with tracker.autoclose() as inner:
+                fig, _ = lpl.subplots()
+            assert inner == outer == [fig]
+            assert tracker.open() == []
+
+    def test_nested_figures_after_inner(self, tracker):
+        with tracker.autoclose() as outer:
+            with tracker.autoclose():
+                fig1, _ = lpl.subplots()
+            fig2, _ = lpl.subplots()
+            assert outer == [fig1, fig2]
+            assert tracker.open() == [fig2]
+
+        assert tracker.open() == []
+
+    def test_nested_decorator(self, tracker):
+        @tracker.autoclose()
+        def plot():
+            fig, _ = lpl.subplots()
+            return fig
+
+        with tracker.autoclose() as outer:
+            first = plot()
+            second, _ = lpl.subplots()
+            assert outer == [first, second]
+
+        assert tracker.open() == []
+
+    def test_closes_on_error(self, tracker):
+        def plot():
+            with tracker.autoclose():
+                lpl.subplots()
+                msg = "error"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="error"):
+            plot()
+
+        assert tracker.open() == []
@@ -0,0 +1,114 @@
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from latexplotlib import _envelope as envelope
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def reference(y, nbins):
+    binsize = -(-len(y) // nbins)
+    starts = np.arange(0, len(y), binsize)
+    return (
+        starts,
+        np.array([np.nanmin(y[s : s + binsize]) for s in starts]),
+        np.array([np.nanmax(y[s : s + binsize]) for s in starts]),
+    )
+
+
+class TestEnvelope:
+    @pytest.mark.parametrize("n", [1, 99, 100, 1001])
+    @pytest.mark.parametrize("nbins", [1, 7, 100])
+    @pytest.mark.parametrize("chunksize", [1, 13, 2**20])
+    def test_matches_reference(self, rng, n, nbins, chunksize):
+        y = rng.normal(size=n)
+
+        result = envelope.envelope(y, nbins, chunksize=chunksize)
+
+        for res, ref in zip(result, reference(y, nbins), strict=True):
+            np.testing.assert_array_equal(res, ref)
+
+    def test_x(self, rng):
+        y = rng.normal(size=100)
+        x = np.linspace(0, 1, 100)
+
+        xs, _, _ = envelope.envelope(y, 10, x, chunksize=7)
+
+        np.testing.assert_array_equal(xs, x[::10])
+
+    def test_nan(self):
+        y = np.array([np.nan, 1.0, np.nan, np.nan, 2.0, 3.0])
+
+        _, ymin, ymax = envelope.envelope(y, 3)
+
+        np.testing.assert_array_equal(ymin, [1.0, np.nan, 2.0])
+        np.testing.assert_array_equal(ymax, [1.0, np.nan, 3.0])
+
+    def test_memmap(self, rng, tmp_path, mocker):
+        path = tmp_path / "data.npy"
+        y = rng.normal(size=10_000)
+        np.save(path, y)
+        data = np.load(path, mmap_mode="r")
+        asarray = mocker.spy(envelope.np, "asarray")
+
+        result = envelope.envelope(data, 100, chunksize=1000)
+
+        assert max(len(call.args[0]) for call in asarray.call_args_list) == 1000  # noqa: PLR2004
+        for res, ref in zip(result, reference(y, 100), strict=True):
+            np.testing.assert_array_equal(res, ref)
+
+    def test_empty(self):
+        assert all(len(a) == 0 for a in envelope.envelope([], 10))
+
+    def test_list(self):
+        _, ymin, ymax = envelope.envelope([1, 2, 3, 4], 2)
+
+        np.testing.assert_array_equal(ymin, [1, 3])
+        np.testing.assert_array_equal(ymax, [2, 4])
+
+    def test_invalid_nbins(self):
+        with pytest.raises(ValueError, match="'nbins' must be at least 1"):
+            envelope.envelope([1, 2], 0)
+
+    def test_invalid_y(self):
+        with pytest.raises(ValueError, match="'y' must be one-dimensional"):
+            envelope.envelope(np.zeros((2, 2)), 1)
+
+    def test_invalid_x(self):
+        with pytest.raises(ValueError, match="'x' and 'y' must have the same shape"):
+            envelope.envelope([1, 2], 1, [1])
+
+
+class TestPlotEnvelope:
+    @pytest.fixture
+    def ax(self):
+        _, ax = plt.subplots(figsize=(2, 1), dpi=100)
+        return ax
+
+    @pytest.mark.parametrize("dpi", [50, 300])
+    def test__pixel_columns(self, ax, dpi):
+        expected = ax.get_position().width * 2 * dpi
+        assert envelope._pixel_columns(ax, dpi) == pytest.approx(expected, abs=1)
+
+    @pytest.mark.parametrize(("rc", "expected"), [(50, 50), ("figure", 100)])
+    def test__pixel_columns_rc(self, ax, rc, expected):
+        with mpl.rc_context({"savefig.dpi": rc}):
+            assert envelope._pixel_columns(ax, None) == envelope._pixel_columns(
+                ax, expected
+            )
+
+    def test_plot(self, ax, rng):
+        y = rng.normal(size=100_000)
+
+        (line,) = envelope.plot_envelope(ax, y, dpi=100, color="r")
+
+        xs, ys = line.get_data()
+        assert len(xs) == 2 * envelope._pixel_columns(ax, 100)
+        assert ys.min() == y.min()
+        assert ys.max() == y.max()
+        assert line.get_color() == "r"
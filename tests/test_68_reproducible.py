@@ -0,0 +1,122 @@
+import os
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+
+from latexplotlib import _reproducible as reproducible
+
+DATES = {
+    "pdf": b"/CreationDate",
+    "svg": b"<dc:date>",
+    "ps": b"%%CreationDate",
+    "eps": b"%%CreationDate",
+}
+
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _no_source_date_epoch(monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _png():
+    with mpl.rc_context({"savefig.format": "png"}):
+        yield
+
+
+@pytest.fixture
+def fig():
+    fig, ax = plt.subplots(figsize=(2, 1))
+    ax.plot([1, 2, 3])
+    return fig
+
+
+@pytest.mark.parametrize(
+    ("fname", "fmt", "expected"),
+    [
+        ("a.pdf", None, "pdf"),
+        ("a.SVG", None, "svg"),
+        ("a", None, "png"),
+        ("a", "ps", "ps"),
+    ],
+)
+def test__format(fname, fmt, expected):
+    assert reproducible._format(reproducible.Path(fname), fmt) == expected
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "svg", "ps", "eps", "png"])
+def test__render(fig, fmt):
+    content = reproducible._render(fig, fmt)
+
+    assert reproducible._render(fig, fmt) == content
+    assert DATES.get(fmt, b"CreationDate") not in content
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "svg", "ps"])
+def test__render_source_date_epoch(fig, fmt, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+
+    content = reproducible._render(fig, fmt)
+
+    assert DATES[fmt] in content
+    assert b"1970" in content
+
+
+def test__render_metadata(fig):
+    content = reproducible._render(fig, "pdf", metadata={"Title": "figure"})
+
+    assert b"(figure)" in content
+    assert b"/CreationDate" not in content
+
+
+def test__render_hashsalt(fig):
+    with mpl.rc_context({"svg.hashsalt": "salt"}):
+        content = reproducible._render(fig, "svg")
+
+    assert content != reproducible._render(fig, "svg")
+
+
+class TestSaveReproducible:
+    def test_write(self, fig, tmp_path):
+        path = tmp_path / "fig.pdf"
+
+        assert reproducible.save_reproducible(fig, path)
+        assert path.read_bytes() == reproducible._render(fig, "pdf")
+        assert [p.name for p in tmp_path.iterdir()] == ["fig.pdf"]
+
+    def test_unchanged(self, fig, tmp_path):
+        path = tmp_path / "fig.pdf"
+        reproducible.save_reproducible(fig, path)
+        os.utime(path, ns=(0, 0))
+
+        assert not reproducible.save_reproducible(fig, path)
+        assert path.stat().st_mtime_ns == 0
+
+    def test_changed(self, fig, tmp_path):
+        path = tmp_path / "fig.pdf"
+        reproducible.save_reproducible(fig, path)
+        fig.axes[0].plot([3, 2, 1])
+
+        assert reproducible.save_reproducible(fig, path)
+        assert path.read_bytes() == reproducible._render(fig, "pdf")
+
+    def test_format(self, fig, tmp_path):
+        path = tmp_path / "fig"
+
+        assert reproducible.save_reproducible(fig, path, format="svg")
+        assert path.read_bytes().startswith(b"<?xml")
+
+    def test_error(self, fig, tmp_path, mocker):
+        path = tmp_path / "fig.pdf"
+        mocker.patch.object(
+            reproducible.Path, "replace", side_effect=OSError("disk full")
+        )
+
+        with pytest.raises(OSError, match="disk full"):
+            reproducible.save_reproducible(fig, path)
+
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import matplotlib as mpl
+import pytest
+from matplotlib.texmanager import TexManager
+
+import latexplotlib as lpl
+from latexplotlib import _texcache as texcache
+
+
+@pytest.fixture
+def measure(mocker):
+    return mocker.patch.object(
+        TexManager, "get_text_width_height_descent", return_value=(1.0, 2.0, 0.5)
+    )
+
+
+@pytest.fixture
+def cache(measure):
+    cache = texcache.TexCache(maxsize=2)
+    cache.enable()
+    assert TexManager.get_text_width_height_descent is not measure
+    yield cache
+    cache.disable()
+
+
+@pytest.mark.parametrize(
+    ("hits", "misses", "expected"), [(0, 0, 0.0), (3, 1, 0.75), (0, 2, 0.0)]
+)
+def test_cacheinfo_hit_rate(hits, misses, expected):
+    assert texcache.CacheInfo(hits, misses, 10, 1).hit_rate == expected
+
+
+def test_tex_cache_disabled_by_default():
+    assert not lpl.tex_cache.enabled
+    assert "get_text_width_height_descent" in vars(TexManager)
+
+
+class TestTexCache:
+    def test_enable_disable(self, measure):
+        cache = texcache.TexCache()
+        assert not cache.enabled
+
+        cache.enable()
+        cache.enable()
+        assert cache.enabled
+
+        cache.disable()
+        cache.disable()
+        assert not cache.enabled
+        assert TexManager.get_text_width_height_descent is measure
+
+    def test_get(self, cache, measure):
+        for _ in range(3):
+            assert TexManager.get_text_width_height_descent("1", 10) == (1.0, 2.0, 0.5)
+
+        measure.assert_called_once_with("1", 10, None)
+        assert cache.info() == (2, 1, 2, 1)
+
+    def test_get_instance(self, cache, measure):
+        TexManager().get_text_width_height_descent("1", 10)
+        TexManager().get_text_width_height_descent("1", 10)
+
+        measure.assert_called_once()
+
+    def test_empty(self, cache, measure):
+        cache.get(" ", 10)
+        cache.get(" ", 10)
+
+        assert measure.call_count == 2  # noqa: PLR2004
+        assert cache.info().currsize == 0
+
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [
+            (("1", 10), ("2", 10)),
+            (("1", 10), ("1", 12)),
+        ],
+    )
+    def test_key(self, cache, measure, a, b):
+        cache.get(*a)
+        cache.get(*b)
+
+        assert measure.call_count == 2  # noqa: PLR2004
+
+    def test_key_preamble(self, cache, measure):
+        cache.get("1", 10)
+        with mpl.rc_context({"text.latex.preamble": r"\usepackage{amsmath}"}):
+            cache.get("1", 10)
+
+        assert measure.call_count == 2  # noqa: PLR2004
+
+    def test_hit_creates_no_directories(self, cache, measure, mocker):
+        cache.get("1", 10)
+        mkdir = mocker.spy(Path, "mkdir")
+
+        cache.get("1", 10)
+
+        mkdir.assert_not_called()
+        assert cache.info().hits == 1
+
+    def test_key_renderer(self, cache, measure, mocker):
+        renderer = mocker.Mock()
+        renderer.points_to_pixels.return_value = 2.0
+
+        cache.get("1", 10)
+        cache.get("1", 10, renderer)
+        cache.get("1", 10, renderer)
+
+        assert measure.call_count == 2  # noqa: PLR2004
+        measure.assert_called_with("1", 10, renderer)
+
+    def test_lru(self, cache, measure):
+        cache.get("1", 10)
+        cache.get("2", 10)
+        cache.get("1", 10)
+        cache.get("3", 10)
+        cache.get("1", 10)
+        cache.get("2", 10)
+
+        assert [call.args[0] for call in measure.call_args_list] == ["1", "2", "3", "2"]
+        assert cache.info().currsize == 2  # noqa: PLR2004
+
+    def test_clear(self, cache):
+        cache.get("1", 10)
+        cache.get("1", 10)
+
+        cache.clear()
+
+        assert cache.info() == (0, 0, 2, 0)
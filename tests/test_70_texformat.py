@@ -0,0 +1,205 @@
+import shutil
+import subprocess
+import uuid
+from pathlib import Path
+
+import matplotlib as mpl
+import pytest
+from matplotlib.texmanager import TexManager
+
+import latexplotlib as lpl
+from latexplotlib import _texformat as texformat
+
+LATEX = ["latex", "-interaction=nonstopmode", "file.tex"]
+
+
+def fake_latex(command, tex, *, cwd=None):  # noqa: ARG001
+    if "-ini" in command:
+        jobname = next(c for c in command if c.startswith("-jobname="))
+        Path(cwd, jobname.removeprefix("-jobname=") + ".fmt").write_bytes(b"fmt")
+    return b"report"
+
+
+@pytest.fixture
+def installation(mocker):
+    return mocker.patch.object(
+        texformat, "_installation", return_value="latex\n0\nTeX 3.14"
+    )
+
+
+@pytest.fixture
+def run(mocker):
+    return mocker.patch.object(
+        TexManager, "_run_checked_subprocess", side_effect=fake_latex
+    )
+
+
+@pytest.fixture
+def formats(run, installation, tmp_path):
+    assert installation.return_value
+    formats = texformat.TexFormats(tmp_path / "formats")
+    formats.enable()
+    assert TexManager._run_checked_subprocess is not run
+    yield formats
+    formats.disable()
+
+
+def test__preamble():
+    preamble = texformat._preamble()
+
+    assert r"\documentclass{article}" in preamble
+    assert r"\begin{document}" not in preamble
+
+
+def test__preamble_custom():
+    with mpl.rc_context({"text.latex.preamble": r"\usepackage{amsmath}"}):
+        assert r"\usepackage{amsmath}" in texformat._preamble()
+
+
+@pytest.mark.parametrize("latex", [None, "/usr/bin/latex"])
+def test__installation(mocker, latex):
+    texformat._installation.cache_clear()
+    mocker.patch.object(texformat.shutil, "which", return_value=latex)
+    mocker.patch.object(texformat.Path, "stat").return_value.st_mtime_ns = 42
+    run = mocker.patch.object(texformat.subprocess, "run")
+    run.return_value.stdout = b"pdfTeX 3.14"
+
+    if latex is None:
+        assert texformat._installation() == ""
+    else:
+        assert texformat._installation() == "/usr/bin/latex\n42\npdfTeX 3.14"
+    texformat._installation.cache_clear()
+
+
+def test_tex_formats_disabled_by_default():
+    assert not lpl.tex_formats.enabled
+
+
+def _mylatexformat() -> bool:
+    kpsewhich = shutil.which("kpsewhich")
+    if shutil.which("latex") is None or kpsewhich is None:
+        return False
+    found = subprocess.run(  # noqa: S603
+        [kpsewhich, "mylatexformat.ltx"], capture_output=True, check=False
+    )
+    return bool(found.stdout.strip())
+
+
+@pytest.mark.skipif(not _mylatexformat(), reason="latex or mylatexformat is missing")
+def test_latex(tmp_path):
+    formats = texformat.TexFormats(tmp_path)
+    text = f"{uuid.uuid4().int}"
+    with mpl.rc_context({"text.usetex": True}):
+        formats.enable()
+        try:
+            measured = TexManager.get_text_width_height_descent(text, 10)
+        finally:
+            formats.disable()
+        assert list(tmp_path.glob("*.fmt"))
+
+        # Measures the text again without the format.
+        Path(TexManager.get_basefile(text, 10)).with_suffix(".dvi").unlink()
+        lpl.tex_cache.clear()
+        assert TexManager.get_text_width_height_descent(text, 10) == measured
+
+
+class TestTexFormats:
+    def test_enable_disable(self, run, tmp_path):
+        formats = texformat.TexFormats(tmp_path)
+        assert not formats.enabled
+
+        formats.enable()
+        formats.enable()
+        assert formats.enabled
+
+        formats.disable()
+        formats.disable()
+        assert not formats.enabled
+        assert TexManager._run_checked_subprocess is run
+
+    def test_get(self, formats, run):
+        fmt = formats.get()
+
+        assert fmt.exists()
+        assert fmt.parent == formats.directory
+        assert formats.get() == fmt
+        run.assert_called_once()
+        command = run.call_args.args[0]
+        assert command[:2] == ["latex", "-ini"]
+        assert command[-3:] == ["&latex", "mylatexformat.ltx", "file.tex"]
+
+    def test_get_preamble(self, formats):
+        fmt = formats.get()
+        with mpl.rc_context({"text.latex.preamble": r"\usepackage{amsmath}"}):
+            assert formats.get() != fmt
+
+    def test_get_installation(self, formats, installation):
+        fmt = formats.get()
+        installation.return_value = "latex\n1\nTeX 3.14"
+
+        assert formats.get() != fmt
+
+    def test_get_no_latex(self, formats, installation, run):
+        installation.return_value = ""
+
+        assert formats.get() is None
+        run.assert_not_called()
+
+    def test_get_fails(self, formats, run):
+        run.side_effect = RuntimeError("mylatexformat.ltx not found")
+
+        with pytest.warns(RuntimeWarning, match="mylatexformat.ltx not found"):
+            assert formats.get() is None
+        assert formats.get() is None
+        run.assert_called_once()
+
+    def test_run(self, formats, run):
+        TexManager._run_checked_subprocess(LATEX, "1", cwd="dir")
+
+        fmt = formats.get()
+        run.assert_called_with(
+            ["latex", f"-fmt={fmt.with_suffix('')}", *LATEX[1:]], "1", cwd="dir"
+        )
+
+    @pytest.mark.parametrize("command", [["dvipng", "file.dvi"], ["latex", "-ini"]])
+    def test_run_other(self, formats, run, command):
+        run.side_effect = None
+        formats.run(command, "1")
+
+        run.assert_called_once_with(command, "1", cwd=None)
+
+    def test_run_no_latex(self, formats, run, installation):
+        installation.return_value = ""
+
+        formats.run(LATEX, "1")
+
+        run.assert_called_once_with(LATEX, "1", cwd=None)
+
+    def test_run_format_fails(self, formats, run):
+        formats.get()
+        run.side_effect = [RuntimeError("bad format"), b"report"]
+
+        assert formats.run(LATEX, "1") == b"report"
+        run.assert_called_with(LATEX, "1", cwd=None)
+        assert formats.get() is None
+
+    def test_run_invalid_tex(self, formats, run):
+        formats.get()
+        run.side_effect = RuntimeError("invalid tex")
+
+        with pytest.raises(RuntimeError, match="invalid tex"):
+            formats.run(LATEX, r"\invalid")
+        assert formats.get() is not None
+
+    def test_clear(self, formats, run):
+        fmt = formats.get()
+        run.side_effect = RuntimeError("error")
+        with mpl.rc_context({"text.latex.preamble": "%"}), pytest.warns(RuntimeWarning):
+            formats.get()
+
+        formats.clear()
+
+        assert not fmt.exists()
+        run.side_effect = fake_latex
+        with mpl.rc_context({"text.latex.preamble": "%"}):
+            assert formats.get() is not None
@@ -0,0 +1,217 @@
+import warnings
+from pathlib import Path
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib import dviread
+from matplotlib.figure import Figure
+from matplotlib.texmanager import TexManager
+
+import latexplotlib as lpl
+from latexplotlib import _texbatch as texbatch
+
+NUM, DEN, MAG = 25400000, 473628672, 1000
+FONTDEF = bytes([243, 0]) + bytes(12) + bytes([0, 5]) + b"cmr10"
+
+
+def make_dvi(pages, fontdefs=b""):
+    """Creates a dvi file with one rule of the given width and height per page."""
+    scale = b"".join(v.to_bytes(4, "big") for v in (NUM, DEN, MAG))
+    data = bytearray([247, 2]) + scale + bytes([0])
+
+    previous = -1
+    for width, height in pages:
+        bop = len(data)
+        data += bytes([139]) + bytes(40) + previous.to_bytes(4, "big", signed=True)
+        data += bytes([132]) + height.to_bytes(4, "big") + width.to_bytes(4, "big")
+        data += bytes([140])
+        previous = bop
+
+    post = len(data)
+    data += bytes([248]) + previous.to_bytes(4, "big", signed=True) + scale
+    data += bytes(8) + (1).to_bytes(2, "big") + len(pages).to_bytes(2, "big")
+    data += fontdefs
+    data += bytes([249]) + post.to_bytes(4, "big") + bytes([2])
+    data += bytes([223]) * (4 + -len(data) % 4)
+    return bytes(data)
+
+
+class TestSplitDvi:
+    @pytest.mark.parametrize("n", [1, 3])
+    def test_pages(self, tmp_path, n):
+        pages = [(2**16 * (i + 1), 2**17 * (i + 1)) for i in range(n)]
+
+        split = texbatch._split_dvi(make_dvi(pages))
+
+        assert len(split) == n
+        for i, (content, (width, height)) in enumerate(zip(split, pages, strict=True)):
+            assert len(content) % 4 == 0
+            path = tmp_path / f"{i}.dvi"
+            path.write_bytes(content)
+            with dviread.Dvi(path, None) as dvi:
+                (page,) = dvi
+            (box,) = page.boxes
+            assert (box.width, box.height) == (width, height)
+
+    def test_single_page(self):
+        content = make_dvi([(10, 20)])
+
+        assert texbatch._split_dvi(content) == [content]
+
+    def test_fontdefs(self):
+        (first, second) = texbatch._split_dvi(make_dvi([(1, 1), (2, 2)], FONTDEF))
+
+        for content in (first, second):
+            assert content.count(FONTDEF) == 2  # noqa: PLR2004
+            assert content.index(FONTDEF) < content.index(bytes([139]) + bytes(40))
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"\xf7" + bytes(20),
+            bytes(56),
+            bytes(10) + b"\xf9" + bytes(5) + b"\xdf" * 4,
+        ],
+    )
+    def test_invalid(self, content):
+        with pytest.raises(ValueError, match="invalid dvi file"):
+            texbatch._split_dvi(content)
+
+
+def test__texts():
+    with mpl.rc_context({"text.usetex": True}):
+        fig, ax = plt.subplots()
+        ax.set_title("a\nb")
+        ax.set_xlabel(" ")
+        ax.set_ylabel("hidden", visible=False)
+        ax.text(0, 0, "notex", usetex=False)
+        ax.text(0, 0, "", usetex=True)
+
+    texts = texbatch._texts(fig)
+    plt.close(fig)
+
+    strings = {tex for tex, _ in texts}
+    assert {"lp", "a", "b", r"\ ", r"$\mathdefault{0.0}$"} <= strings
+    assert not strings & {"hidden", "notex", "", "a\nb"}
+
+
+@pytest.fixture
+def texcache(tmp_path, monkeypatch):
+    monkeypatch.setattr(TexManager, "_texcache", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def latex(mocker):
+    def run(command, tex, *, cwd=None):  # noqa: ARG001
+        n = tex.count(r"\begin{document}") + tex.count(r"\clearpage")
+        Path(cwd, "file.dvi").write_bytes(make_dvi([(i + 1, 1) for i in range(n)]))
+        return b""
+
+    return mocker.patch.object(TexManager, "_run_checked_subprocess", side_effect=run)
+
+
+def dvifile(tex, fontsize):
+    return Path(TexManager.get_basefile(tex, fontsize)).with_suffix(".dvi")
+
+
+@pytest.mark.usefixtures("texcache")
+class TestTypeset:
+    def test_typeset(self, latex):
+        texts = [("a", 10), ("b", 10), ("a", 12)]
+
+        assert texbatch.TexBatch.typeset(texts) == 3  # noqa: PLR2004
+
+        latex.assert_called_once()
+        document = latex.call_args.args[1]
+        assert document.count(r"\documentclass") == 1
+        assert document.count(r"\begin{document}") == 1
+        assert document.count(r"\end{document}") == 1
+        for i, text in enumerate(texts):
+            with dviread.Dvi(dvifile(*text), None) as dvi:
+                (page,) = dvi
+            assert page.boxes[0].width == i + 1
+
+    def test_cached(self, latex):
+        texbatch.TexBatch.typeset([("a", 10), ("b", 10)])
+
+        assert texbatch.TexBatch.typeset([("a", 10), ("b", 10), ("c", 10)]) == 0
+        latex.assert_called_once()
+
+    @pytest.mark.parametrize("error", [RuntimeError("invalid tex"), OSError("no dvi")])
+    def test_fails(self, latex, error):
+        latex.side_effect = error
+
+        assert texbatch.TexBatch.typeset([("a", 10), ("b", 10)]) == 0
+        assert not dvifile("a", 10).exists()
+
+    def test_missing_pages(self, latex):
+        assert texbatch.TexBatch.typeset([("a", 10), ("b", 10)]) == 2  # noqa: PLR2004
+        latex.side_effect = lambda *_, cwd: Path(cwd, "file.dvi").write_bytes(
+            make_dvi([(1, 1)])
+        )
+
+        assert texbatch.TexBatch.typeset([("c", 10), ("d", 10)]) == 0
+        assert not dvifile("c", 10).exists()
+
+
+class TestTexBatch:
+    @pytest.fixture
+    def draw(self, mocker):
+        return mocker.patch.object(Figure, "draw")
+
+    @pytest.fixture
+    def batch(self, draw, mocker):
+        batch = texbatch.TexBatch()
+        batch.enable()
+        assert Figure.draw is not draw
+        mocker.patch.object(batch, "typeset")
+        yield batch
+        batch.disable()
+
+    def test_enable_disable(self, draw):
+        batch = texbatch.TexBatch()
+        assert not batch.enabled
+
+        batch.enable()
+        batch.enable()
+        assert batch.enabled
+
+        batch.disable()
+        batch.disable()
+        assert not batch.enabled
+        assert Figure.draw is draw
+
+    def test_disabled_by_default(self):
+        assert not lpl.tex_batch.enabled
+
+    def test_keeps_attributes(self, batch):
+        assert Figure.draw.__wrapped__ is batch._original
+        assert Figure.draw.__name__ == "draw"
+
+    def test_rasterized(self):
+        batch = texbatch.TexBatch()
+        batch.enable()
+        try:
+            fig = plt.figure()
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                fig.set_rasterized(True)
+            plt.close(fig)
+        finally:
+            batch.disable()
+
+    @pytest.mark.parametrize(
+        ("usetex", "tracked", "expected"),
+        [(True, True, True), (False, True, False), (True, False, False)],
+    )
+    def test_draw(self, batch, draw, usetex, tracked, expected):
+        with mpl.rc_context({"text.usetex": usetex}):
+            fig = lpl.subplots()[0] if tracked else plt.figure()
+            Figure.draw(fig, "renderer")
+        plt.close(fig)
+
+        draw.assert_called_once_with(fig, "renderer")
+        assert batch.typeset.called == expected
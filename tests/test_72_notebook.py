@@ -0,0 +1,155 @@
+import io
+import sys
+import types
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib.figure import Figure
+
+from latexplotlib import _notebook as notebook
+
+
+class Formatter:
+    def __init__(self):
+        self.types = {}
+
+    def for_type(self, typ, func):
+        self.types[typ] = func
+
+    def pop(self, typ, default):
+        return self.types.pop(typ, default)
+
+
+@pytest.fixture
+def ip():
+    formatters = {mime: Formatter() for mime in notebook._FORMATS}
+    formatters["image/png"].for_type(Figure, "png")
+    formatters["image/svg+xml"].for_type(Figure, "svg")
+    return types.SimpleNamespace(
+        display_formatter=types.SimpleNamespace(formatters=formatters)
+    )
+
+
+@pytest.fixture
+def preview():
+    preview = notebook.Preview(dpi=50)
+    yield preview
+    preview.disable()
+
+
+@pytest.fixture
+def fig():
+    with mpl.rc_context({"text.usetex": True}):
+        fig, ax = plt.subplots(figsize=(2, 1))
+        ax.set_title("title")
+        ax.set_xlabel("label", usetex=False)
+    yield fig
+    plt.close(fig)
+
+
+def formatters(ip):
+    return {
+        mime: formatter.types.get(Figure)
+        for mime, formatter in ip.display_formatter.formatters.items()
+    }
+
+
+class TestGetIpython:
+    def test_running(self, mocker):
+        shell = object()
+        module = types.SimpleNamespace(get_ipython=lambda: shell)
+        mocker.patch.dict(sys.modules, {"IPython.core.getipython": module})
+
+        assert notebook._get_ipython() is shell
+
+    @pytest.mark.parametrize(
+        "module", [None, types.SimpleNamespace(get_ipython=lambda: None)]
+    )
+    def test_not_running(self, mocker, module):
+        mocker.patch.dict(sys.modules, {"IPython.core.getipython": module})
+
+        with pytest.raises(RuntimeError, match="previews require IPython"):
+            notebook._get_ipython()
+
+
+class TestPreview:
+    def test_render(self, preview, fig):
+        with mpl.rc_context({"text.usetex": True}):
+            image = plt.imread(io.BytesIO(preview.render(fig)))
+
+        assert image.shape[:2] == (50, 100)
+        ax = fig.axes[0]
+        assert ax.title.get_usetex()
+        assert not ax.xaxis.label.get_usetex()
+        assert all(t.get_usetex() for t in ax.get_xticklabels())
+
+    def test_render_new_texts(self, preview):
+        with mpl.rc_context({"text.usetex": True}):
+            fig, ax = plt.subplots(figsize=(2, 1))
+            ax.plot([0, 100])
+            n_ticks = len(ax.xaxis.majorTicks)
+
+            preview.render(fig)
+        plt.close(fig)
+
+        assert len(ax.xaxis.majorTicks) > n_ticks
+        assert all(tick.label1.get_usetex() for tick in ax.xaxis.majorTicks)
+
+    def test_render_fallback(self, preview, fig, mocker):
+        states = []
+
+        def print_figure(fig):
+            states.append(fig.axes[0].title.get_usetex())
+            if len(states) == 1:
+                msg = "unknown symbol"
+                raise ValueError(msg)
+            return b"png"
+
+        mocker.patch.object(preview, "_print", side_effect=print_figure)
+
+        assert preview.render(fig) == b"png"
+        assert states == [False, True]
+        assert fig.axes[0].title.get_usetex()
+
+    def test_enable_disable(self, preview, ip, fig):
+        assert not preview.enabled
+
+        preview.enable(ip)
+        preview.enable(ip)
+
+        assert preview.enabled
+        assert formatters(ip) == {
+            "image/png": preview.render,
+            "image/jpeg": None,
+            "image/svg+xml": None,
+            "application/pdf": None,
+        }
+
+        preview.disable()
+        preview.disable()
+
+        assert not preview.enabled
+        assert formatters(ip) == {
+            "image/png": "png",
+            "image/jpeg": None,
+            "image/svg+xml": "svg",
+            "application/pdf": None,
+        }
+
+    def test_enable_running(self, preview, ip, mocker):
+        mocker.patch.object(notebook, "_get_ipython", return_value=ip)
+
+        preview.enable()
+
+        assert formatters(ip)["image/png"] == preview.render
+
+
+def test_ipython_extension(ip, mocker):
+    mocker.patch.object(notebook, "preview", notebook.Preview())
+
+    notebook.load_ipython_extension(ip)
+    assert notebook.preview.enabled
+
+    notebook.unload_ipython_extension(ip)
+    assert not notebook.preview.enabled
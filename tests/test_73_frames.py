@@ -0,0 +1,114 @@
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backends.backend_pdf import FigureCanvasPdf
+
+from latexplotlib import _frames as frames
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _low_dpi():
+    with mpl.rc_context({"savefig.dpi": 50}):
+        yield
+
+
+@pytest.fixture
+def animation():
+    fig, ax = plt.subplots(figsize=(2, 1))
+    ax.set_xlim(0, 1)
+    ax.set_ylim(-1, 1)
+    ax.set_title("title")
+    (line,) = ax.plot([], [], zorder=3)
+    x = np.linspace(0, 1, 50)
+
+    def update(i):
+        line.set_data(x, np.sin(2 * np.pi * (x + i / 10)))
+        return [line]
+
+    yield fig, update, line
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(("dpi", "expected"), [(None, 50), (80, 80), ("figure", 100)])
+def test__dpi(dpi, expected):
+    fig = plt.figure(dpi=100)
+    assert frames._dpi(fig, dpi) == expected
+    plt.close(fig)
+
+
+def test__frame_paths(tmp_path):
+    assert frames._frame_paths(tmp_path / "frame-.png", "png", 2) == [
+        tmp_path / "frame-0.png",
+        tmp_path / "frame-1.png",
+    ]
+
+
+class TestExportFrames:
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_png(self, animation, tmp_path, jobs):
+        fig, update, line = animation
+        dpi = fig.dpi
+
+        paths = frames.export_frames(
+            fig, update, range(5), tmp_path / "frame-.png", jobs=jobs
+        )
+
+        assert paths == [tmp_path / f"frame-{i}.png" for i in range(5)]
+        for i, path in enumerate(paths):
+            update(i)
+            fig.savefig(tmp_path / "expected.png")
+            np.testing.assert_array_equal(
+                plt.imread(path), plt.imread(tmp_path / "expected.png")
+            )
+        assert not line.get_animated()
+        assert fig.dpi == dpi
+
+    def test_frames_differ(self, animation, tmp_path):
+        fig, update, _ = animation
+
+        first, second = frames.export_frames(fig, update, [0, 5], tmp_path / "f.png")
+
+        assert not np.array_equal(plt.imread(first), plt.imread(second))
+
+    def test_dpi(self, animation, tmp_path):
+        fig, update, _ = animation
+
+        (path,) = frames.export_frames(fig, update, [0], tmp_path / "f.png", dpi=20)
+
+        assert plt.imread(path).shape[:2] == (20, 40)
+
+    def test_canvas(self, animation, tmp_path):
+        fig, update, _ = animation
+        canvas = FigureCanvasPdf(fig)
+
+        frames.export_frames(fig, update, [0], tmp_path / "f.png")
+
+        assert fig.canvas is canvas
+
+    def test_animated(self, animation, tmp_path):
+        fig, update, line = animation
+        line.set_animated(True)
+
+        frames.export_frames(fig, update, [0], tmp_path / "f.png")
+
+        assert line.get_animated()
+
+    @pytest.mark.parametrize("fname", ["frame-.pdf", "frame-"])
+    def test_other_formats(self, animation, tmp_path, fname, mocker):
+        fig, update, _ = animation
+        draw_artist = mocker.spy(fig, "draw_artist")
+
+        with mpl.rc_context({"savefig.format": "svg"}):
+            paths = frames.export_frames(fig, update, range(3), tmp_path / fname)
+
+        assert all(path.exists() for path in paths)
+        assert len(paths) == 3  # noqa: PLR2004
+        draw_artist.assert_not_called()
+
+    def test_empty(self, animation, tmp_path):
+        fig, update, _ = animation
+
+        assert frames.export_frames(fig, update, [], tmp_path / "f.png") == []
@@ -0,0 +1,97 @@
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from latexplotlib import _panels as panels
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _png():
+    with mpl.rc_context({"savefig.dpi": 100, "savefig.format": "png"}):
+        yield
+
+
+@pytest.fixture
+def fig():
+    fig, axes = plt.subplots(2, 2, figsize=(4, 3), layout="constrained")
+    for i, ax in enumerate(axes.flat):
+        ax.plot([0, 1])
+        ax.set_title(f"panel {i}")
+    image = axes[0, 0].imshow(np.eye(3))
+    fig.colorbar(image, ax=axes[0, 0])
+    fig.suptitle("suptitle")
+    yield fig
+    plt.close(fig)
+
+
+def test__panels(fig):
+    result = panels._panels(fig)
+
+    assert len(result) == 4  # noqa: PLR2004
+    assert result[0] == [fig.axes[0], fig.axes[4]]
+    assert [panel[0] for panel in result] == fig.axes[:4]
+
+
+def test__panel_paths(tmp_path):
+    assert panels._panel_paths(tmp_path / "fig.pdf", 2) == [
+        tmp_path / "fig-0.pdf",
+        tmp_path / "fig-1.pdf",
+    ]
+    assert panels._panel_paths(tmp_path / "fig", 1) == [tmp_path / "fig-0.png"]
+
+
+class TestSavePanels:
+    def test_files(self, fig, tmp_path):
+        paths = panels.save_panels(fig, tmp_path / "fig.png")
+
+        assert paths == [tmp_path / f"fig-{i}.png" for i in range(4)]
+        shapes = [plt.imread(path).shape[:2] for path in paths]
+        assert all(h < 300 and w < 400 for h, w in shapes)  # noqa: PLR2004
+        # The first panel has a colorbar.
+        assert shapes[0][1] > shapes[1][1] / 2
+
+    def test_size(self, fig, tmp_path):
+        fig.draw_without_rendering()
+        bbox = fig.axes[3].get_tightbbox().transformed(fig.dpi_scale_trans.inverted())
+
+        path = panels.save_panels(fig, tmp_path / "fig.png", pad_inches=0.5)[3]
+
+        height, width = plt.imread(path).shape[:2]
+        assert width == pytest.approx(100 * (bbox.width + 1), abs=1)
+        assert height == pytest.approx(100 * (bbox.height + 1), abs=1)
+
+    def test_single_layout(self, fig, tmp_path, mocker):
+        execute = mocker.spy(fig.get_layout_engine(), "execute")
+
+        panels.save_panels(fig, tmp_path / "fig.pdf")
+
+        execute.assert_called_once()
+
+    def test_restores(self, fig, tmp_path):
+        engine = fig.get_layout_engine()
+        fig.axes[2].set_visible(False)
+
+        panels.save_panels(fig, tmp_path / "fig.png")
+
+        assert fig.get_layout_engine() is engine
+        assert [ax.get_visible() for ax in fig.axes] == [True, True, False, True, True]
+        assert all(text.get_visible() for text in fig.texts)
+
+    def test_no_layout_engine(self, tmp_path):
+        with mpl.rc_context(
+            {"figure.constrained_layout.use": False, "figure.autolayout": False}
+        ):
+            fig, _ = plt.subplots(1, 2)
+            panels.save_panels(fig, tmp_path / "fig.png")
+        plt.close(fig)
+
+        assert fig.get_layout_engine() is None
+
+    def test_kwargs(self, fig, tmp_path):
+        path = panels.save_panels(fig, tmp_path / "fig.png", dpi=50)[1]
+        height, _ = plt.imread(path).shape[:2]
+
+        assert height < 75  # noqa: PLR2004
@@ -0,0 +1,134 @@
+import io
+import threading
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib import _pylab_helpers
+from matplotlib.figure import Figure
+
+import latexplotlib as lpl
+from latexplotlib import _threads as threads
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _small_figures():
+    with mpl.rc_context({"savefig.dpi": 50}), lpl.size.context(300, 200):
+        yield
+
+
+def render(i):
+    fig, ax = lpl.subplots(1, 1)
+    ax.plot(range(i + 2))
+    ax.set_title(f"figure {i}")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", metadata={"Software": None})
+    return buffer.getvalue()
+
+
+def test_uses_pyplot():
+    assert threads.uses_pyplot()
+
+
+def test_map_threaded_mode():
+    def mode(_):
+        return threads.uses_pyplot(), threading.current_thread().name
+
+    results = lpl.map_threaded(mode, range(4), max_workers=2)
+
+    assert all(not pyplot for pyplot, _ in results)
+    assert all(name.startswith("latexplotlib") for _, name in results)
+    assert threads.uses_pyplot()
+
+
+def test_map_threaded_size():
+    def get_size(i):
+        with lpl.size.context(i, i):
+            pass
+        return lpl.size.get()
+
+    with lpl.size.context(123, 456):
+        results = lpl.map_threaded(get_size, range(8), max_workers=4)
+
+    assert results == [(123, 456)] * 8
+    assert lpl.size.get() == (300, 200)
+
+
+def test_map_threaded_set_does_not_leak():
+    def set_size(i):
+        size = lpl.size.get()
+        lpl.size.set(i, i, persist=False)
+        return size
+
+    assert lpl.map_threaded(set_size, range(4), max_workers=1) == [(300, 200)] * 4
+    assert lpl.size.get() == (300, 200)
+
+
+def test_map_threaded_context():
+    barrier = threading.Barrier(4)
+
+    def get_size(i):
+        with lpl.size.context(i, i):
+            barrier.wait()
+            return lpl.size.get()
+
+    assert lpl.map_threaded(get_size, range(4), max_workers=4) == [
+        (i, i) for i in range(4)
+    ]
+
+
+def test_map_threaded_figures():
+    def create(_):
+        fig, _ = lpl.subplots(1, 1)
+        return fig
+
+    n_open = len(_pylab_helpers.Gcf.get_all_fig_managers())
+
+    figs = lpl.map_threaded(create, range(3))
+
+    assert len(_pylab_helpers.Gcf.get_all_fig_managers()) == n_open
+    assert all(fig in lpl.figures for fig in figs)
+    assert [tuple(fig.get_size_inches()) for fig in figs] == [
+        tuple(lpl.figsize(1, 1))
+    ] * 3
+
+
+def test_map_threaded_pyplot_keywords():
+    class MyFigure(Figure):
+        pass
+
+    def create(_):
+        fig, _ = lpl.subplots(1, 1, num="figure", clear=True, FigureClass=MyFigure)
+        return fig
+
+    figs = lpl.map_threaded(create, range(2))
+
+    assert all(type(fig) is MyFigure for fig in figs)
+
+
+def test_map_threaded_lazy_pyplot_keywords():
+    def create(_):
+        fig, _ = lpl.subplots(2, 2, num=1, lazy=True)
+        return fig
+
+    figs = lpl.map_threaded(create, range(2))
+
+    assert all(type(fig) is Figure for fig in figs)
+
+
+def test_map_threaded_renders_like_serial():
+    serial = [render(i) for i in range(8)]
+    plt.close("all")
+
+    assert lpl.map_threaded(render, range(8), max_workers=4) == serial
+
+
+def test_map_threaded_error():
+    def fail(_):
+        msg = "in thread"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="in thread"):
+        lpl.map_threaded(fail, range(2))
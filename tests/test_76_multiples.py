@@ -0,0 +1,144 @@
+import matplotlib as mpl
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+
+import latexplotlib as lpl
+from latexplotlib import _multiples as multiples
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _size():
+    with lpl.size.context(400, 300):
+        yield
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).normal(size=(30, 50)).cumsum(axis=1)
+
+
+class TestSegments:
+    def test_default_x(self, data):
+        segments = multiples._segments(data, None)
+
+        assert segments.shape == (*data.shape, 2)
+        np.testing.assert_array_equal(segments[3, :, 0], np.arange(50))
+        np.testing.assert_array_equal(segments[..., 1], data)
+
+    def test_shared_x(self, data):
+        x = np.linspace(0, 1, 50)
+
+        segments = multiples._segments(data, x)
+
+        np.testing.assert_array_equal(segments[..., 0], np.tile(x, (30, 1)))
+
+    def test_x_per_series(self, data):
+        segments = multiples._segments(data, -data)
+
+        np.testing.assert_array_equal(segments[..., 0], -data)
+
+    def test_single_series(self):
+        assert multiples._segments([1, 2, 3], None).shape == (1, 3, 2)
+
+    def test_invalid_data(self):
+        with pytest.raises(ValueError, match="'data' must be one- or two-dim"):
+            multiples._segments(np.zeros((2, 2, 2)), None)
+
+    def test_invalid_x(self, data):
+        with pytest.raises(ValueError, match="'x' must have the shape of 'data'"):
+            multiples._segments(data, np.arange(49))
+
+
+class TestGroups:
+    def test_none(self):
+        labels, groups = multiples._groups(3, None)
+
+        assert labels is None
+        assert [list(group) for group in groups] == [[0], [1], [2]]
+
+    def test_by(self):
+        labels, groups = multiples._groups(5, ["b", "a", "b", "c", "a"])
+
+        assert list(labels) == ["a", "b", "c"]
+        assert [list(group) for group in groups] == [[1, 4], [0, 2], [3]]
+
+    def test_invalid_by(self):
+        with pytest.raises(ValueError, match="'by' must have one label per series"):
+            multiples._groups(5, [1, 2])
+
+
+class TestSmallMultiples:
+    def test_one_collection_per_panel(self, data):
+        by = np.arange(30) % 7
+
+        fig, axes = lpl.small_multiples(data, by=by)
+
+        assert len(axes) == 7  # noqa: PLR2004
+        assert list(fig.axes) == list(axes)
+        for i, ax in enumerate(axes):
+            assert not ax.lines
+            (collection,) = ax.collections
+            assert isinstance(collection, LineCollection)
+            assert len(collection.get_segments()) == np.sum(by == i)
+            assert ax.get_title() == str(i)
+
+    def test_geometry(self, data):
+        layout = lpl.autofit(30, max_ncols=4)
+
+        fig, _ = lpl.small_multiples(data, ncols=4)
+
+        nrows, ncols = fig.axes[0].get_subplotspec().get_gridspec().get_geometry()
+        assert (nrows, ncols) == (layout.nrows, layout.ncols)
+        assert tuple(fig.get_size_inches()) == lpl.figsize(
+            layout.nrows, layout.ncols, aspect=layout.aspect, scale=layout.scale
+        )
+        assert fig in lpl.figures
+
+    def test_no_titles(self, data):
+        _, axes = lpl.small_multiples(data[:3])
+
+        assert all(ax.get_title() == "" for ax in axes)
+
+    def test_limits(self, data):
+        _, axes = lpl.small_multiples(data, by=np.arange(30) % 4)
+
+        xmin, xmax = axes[0].get_xlim()
+        ymin, ymax = axes[0].get_ylim()
+        assert xmin <= 0
+        assert xmax >= 49  # noqa: PLR2004
+        assert ymin <= data.min()
+        assert ymax >= data.max()
+
+    def test_bottom_labels(self, data):
+        fig, axes = lpl.small_multiples(data[:5], ncols=3)
+
+        nrows, ncols = fig.axes[0].get_subplotspec().get_gridspec().get_geometry()
+        assert nrows * ncols > 5  # noqa: PLR2004
+        for ax in axes[-ncols:]:
+            assert ax.xaxis.get_tick_params()["labelbottom"]
+
+    def test_colors(self, data):
+        cycle = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+
+        _, axes = lpl.small_multiples(data, by=np.zeros(30))
+
+        colors = axes[0].collections[0].get_colors()
+        np.testing.assert_array_equal(colors, to_rgba_array(np.resize(cycle, 30)))
+
+    def test_kwargs(self, data):
+        _, axes = lpl.small_multiples(data[:2], color="k", linewidth=0.5)
+
+        collection = axes[0].collections[0]
+        np.testing.assert_array_equal(collection.get_colors(), to_rgba_array(["k"]))
+        assert list(collection.get_linewidths()) == [0.5]
+
+    def test_draw(self, data, tmp_path):
+        fig, _ = lpl.small_multiples(data, by=np.arange(30) % 5)
+
+        fig.savefig(tmp_path / "multiples.png", dpi=20)
+
+        assert (tmp_path / "multiples.png").exists()
@@ -0,0 +1,181 @@
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+
+import latexplotlib as lpl
+from latexplotlib import _lazy as lazy
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _size():
+    with lpl.size.context(400, 300):
+        yield
+
+
+@pytest.fixture
+def fig():
+    return plt.figure()
+
+
+class TestLazyAxes:
+    def test_no_axes(self, fig):
+        axes = lazy.lazy_subplots(fig, 3, 4)
+
+        assert isinstance(axes, lazy.LazyAxes)
+        assert axes.shape == (3, 4)
+        assert axes.ndim == 2  # noqa: PLR2004
+        assert axes.size == 12  # noqa: PLR2004
+        assert len(axes) == 3  # noqa: PLR2004
+        assert not fig.axes
+        assert repr(axes) == "LazyAxes(shape=(3, 4), created=0)"
+
+    def test_getitem(self, fig):
+        axes = lazy.lazy_subplots(fig, 3, 4)
+
+        ax = axes[1, 2]
+
+        assert isinstance(ax, Axes)
+        assert fig.axes == [ax]
+        assert axes[1, 2] is ax
+        assert axes[1][2] is ax
+        assert axes[-2, -2] is ax
+        assert ax.get_subplotspec().rowspan == range(1, 2)
+        assert ax.get_subplotspec().colspan == range(2, 3)
+
+    def test_slices_are_lazy(self, fig):
+        axes = lazy.lazy_subplots(fig, 3, 4)
+
+        row = axes[1]
+        column = axes[:, 2]
+
+        assert not fig.axes
+        assert row.shape == (4,)
+        assert column.shape == (3,)
+        assert row[2] is column[1]
+        assert axes.created == [row[2]]
+        assert row.created == [row[2]]
+        assert not axes[0].created
+
+    def test_iter(self, fig):
+        axes = lazy.lazy_subplots(fig, 2, 3)
+
+        rows = list(axes)
+
+        assert [row.shape for row in rows] == [(3,), (3,)]
+        assert not fig.axes
+        assert list(rows[1]) == [axes[1, i] for i in range(3)]
+
+    def test_flat_and_ravel(self, fig):
+        axes = lazy.lazy_subplots(fig, 2, 3)
+
+        flat = axes.ravel()
+
+        assert flat.shape == (6,)
+        assert flat[4] is axes[1, 1]
+        assert list(axes.flat) == list(flat)
+        assert len(fig.axes) == 6  # noqa: PLR2004
+
+    def test_array(self, fig):
+        axes = lazy.lazy_subplots(fig, 2, 3)
+
+        array = np.asarray(axes)
+
+        assert array.shape == (2, 3)
+        assert array[1, 2] is axes[1, 2]
+
+    @pytest.mark.parametrize(
+        ("shape", "squeeze", "expected"),
+        [
+            ((1, 1), False, (1, 1)),
+            ((1, 3), True, (3,)),
+            ((3, 1), True, (3,)),
+            ((2, 3), True, (2, 3)),
+        ],
+    )
+    def test_squeeze(self, fig, shape, squeeze, expected):
+        axes = lazy.lazy_subplots(fig, *shape, squeeze=squeeze)
+
+        assert axes.shape == expected
+        assert not fig.axes
+
+    def test_squeeze_single(self, fig):
+        ax = lazy.lazy_subplots(fig, 1, 1)
+
+        assert fig.axes == [ax]
+
+    def test_kw(self, fig):
+        axes = lazy.lazy_subplots(
+            fig,
+            2,
+            2,
+            subplot_kw={"projection": "polar"},
+            gridspec_kw={"width_ratios": [1, 3]},
+        )
+
+        assert axes[0, 0].name == "polar"
+        gridspec = axes[0, 0].get_subplotspec().get_gridspec()
+        assert list(gridspec.get_width_ratios()) == [1, 3]
+
+    @pytest.mark.parametrize(
+        ("share", "shared"),
+        [
+            (True, [(0, 0), (0, 1), (1, 0)]),
+            ("all", [(0, 0), (0, 1), (1, 0)]),
+            ("row", [(1, 0)]),
+            ("col", [(0, 1)]),
+            ("none", []),
+            (False, []),
+        ],
+    )
+    def test_share(self, fig, share, shared):
+        axes = lazy.lazy_subplots(fig, 2, 2, sharex=share, sharey=share)
+        first = axes[1, 1]
+
+        for idx in [(0, 0), (0, 1), (1, 0)]:
+            ax = axes[idx]
+            assert (ax.get_shared_x_axes().joined(first, ax)) == (idx in shared)
+            assert (ax.get_shared_y_axes().joined(first, ax)) == (idx in shared)
+
+    def test_invalid_share(self, fig):
+        with pytest.raises(ValueError, match="'sharey' must be a bool or one of"):
+            lazy.lazy_subplots(fig, 2, 2, sharey="rows")
+
+
+class TestSubplots:
+    def test_lazy(self):
+        fig, axes = lpl.subplots(20, 20, lazy=True)
+
+        axes[3, 4].plot([0, 1])
+        fig.draw_without_rendering()
+
+        assert isinstance(axes, lpl.LazyAxes)
+        assert len(fig.axes) == 1
+        assert tuple(fig.get_size_inches()) == lpl.figsize(20, 20)
+        assert fig in lpl.figures
+        assert plt.fignum_exists(fig.number)
+
+    def test_layout(self):
+        with mpl.rc_context({"figure.constrained_layout.use": True}):
+            fig, axes = lpl.subplots(2, 2, lazy=True)
+            axes[0, 0].set_ylabel("y")
+            axes[1, 1].set_xlabel("x")
+            fig.draw_without_rendering()
+
+        x0, _, _, y1 = axes[0, 0].get_position().extents
+        _, y0, x1, _ = axes[1, 1].get_position().extents
+        assert 0 < x0 < x1 < 1
+        assert 0 < y0 < y1 < 1
+
+    def test_lazy_threaded(self):
+        def create(_):
+            fig, axes = lpl.subplots(2, 2, lazy=True)
+            return fig, axes[0, 0]
+
+        ((fig, ax),) = lpl.map_threaded(create, [0])
+
+        assert fig.axes == [ax]
+        assert fig.canvas.manager is None
@@ -0,0 +1,230 @@
+import json
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib import layout_engine
+from matplotlib.layout_engine import ConstrainedLayoutEngine
+
+import latexplotlib as lpl
+from latexplotlib import _layoutcache as layoutcache
+
+pytestmark = pytest.mark.usefixtures("_no_tex")
+
+
+@pytest.fixture(autouse=True)
+def _constrained_layout():
+    with (
+        mpl.rc_context({"figure.constrained_layout.use": True}),
+        lpl.size.context(400, 300),
+    ):
+        yield
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "cache" / "layouts.json"
+
+
+@pytest.fixture
+def cache(path):
+    cache = layoutcache.LayoutCache(path, maxsize=2)
+    cache.enable()
+    yield cache
+    cache.disable()
+
+
+def build(xlabel="x", suptitle=None):
+    fig, axes = lpl.subplots(2, 2)
+    for ax in axes.flat:
+        ax.plot([0, 1000], [0, 1])
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel("a long label")
+    if suptitle:
+        fig.suptitle(suptitle)
+    fig.draw_without_rendering()
+    return fig
+
+
+def layout(fig):
+    return [ax.get_position().bounds for ax in fig.axes]
+
+
+def test_layout_cache_disabled():
+    assert not lpl.layout_cache.enabled
+
+
+class TestTexts:
+    def test_visible(self):
+        fig, ax = lpl.subplots(1, 1)
+        ax.set_title("title")
+        ax.set_xlabel("label", visible=False)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_xticks([0, 1], ["a", "b"])
+        ax.yaxis.set_visible(False)
+
+        texts = [text.get_text() for text in layoutcache._texts(fig)]
+
+        assert sorted(texts) == ["a", "b", "title"]
+
+    def test_hidden_ticks(self):
+        fig, ax = lpl.subplots(1, 1)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 1)
+        ax.set_yticks([])
+        fig.draw_without_rendering()
+        ax.set_xlim(0, 1)
+
+        texts = [text.get_text() for text in layoutcache._texts(fig)]
+
+        assert sorted(texts) == ["0.0", "0.2", "0.4", "0.6", "0.8", "1.0"]
+
+
+class TestFingerprint:
+    def test_same(self):
+        assert layoutcache._fingerprint(build(), ConstrainedLayoutEngine()) == (
+            layoutcache._fingerprint(build(), ConstrainedLayoutEngine())
+        )
+
+    def test_same_length(self):
+        assert layoutcache._fingerprint(build("x"), ConstrainedLayoutEngine()) == (
+            layoutcache._fingerprint(build("y"), ConstrainedLayoutEngine())
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda fig: fig.axes[0].set_xlabel("longer"),
+            lambda fig: fig.axes[0].xaxis.label.set_fontsize(20),
+            lambda fig: fig.set_size_inches(3, 3),
+            lambda fig: fig.axes[1].set_visible(False),
+            lambda fig: fig.add_subplot(3, 3, 9),
+        ],
+    )
+    def test_figure_changes(self, change):
+        fig = build()
+        before = layoutcache._fingerprint(fig, ConstrainedLayoutEngine())
+
+        change(fig)
+
+        assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine()) != before
+
+    def test_environment_changes(self):
+        fig = build()
+        before = layoutcache._fingerprint(fig, ConstrainedLayoutEngine())
+
+        with lpl.size.context(300, 300):
+            assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine()) != before
+        with mpl.rc_context({"axes.labelpad": mpl.rcParams["axes.labelpad"] + 1}):
+            assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine()) != before
+        assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine(w_pad=1)) != (
+            before
+        )
+
+    def test_axes_without_gridspec(self):
+        fig = build()
+        fig.add_axes((0.1, 0.1, 0.2, 0.2))
+
+        assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine())
+
+    def test_colorbar(self):
+        fig = build()
+        fig.colorbar(fig.axes[0].imshow([[0, 1]]))
+
+        assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine()) is None
+
+    def test_subfigures(self):
+        fig = build()
+        fig.subfigures(1, 2)
+
+        assert layoutcache._fingerprint(fig, ConstrainedLayoutEngine()) is None
+
+
+class TestLayoutCache:
+    def test_enable_disable(self, path):
+        original = ConstrainedLayoutEngine.execute
+        cache = layoutcache.LayoutCache(path)
+        assert not cache.enabled
+
+        cache.enable()
+        cache.enable()
+        assert cache.enabled
+        assert ConstrainedLayoutEngine.execute is not original
+
+        cache.disable()
+        cache.disable()
+        assert not cache.enabled
+        assert ConstrainedLayoutEngine.execute is original
+
+    def test_reuse(self, cache, path, mocker):
+        expected = layout(build(suptitle="title"))
+        suptitle = plt.gcf()._suptitle.get_position()
+        assert cache.info().currsize
+        assert path.exists()
+
+        other = layoutcache.LayoutCache(path)
+        cache.disable()
+        other.enable()
+        try:
+            solve = mocker.spy(layout_engine, "do_constrained_layout")
+            fig = build(suptitle="title")
+        finally:
+            other.disable()
+
+        solve.assert_not_called()
+        assert layout(fig) == expected
+        assert fig._suptitle.get_position() == suptitle
+        assert other.info().hits == 1
+
+    def test_same_as_solved(self, cache):
+        cached = build()
+
+        cache.disable()
+        solved = build()
+
+        assert layout(cached) == layout(solved)
+
+    def test_other_figures(self, cache):
+        fig, ax = plt.subplots(layout="constrained")
+        ax.set_xlabel("x")
+        fig.draw_without_rendering()
+
+        assert cache.info() == (0, 0, 2, 0)
+
+    def test_colorbar(self, cache):
+        fig, ax = lpl.subplots(1, 1)
+        fig.colorbar(ax.imshow([[0, 1]]))
+        fig.draw_without_rendering()
+
+        assert cache.info() == (0, 0, 2, 0)
+
+    def test_maxsize(self, cache, path):
+        for label in ["a", "ab", "abc"]:
+            build(label)
+
+        assert cache.info().currsize == 2  # noqa: PLR2004
+        assert len(json.loads(path.read_text())) == 2  # noqa: PLR2004
+
+    def test_corrupt_file(self, path):
+        path.parent.mkdir()
+        path.write_text("{")
+
+        assert layoutcache.LayoutCache(path).info().currsize == 0
+
+    def test_unwritable(self, tmp_path):
+        path = tmp_path / "file"
+        path.touch()
+        cache = layoutcache.LayoutCache(path / "layouts.json")
+
+        cache.put("key", {"axes": [], "texts": []})
+
+        assert cache.get("key") == {"axes": [], "texts": []}
+
+    def test_clear(self, cache, path):
+        build()
+
+        cache.clear()
+
+        assert cache.info() == (0, 0, 2, 0)
+        assert not path.exists()
@@ -24,3 +24,27 @@ def test_lpl_doesnt_overwrite_existing_in_plt(function):
 def test_non_existent_raises():
     with pytest.raises(AttributeError, match=r"matplotlib.pyplot"):
         lpl.doesnt_exist  # noqa: B018
+
+
+def test_pyplot_facade():
+    from latexplotlib import _pyplot  # noqa: PLC0415
+
+    missing = [name for name in _pyplot.__all__ if not hasattr(plt, name)]
+    assert not missing, (
+        "run 'python scripts/generate_pyplot.py' to update latexplotlib/_pyplot.py"
+    )
+    assert not set(_pyplot.__all__) & set(lpl.__all__)
+
+
+def test_pyplot_facade_matches_runtime():
+    from latexplotlib import _pyplot  # noqa: PLC0415
+
+    for name in _pyplot.__all__:
+        assert getattr(lpl, name) is getattr(_pyplot, name)
+
+
+def test_pyplot_attributes_are_bound():
+    lpl.__dict__.pop("close", None)
+
+    assert lpl.close is plt.close
+    assert lpl.__dict__["close"] is plt.close
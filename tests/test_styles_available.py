@@ -1,11 +1,46 @@
 from pathlib import Path
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import pytest
 
-import latexplotlib  # noqa: F401
+import latexplotlib as lpl
 
 
 @pytest.mark.parametrize("style", Path("src/latexplotlib/styles/").iterdir())
 def test_styles_are_usable(style):
     plt.style.use(style.stem)
+
+
+class TestDraft:
+    @pytest.fixture(autouse=True)
+    def _style(self):
+        with plt.style.context("latex10pt"):
+            yield
+
+    def test_applies_draft(self):
+        with lpl.draft():
+            assert not mpl.rcParams["text.usetex"]
+            assert not mpl.rcParams["figure.constrained_layout.use"]
+            assert not mpl.rcParams["lines.antialiased"]
+
+        assert mpl.rcParams["text.usetex"]
+
+    def test_keeps_style(self):
+        with lpl.draft():
+            assert mpl.rcParams["font.size"] == 8  # noqa: PLR2004
+
+    @pytest.mark.parametrize(
+        "param", ["figure.figsize", "savefig.bbox", "savefig.pad_inches"]
+    )
+    def test_does_not_change_size(self, param):
+        assert param not in plt.style.library[lpl._styles.DRAFT_STYLE]
+
+    @pytest.mark.parametrize("nrows", [1, 2])
+    def test_same_figsize(self, nrows):
+        with lpl.size.context(400, 300):
+            fig, _ = lpl.subplots(nrows, 2)
+            with lpl.draft():
+                draft_fig, _ = lpl.subplots(nrows, 2)
+
+        assert tuple(fig.get_size_inches()) == tuple(draft_fig.get_size_inches())